@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-from flask import current_app
-
 from core.admin_dashboard_utils import (
     scalar_value,
     security_action_filter_sql,
     serialize_rows,
 )
-from core.db import db_fetchall
+from core.db import db_fetchall, db_kind
 from core.rate_limit import get_banned_ips_snapshot, get_rate_limit_snapshot
 from core.security_alerts import maybe_send_security_alerts
 from core.security_banner import build_security_banner
@@ -28,7 +26,7 @@ from core.security_settings import load_security_settings
 def build_admin_dashboard_payload(
     *, send_alerts: bool = False, include_static: bool = True
 ) -> dict:
-    is_pg = bool(current_app.config.get("DATABASE_URL"))
+    is_pg = db_kind() == "pg"
     settings = load_security_settings()
 
     total_users = 0
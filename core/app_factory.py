@@ -12,6 +12,7 @@ from flask import Blueprint, Flask, flash, redirect, request, session, url_for
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 from core.app_hooks import register_app_hooks
+from core.audit_writer import flush_request_audit_rows, start_audit_writer
 from core.db import close_db
 from core.helpers import (
     fmt_date,
@@ -112,6 +113,7 @@ def _configure_app(app: Flask, test_config: dict[str, Any] | None = None) -> Non
         UTCNOW_ISO_FUNC=utcnow_iso,
         INITIALIZE_DATABASE_ON_STARTUP=True,
         START_PASS_RETENTION_SCHEDULER=not _env_truthy("PYTEST_CURRENT_TEST"),
+        START_AUDIT_WRITER=not _env_truthy("PYTEST_CURRENT_TEST"),
     )
 
     if test_config:
@@ -245,6 +247,7 @@ def _close_db_teardown(exc: BaseException | None = None) -> None:
 
 def _register_core_services(app: Flask) -> None:
     _register_template_helpers(app)
+    app.teardown_request(flush_request_audit_rows)
     app.teardown_appcontext(_close_db_teardown)
     _register_security(app)
     _register_csrf(app)
@@ -259,6 +262,9 @@ def _initialize_runtime_services(app: Flask) -> None:
     if app.config.get("START_PASS_RETENTION_SCHEDULER", True):
         start_pass_retention_scheduler(app)
 
+    if app.config.get("START_AUDIT_WRITER", True):
+        start_audit_writer(app)
+
 
 def create_app(test_config: dict[str, Any] | None = None) -> Flask:
     app = Flask(
@@ -10,6 +10,7 @@ from flask import Flask, current_app, g, redirect, render_template, request
 from werkzeug.exceptions import HTTPException
 from werkzeug.wrappers import Response
 
+from core.db import db_kind
 from core.permissions import enforce_route_permission
 
 _STATIC_CACHE_CONTROL: Final[str] = "public, max-age=86400"
@@ -195,6 +196,9 @@ def register_app_hooks(app: Flask) -> None:
     def start_request_context() -> None:
         g.request_id = _request_id()
         g.request_started_at = time.perf_counter()
+        # Dialect branches read g.db_kind even when no query has opened a connection yet.
+        if current_app.config.get("DATABASE_URL"):
+            g.db_kind = db_kind()
         _log_request_start(app)
         return None
 
@@ -3,8 +3,14 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
-from flask import current_app
-
+from flask import current_app, g, has_request_context
+
+from core.audit_writer import (
+    AUDIT_INSERT_SQL,
+    audit_writer_running,
+    defer_request_audit_row,
+    enqueue_audit_row,
+)
 from core.db import db_execute
 from core.helpers import utcnow_iso
 
@@ -53,23 +59,28 @@ def log_action(
     normalized_shelter = (shelter or "").strip() or None
     normalized_details = _normalize_details(details)
 
-    sql = (
-        "INSERT INTO audit_log (entity_type, entity_id, shelter, staff_user_id, action_type, action_details, created_at) "
-        "VALUES (%s, %s, %s, %s, %s, %s, %s)"
-        if current_app.config.get("DATABASE_URL")
-        else "INSERT INTO audit_log (entity_type, entity_id, shelter, staff_user_id, action_type, action_details, created_at) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?)"
+    row = (
+        normalized_entity_type,
+        entity_id,
+        normalized_shelter,
+        staff_user_id,
+        normalized_action_type,
+        normalized_details,
+        utcnow_iso(),
     )
 
-    db_execute(
-        sql,
-        (
-            normalized_entity_type,
-            entity_id,
-            normalized_shelter,
-            staff_user_id,
-            normalized_action_type,
-            normalized_details,
-            utcnow_iso(),
-        ),
-    )
+    # Inside a transaction the audit row must commit or roll back with the change.
+    if g.get("db_in_transaction"):
+        db_execute(AUDIT_INSERT_SQL, row)
+        return
+
+    if audit_writer_running(current_app):
+        enqueue_audit_row(row)
+        return
+
+    # Without the writer thread, batch this request's rows into one write at teardown.
+    if has_request_context():
+        defer_request_audit_row(row)
+        return
+
+    db_execute(AUDIT_INSERT_SQL, row)
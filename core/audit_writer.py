@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Any
+
+from flask import current_app, g
+
+from core.db import db_executemany, db_transaction
+
+AUDIT_INSERT_SQL = (
+    "INSERT INTO audit_log (entity_type, entity_id, shelter, staff_user_id, action_type, action_details, created_at) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s)"
+)
+
+AUDIT_BATCH_SIZE = 100
+AUDIT_POLL_SECONDS = 0.5
+# Once a row arrives, keep collecting briefly so bursts share one insert batch.
+AUDIT_BATCH_LINGER_SECONDS = 0.2
+AUDIT_SHUTDOWN_JOIN_SECONDS = 5.0
+TRUTHY_ENV_VALUES = {"1", "true", "yes", "on"}
+
+type AuditRow = tuple[Any, ...]
+
+_AUDIT_QUEUE: queue.Queue[AuditRow] = queue.Queue()
+
+
+def _writer_disabled_by_env() -> bool:
+    return (os.environ.get("DISABLE_AUDIT_WRITER") or "").strip().lower() in TRUTHY_ENV_VALUES
+
+
+def audit_writer_running(app) -> bool:
+    # A writer thread started before a fork does not exist in the child process.
+    return app.extensions.get("audit_writer_pid") == os.getpid()
+
+
+def enqueue_audit_row(row: AuditRow) -> None:
+    _AUDIT_QUEUE.put(row)
+
+
+def defer_request_audit_row(row: AuditRow) -> None:
+    g.setdefault("pending_audit_rows", []).append(row)
+
+
+def flush_request_audit_rows(exc: BaseException | None = None) -> None:
+    rows = g.pop("pending_audit_rows", None)
+    if not rows:
+        return
+
+    try:
+        write_audit_rows(rows)
+    except Exception:
+        current_app.logger.exception("failed to write %s deferred audit rows", len(rows))
+
+
+def write_audit_rows(rows: list[AuditRow]) -> None:
+    if not rows:
+        return
+
+    with db_transaction():
+        db_executemany(AUDIT_INSERT_SQL, rows)
+
+
+def _take_batch(*, timeout: float | None, linger: float = 0.0) -> list[AuditRow]:
+    try:
+        first = _AUDIT_QUEUE.get_nowait() if timeout is None else _AUDIT_QUEUE.get(timeout=timeout)
+    except queue.Empty:
+        return []
+
+    batch = [first]
+    deadline = time.monotonic() + linger
+    while len(batch) < AUDIT_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        try:
+            if remaining > 0:
+                batch.append(_AUDIT_QUEUE.get(timeout=remaining))
+            else:
+                batch.append(_AUDIT_QUEUE.get_nowait())
+        except queue.Empty:
+            break
+
+    return batch
+
+
+def _write_batch(app, batch: list[AuditRow]) -> None:
+    try:
+        with app.app_context():
+            write_audit_rows(batch)
+    except Exception:
+        app.logger.exception("audit writer failed to write %s audit rows", len(batch))
+
+
+def flush_audit_queue(app) -> int:
+    written = 0
+
+    while True:
+        batch = _take_batch(timeout=None)
+        if not batch:
+            return written
+
+        _write_batch(app, batch)
+        written += len(batch)
+
+
+def _writer_loop(app, stop_event: threading.Event) -> None:
+    while not stop_event.is_set():
+        batch = _take_batch(timeout=AUDIT_POLL_SECONDS, linger=AUDIT_BATCH_LINGER_SECONDS)
+        if batch:
+            _write_batch(app, batch)
+
+
+def _stop_audit_writer(app, thread: threading.Thread, stop_event: threading.Event) -> None:
+    # Let an in-flight batch finish before the daemon thread is torn down,
+    # then write whatever is still queued from this thread.
+    stop_event.set()
+    thread.join(timeout=AUDIT_SHUTDOWN_JOIN_SECONDS)
+    flush_audit_queue(app)
+
+
+def start_audit_writer(app) -> None:
+    if app.config.get("TESTING"):
+        app.extensions["audit_writer_status"] = "testing_skipped"
+        return
+
+    if _writer_disabled_by_env():
+        app.extensions["audit_writer_status"] = "disabled"
+        app.logger.info("audit writer disabled by DISABLE_AUDIT_WRITER")
+        return
+
+    if audit_writer_running(app):
+        return
+
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=_writer_loop,
+        args=(app, stop_event),
+        daemon=True,
+        name="audit-writer",
+    )
+    thread.start()
+    atexit.register(_stop_audit_writer, app, thread, stop_event)
+
+    app.extensions["audit_writer_pid"] = os.getpid()
+    app.extensions["audit_writer_status"] = "running"
+    app.logger.info("audit writer started")
@@ -5,6 +5,7 @@ from functools import wraps
 from flask import current_app, flash, redirect, session, url_for
 
 from core.db import db_fetchone
+from core.ttl_cache import TTLCache
 
 REQUEST_MANAGER_ROLES = {
     "admin",
@@ -20,6 +21,10 @@ PASS_STATUS_ROLES = {
     "staff",
 }
 
+# Every authenticated request checks this flag; the admin toggle clears it at once
+# and other workers pick a change up within the TTL.
+_ADMIN_ONLY_MODE_CACHE = TTLCache(ttl_seconds=5.0, maxsize=8)
+
 
 def _current_role() -> str:
     return (session.get("role") or "").strip()
@@ -43,29 +48,36 @@ def _clear_invalid_session_and_redirect():
     return _redirect_login()
 
 
+def clear_admin_only_mode_cache() -> None:
+    _ADMIN_ONLY_MODE_CACHE.clear()
+
+
+def _load_admin_only_mode() -> bool:
+    row = db_fetchone("SELECT admin_login_only_mode FROM security_settings ORDER BY id ASC LIMIT 1")
+    if not row:
+        return False
+
+    return bool(row.get("admin_login_only_mode"))
+
+
 def _admin_only_mode_enabled() -> bool:
     try:
-        row = db_fetchone(
-            "SELECT admin_login_only_mode FROM security_settings ORDER BY id ASC LIMIT 1"
+        return _ADMIN_ONLY_MODE_CACHE.get_or_load(
+            current_app.config.get("DATABASE_URL"),
+            _load_admin_only_mode,
         )
     except Exception:
         current_app.logger.exception("Failed to read admin_login_only_mode from security_settings.")
         return False
 
-    if not row:
-        return False
-
-    if isinstance(row, dict):
-        return bool(row.get("admin_login_only_mode"))
-
-    return bool(row[0])
-
 
 def _enforce_admin_only_mode():
-    if not _admin_only_mode_enabled():
+    # Admins are never restricted, so skip the settings lookup (and the
+    # database connection it would open) for their requests.
+    if _current_role() == "admin":
         return None
 
-    if _current_role() == "admin":
+    if not _admin_only_mode_enabled():
         return None
 
     session.clear()
@@ -1,23 +1,30 @@
 from __future__ import annotations
 
+import os
 import re
 import sqlite3
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager, suppress
 from datetime import UTC, datetime
-from threading import Lock
+from functools import lru_cache
+from itertools import count
+from threading import Lock, local
 from typing import Any
 from urllib.parse import parse_qs, unquote, urlparse
 
 from flask import current_app, g, has_app_context
 
 try:
-    from psycopg2.extras import RealDictCursor
-    from psycopg2.pool import PoolError, SimpleConnectionPool
+    from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+    from psycopg2.extras import RealDictCursor, execute_batch, execute_values
+    from psycopg2.pool import PoolError, ThreadedConnectionPool
 except Exception:
+    TRANSACTION_STATUS_IDLE = 0
     RealDictCursor = None
+    execute_batch = None
+    execute_values = None
     PoolError = Exception
-    SimpleConnectionPool = None
+    ThreadedConnectionPool = None
 
 
 type DbRow = dict[str, Any]
@@ -26,11 +33,37 @@ type DbCursor = Any
 
 PG_POOL: Any = None
 _PG_POOL_LOCK = Lock()
+_PG_POOL_MINCONN = 1
+_PG_POOL_MAXCONN = 20
 
 _LEGACY_TRANSPORT_INSERT_SQL = (
     "insert into transport_requests (resident_identifier, shelter, status) values (?, ?, ?)"
 )
 
+_SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+_SQLITE_WAL_PATHS: set[str] = set()
+# The app issues a few hundred distinct statements; the stdlib default of 128
+# evicts hot compiled statements between requests.
+_SQLITE_CACHED_STATEMENTS = 512
+# One idle file-backed SQLite connection per thread, reused by the next request.
+_SQLITE_IDLE = local()
+
+DB_ITER_CHUNK_SIZE = 200
+DB_EXECUTEMANY_PAGE_SIZE = 500
+_ITER_CURSOR_IDS = count(1)
+
+# INSERT ... VALUES (<one flat row>) [tail]; rows with nested parentheses are not split.
+_INSERT_VALUES_RE = re.compile(
+    r"^(?P<head>\s*INSERT\s.+?\bVALUES\s*)(?P<row>\([^()]*\))(?P<tail>.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+
 _TIMESTAMPISH_RE = re.compile(
     r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?$"
 )
@@ -51,15 +84,24 @@ def _is_sqlite_url(database_url: str) -> bool:
     return database_url.lower().startswith("sqlite:")
 
 
+@lru_cache(maxsize=8)
+def _db_kind_for_url(database_url: str) -> str:
+    return "sqlite" if _is_sqlite_url(database_url) else "pg"
+
+
 def _db_kind() -> str:
     kind = g.get("db_kind")
     if kind:
         return str(kind)
 
-    database_url = _database_url()
-    return "sqlite" if _is_sqlite_url(database_url) else "pg"
+    return _db_kind_for_url(_database_url())
+
+
+def db_kind() -> str:
+    return _db_kind()
 
 
+@lru_cache(maxsize=1024)
 def _normalize_sql(sql: str, *, db_kind: str) -> str:
     if db_kind == "sqlite":
         return (
@@ -95,17 +137,85 @@ def _sqlite_connect(database_url: str) -> sqlite3.Connection:
     sqlite_path = _sqlite_path_from_url(database_url)
 
     if sqlite_path == ":memory:":
-        conn = sqlite3.connect(":memory:")
+        conn = sqlite3.connect(":memory:", cached_statements=_SQLITE_CACHED_STATEMENTS)
     elif database_url.startswith("sqlite:///file:"):
-        conn = sqlite3.connect(database_url.removeprefix("sqlite:///"), uri=True)
+        conn = sqlite3.connect(
+            database_url.removeprefix("sqlite:///"),
+            uri=True,
+            cached_statements=_SQLITE_CACHED_STATEMENTS,
+        )
     else:
-        conn = sqlite3.connect(sqlite_path)
+        conn = sqlite3.connect(sqlite_path, cached_statements=_SQLITE_CACHED_STATEMENTS)
 
     conn.row_factory = sqlite3.Row
     conn.isolation_level = None
+    _configure_sqlite_connection(conn, sqlite_path)
     return conn
 
 
+def _sqlite_connection_is_reusable(database_url: str) -> bool:
+    sqlite_path = _sqlite_path_from_url(database_url)
+    return sqlite_path != ":memory:" and "mode=memory" not in database_url
+
+
+def _checkout_sqlite_connection(database_url: str) -> sqlite3.Connection:
+    idle = getattr(_SQLITE_IDLE, "entry", None)
+    _SQLITE_IDLE.entry = None
+
+    if idle is not None:
+        idle_pid, idle_url, idle_conn = idle
+        # A connection inherited across fork must not be used by the child.
+        if idle_pid == os.getpid():
+            if idle_url == database_url:
+                return idle_conn
+            with suppress(Exception):
+                idle_conn.close()
+
+    return _sqlite_connect(database_url)
+
+
+def _release_sqlite_connection(conn: sqlite3.Connection, database_url: str) -> None:
+    with suppress(Exception):
+        if conn.in_transaction:
+            conn.rollback()
+
+    if getattr(_SQLITE_IDLE, "entry", None) is None and _sqlite_connection_is_reusable(
+        database_url
+    ):
+        _SQLITE_IDLE.entry = (os.getpid(), database_url, conn)
+        return
+
+    with suppress(Exception):
+        conn.close()
+
+
+def _configure_sqlite_connection(conn: sqlite3.Connection, sqlite_path: str) -> None:
+    # journal_mode is stored in the database file, so it only needs setting once.
+    if sqlite_path not in _SQLITE_WAL_PATHS:
+        with suppress(sqlite3.DatabaseError):
+            conn.execute("PRAGMA journal_mode=WAL")
+        _SQLITE_WAL_PATHS.add(sqlite_path)
+
+    for pragma in _SQLITE_CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def _env_pool_size(name: str, default: int) -> int:
+    raw_value = (os.environ.get(name) or "").strip()
+    if not raw_value:
+        return default
+    try:
+        return max(1, int(raw_value))
+    except ValueError:
+        return default
+
+
+def _pg_pool_bounds() -> tuple[int, int]:
+    maxconn = _env_pool_size("DB_POOL_SIZE", _PG_POOL_MAXCONN)
+    minconn = min(_env_pool_size("DB_POOL_MIN_SIZE", _PG_POOL_MINCONN), maxconn)
+    return minconn, maxconn
+
+
 def _init_pg_pool() -> None:
     global PG_POOL
 
@@ -115,12 +225,13 @@ def _init_pg_pool() -> None:
 
         database_url = _database_url()
 
-        if SimpleConnectionPool is None:
+        if ThreadedConnectionPool is None:
             raise RuntimeError("psycopg2 is not installed, but a Postgres DATABASE_URL is set.")
 
-        PG_POOL = SimpleConnectionPool(
-            minconn=1,
-            maxconn=10,
+        minconn, maxconn = _pg_pool_bounds()
+        PG_POOL = ThreadedConnectionPool(
+            minconn=minconn,
+            maxconn=maxconn,
             dsn=database_url,
         )
 
@@ -146,7 +257,7 @@ def _get_or_create_request_connection() -> DbConnection:
     database_url = _database_url()
 
     if _is_sqlite_url(database_url):
-        conn = _sqlite_connect(database_url)
+        conn = _checkout_sqlite_connection(database_url)
         return _set_request_connection(conn, kind="sqlite")
 
     pool = _get_pg_pool()
@@ -159,6 +270,15 @@ def get_db() -> DbConnection:
     return _get_or_create_request_connection()
 
 
+def _reset_pg_connection(conn: DbConnection) -> None:
+    with suppress(Exception):
+        if conn.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            conn.rollback()
+
+    with suppress(Exception):
+        conn.autocommit = True
+
+
 def close_db(e: Exception | None = None) -> None:
     del e
 
@@ -170,12 +290,10 @@ def close_db(e: Exception | None = None) -> None:
         return
 
     if kind == "sqlite":
-        with suppress(Exception):
-            conn.close()
+        _release_sqlite_connection(conn, _database_url())
         return
 
-    with suppress(Exception):
-        conn.autocommit = True
+    _reset_pg_connection(conn)
 
     global PG_POOL
     if PG_POOL is not None:
@@ -194,6 +312,9 @@ def _db_cursor(*, dict_rows: bool = False) -> Iterator[DbCursor]:
 
     if kind == "sqlite":
         cur = conn.cursor()
+        if dict_rows:
+            # Plain tuples zipped with the column names are cheaper than sqlite3.Row -> dict.
+            cur.row_factory = None
         try:
             yield cur
         finally:
@@ -228,6 +349,17 @@ def _row_to_dict(row: Any) -> DbRow:
         raise RuntimeError("Database row could not be converted to dict.") from err
 
 
+def _rows_to_dicts(cur: DbCursor, rows: list[Any]) -> list[DbRow]:
+    if not rows:
+        return []
+
+    if not isinstance(rows[0], tuple):
+        return [_row_to_dict(row) for row in rows]
+
+    columns = [column[0] for column in cur.description or ()]
+    return [dict(zip(columns, row, strict=True)) for row in rows]
+
+
 def _sqlite_should_skip_statement(normalized_sql: str) -> bool:
     compact_sql = " ".join(normalized_sql.lower().split())
     return "pg_get_serial_sequence(" in compact_sql
@@ -310,22 +442,32 @@ def _normalize_db_params(params: tuple[Any, ...]) -> tuple[Any, ...]:
     return tuple(_normalize_timestamp_param(value) for value in params)
 
 
+@lru_cache(maxsize=1024)
+def _prepared_statement(sql: str, db_kind: str) -> tuple[str | None, bool]:
+    normalized_sql = _normalize_sql(sql, db_kind=db_kind)
+
+    if db_kind != "sqlite":
+        return normalized_sql, False
+
+    if _sqlite_should_skip_statement(normalized_sql):
+        return None, False
+
+    compact_sql = " ".join(normalized_sql.lower().split())
+    return normalized_sql, compact_sql == _LEGACY_TRANSPORT_INSERT_SQL
+
+
 def _prepare_sql_and_params(
     sql: str,
     params: tuple[Any, ...],
 ) -> tuple[str | None, tuple[Any, ...]]:
-    kind = _db_kind()
-    normalized_sql = _normalize_sql(sql, db_kind=kind)
+    prepared_sql, is_legacy_transport_insert = _prepared_statement(sql, _db_kind())
     normalized_params = _normalize_db_params(params)
 
-    if kind != "sqlite":
-        return normalized_sql, normalized_params
-
-    if _sqlite_should_skip_statement(normalized_sql):
-        return None, normalized_params
+    if prepared_sql is None or not is_legacy_transport_insert:
+        return prepared_sql, normalized_params
 
     rewritten_sql, rewritten_params = _rewrite_legacy_sqlite_transport_insert(
-        normalized_sql,
+        prepared_sql,
         normalized_params,
     )
     return rewritten_sql, _normalize_db_params(rewritten_params)
@@ -341,6 +483,52 @@ def db_execute(sql: str, params: tuple[Any, ...] = ()) -> None:
         cur.execute(prepared_sql, prepared_params)
 
 
+@lru_cache(maxsize=256)
+def _insert_values_template(sql: str) -> tuple[str, str] | None:
+    match = _INSERT_VALUES_RE.match(sql)
+    if match is None or "RETURNING" in match.group("tail").upper():
+        return None
+    return match.group("head") + "%s" + match.group("tail"), match.group("row")
+
+
+def db_executemany(sql: str, rows: Sequence[tuple[Any, ...]]) -> None:
+    if not rows:
+        return
+
+    kind = _db_kind()
+    prepared_sql, is_legacy_transport_insert = _prepared_statement(sql, kind)
+    if prepared_sql is None:
+        _log_skipped_sql_execution(sql, tuple(rows[0]))
+        return
+
+    if is_legacy_transport_insert:
+        for params in rows:
+            db_execute(sql, params)
+        return
+
+    param_rows = [_normalize_db_params(tuple(params)) for params in rows]
+
+    with _db_cursor(dict_rows=False) as cur:
+        if kind == "pg":
+            # One multi-row INSERT beats execute_batch's statement-per-row script.
+            values_sql = _insert_values_template(prepared_sql)
+            if values_sql is not None and execute_values is not None:
+                execute_values(
+                    cur,
+                    values_sql[0],
+                    param_rows,
+                    template=values_sql[1],
+                    page_size=DB_EXECUTEMANY_PAGE_SIZE,
+                )
+                return
+
+            if execute_batch is not None:
+                execute_batch(cur, prepared_sql, param_rows, page_size=len(param_rows))
+                return
+
+        cur.executemany(prepared_sql, param_rows)
+
+
 def db_fetchone(sql: str, params: tuple[Any, ...] = ()) -> DbRow | None:
     normalized_sql = _normalize_sql(sql, db_kind=_db_kind())
     normalized_params = _normalize_db_params(params)
@@ -349,10 +537,10 @@ def db_fetchone(sql: str, params: tuple[Any, ...] = ()) -> DbRow | None:
         cur.execute(normalized_sql, normalized_params)
         row = cur.fetchone()
 
-    if row is None:
-        return None
+        if row is None:
+            return None
 
-    return _row_to_dict(row)
+        return _rows_to_dicts(cur, [row])[0]
 
 
 def db_fetchall(sql: str, params: tuple[Any, ...] = ()) -> list[DbRow]:
@@ -361,9 +549,69 @@ def db_fetchall(sql: str, params: tuple[Any, ...] = ()) -> list[DbRow]:
 
     with _db_cursor(dict_rows=True) as cur:
         cur.execute(normalized_sql, normalized_params)
-        rows = cur.fetchall()
+        return _rows_to_dicts(cur, cur.fetchall())
+
+
+def db_iterrows(
+    sql: str,
+    params: tuple[Any, ...] = (),
+    *,
+    chunk_size: int = DB_ITER_CHUNK_SIZE,
+) -> Iterator[DbRow]:
+    # Postgres streams through a named (server-side) cursor so only chunk_size
+    # rows are held client-side; SQLite already steps rows lazily.
+    kind = _db_kind()
+    normalized_sql = _normalize_sql(sql, db_kind=kind)
+    normalized_params = _normalize_db_params(params)
+
+    if kind == "sqlite":
+        with _db_cursor(dict_rows=True) as cur:
+            cur.execute(normalized_sql, normalized_params)
+            while rows := cur.fetchmany(chunk_size):
+                yield from _rows_to_dicts(cur, rows)
+        return
+
+    if RealDictCursor is None:
+        raise RuntimeError("psycopg2.extras.RealDictCursor is unavailable.")
+
+    conn = get_db()
+    # Outside db_transaction() the connection is in autocommit, where a named
+    # cursor only survives when declared WITH HOLD.
+    cur = conn.cursor(
+        name=f"db_iterrows_{id(conn):x}_{next(_ITER_CURSOR_IDS)}",
+        cursor_factory=RealDictCursor,
+        withhold=bool(conn.autocommit),
+    )
+    cur.itersize = chunk_size
+    try:
+        cur.execute(normalized_sql, normalized_params)
+        for row in cur:
+            yield dict(row)
+    finally:
+        cur.close()
+
+
+def db_executescript(statements: Sequence[str]) -> None:
+    cleaned = [str(stmt).strip().rstrip(";").strip() for stmt in statements]
+    cleaned = [stmt for stmt in cleaned if stmt]
+    if not cleaned:
+        return
+
+    kind = _db_kind()
+    script = _normalize_sql(";\n".join(cleaned) + ";", db_kind=kind)
 
-    return [_row_to_dict(row) for row in rows]
+    if kind == "sqlite":
+        if g.get("db_in_transaction"):
+            # executescript() commits first, so stay statement by statement here.
+            for stmt in cleaned:
+                db_execute(stmt)
+            return
+
+        get_db().executescript(script)
+        return
+
+    with _db_cursor(dict_rows=False) as cur:
+        cur.execute(script)
 
 
 @contextmanager
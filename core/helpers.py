@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+from datetime import datetime
+from functools import lru_cache
 
 from core.time_utils import to_chicago, utcnow_iso  # noqa: F401
 
@@ -18,39 +20,43 @@ def _to_chi(dt):
 # ============================================================================
 
 
-def fmt_dt(value) -> str:
+@lru_cache(maxsize=4096)
+def _fmt_chi_cached(value: str | datetime, fmt: str) -> str:
     dt = _to_chi(value)
     if not dt:
         return "—"
-    return dt.strftime("%m/%d/%Y %I:%M %p")
+    return dt.strftime(fmt)
 
 
-def fmt_date(value) -> str:
+def _fmt_chi(value, fmt: str) -> str:
+    # List pages format the same stored timestamps over and over.
+    if isinstance(value, str | datetime):
+        return _fmt_chi_cached(value, fmt)
+
     dt = _to_chi(value)
     if not dt:
         return "—"
-    return dt.strftime("%m/%d/%Y")
+    return dt.strftime(fmt)
+
+
+def fmt_dt(value) -> str:
+    return _fmt_chi(value, "%m/%d/%Y %I:%M %p")
+
+
+def fmt_date(value) -> str:
+    return _fmt_chi(value, "%m/%d/%Y")
 
 
 def fmt_time_only(value) -> str:
-    dt = _to_chi(value)
-    if not dt:
-        return "—"
-    return dt.strftime("%I:%M %p")
+    return _fmt_chi(value, "%I:%M %p")
 
 
 def fmt_pretty_dt(value) -> str:
-    dt = _to_chi(value)
-    if not dt:
-        return "—"
-    return dt.strftime("%b %d, %Y at %I:%M %p")
+    return _fmt_chi(value, "%b %d, %Y at %I:%M %p")
 
 
 def fmt_pretty_date(value) -> str:
-    dt = _to_chi(value)
-    if not dt:
-        return "—"
-    return dt.strftime("%b %d, %Y")
+    return _fmt_chi(value, "%b %d, %Y")
 
 
 # ============================================================================
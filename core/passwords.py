@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+from werkzeug.security import generate_password_hash
+
+# scrypt at Werkzeug's default cost (N=2**15), pinned so the stored method does
+# not drift with Werkzeug upgrades. Existing hashes keep verifying because
+# check_password_hash reads the method from the stored hash.
+PASSWORD_HASH_METHOD = (os.environ.get("PASSWORD_HASH_METHOD") or "").strip() or "scrypt:32768:8:1"
+
+
+def hash_password(password: str) -> str:
+    return generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+
+
+@lru_cache(maxsize=1)
+def _current_hash_method() -> str:
+    # Werkzeug expands short methods ("scrypt") to full parameters in the stored hash.
+    return hash_password("").split("$", 1)[0]
+
+
+def _scrypt_cost(method: str) -> int | None:
+    # "scrypt:N:r:p"; work and memory scale with N * r * p.
+    name, _, params = method.partition(":")
+    if name != "scrypt":
+        return None
+
+    try:
+        n, r, p = (int(part) for part in params.split(":"))
+    except ValueError:
+        return None
+    return n * r * p
+
+
+def password_needs_rehash(password_hash: str | None) -> bool:
+    # Werkzeug stores "method$salt$hash". Only upgrade legacy pbkdf2 hashes and
+    # cheaper scrypt ones; a stronger stored hash is never rewritten downwards.
+    method = str(password_hash or "").split("$", 1)[0]
+    if not method:
+        return False
+
+    current_cost = _scrypt_cost(_current_hash_method())
+    if current_cost is None:
+        return False
+
+    if method.startswith("pbkdf2:"):
+        return True
+
+    stored_cost = _scrypt_cost(method)
+    return stored_cost is not None and stored_cost < current_cost
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import re
+
+_NON_DIGITS_RE = re.compile(r"[^0-9]+")
+_US_PHONE_DIGITS_RE = re.compile(r"1?([0-9]{10})")
+
 
 def phone_digits(value: object | None) -> str:
     """Return only numeric digits from a phone value."""
-    return "".join(ch for ch in str(value or "") if ch.isdigit())
+    return _NON_DIGITS_RE.sub("", str(value or ""))
 
 
 def normalize_phone_10(value: object | None) -> str | None:
@@ -14,15 +19,8 @@ def normalize_phone_10(value: object | None) -> str | None:
     Accepts punctuation, spaces, parentheses, and an optional leading 1.
     Returns None when the value cannot become exactly 10 digits.
     """
-    digits = phone_digits(value)
-
-    if len(digits) == 11 and digits.startswith("1"):
-        digits = digits[1:]
-
-    if len(digits) == 10:
-        return digits
-
-    return None
+    match = _US_PHONE_DIGITS_RE.fullmatch(phone_digits(value))
+    return match.group(1) if match else None
 
 
 def normalize_optional_phone_10(value: object | None) -> str | None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from flask import g
 
+from core.auth import clear_admin_only_mode_cache
 from core.db import db_execute, db_fetchall
 from core.helpers import utcnow_iso
 from core.time_utils import parse_utc_naive_datetime
@@ -132,6 +133,8 @@ def _reset_expired_temporary_settings(row: dict) -> dict:
             (_bool_for_db(value, kind), now),
         )
 
+    clear_admin_only_mode_cache()
+
     rows = db_fetchall("SELECT * FROM security_settings ORDER BY id ASC LIMIT 1")
     return rows[0] if rows else {}
 
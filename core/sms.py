@@ -3,23 +3,7 @@ from __future__ import annotations
 from flask import current_app
 
 from core.db import db_fetchall
-
-
-def _init_db() -> None:
-    """
-    Run the configured database initializer.
-
-    The app should store the callable in:
-        app.config["INIT_DB_FUNC"]
-
-    This avoids importing app directly and prevents circular import problems.
-    """
-    init_func = current_app.config.get("INIT_DB_FUNC")
-    if callable(init_func):
-        init_func()
-        return
-
-    raise RuntimeError("INIT_DB_FUNC is not configured")
+from core.phone_numbers import phone_digits
 
 
 def _normalize_us_phone_10(phone: str) -> str | None:
@@ -34,7 +18,7 @@ def _normalize_us_phone_10(phone: str) -> str | None:
     Returns None when the input cannot be normalized to a usable US number.
     """
     raw = (phone or "").strip()
-    digits = "".join(ch for ch in raw if ch.isdigit())
+    digits = phone_digits(raw)
 
     if len(digits) == 10:
         return digits
@@ -57,12 +41,6 @@ def sms_is_allowed_for_number(phone: str) -> bool:
 
     This function fails closed. If anything goes wrong, it returns False.
     """
-    try:
-        _init_db()
-    except Exception:
-        current_app.logger.exception("SMS consent check failed during database init.")
-        return False
-
     target = _normalize_us_phone_10(phone)
     if not target:
         current_app.logger.info("SMS consent check skipped because phone could not be normalized.")
@@ -82,9 +60,9 @@ def sms_is_allowed_for_number(phone: str) -> bool:
         return False
 
     for row in rows or []:
-        resident_phone = row["phone"] if isinstance(row, dict) else row[0]
-        resident_opt_in = row["sms_opt_in"] if isinstance(row, dict) else row[1]
-        resident_opt_out_at = row["sms_opt_out_at"] if isinstance(row, dict) else row[2]
+        resident_phone = row["phone"]
+        resident_opt_in = row["sms_opt_in"]
+        resident_opt_out_at = row["sms_opt_out_at"]
 
         if _normalize_us_phone_10(str(resident_phone or "")) != target:
             continue
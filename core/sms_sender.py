@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import json
 import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
 
 from flask import current_app, g, has_app_context
 
 from core.db import db_execute, db_fetchone
-from core.sms import sms_is_allowed_for_number
+from core.phone_numbers import normalize_phone_10
+from core.sms import _normalize_us_phone_10, sms_is_allowed_for_number
 
 try:
     from twilio.rest import Client
@@ -22,6 +27,12 @@ TWILIO_ACCOUNT_SID = os.environ.get("TWILIO_ACCOUNT_SID")
 TWILIO_AUTH_TOKEN = os.environ.get("TWILIO_AUTH_TOKEN")
 TWILIO_FROM_NUMBER = os.environ.get("TWILIO_FROM_NUMBER")
 
+SMS_BACKGROUND_WORKERS = 2
+
+_SMS_EXECUTOR: ThreadPoolExecutor | None = None
+_SMS_EXECUTOR_PID: int | None = None
+_SMS_EXECUTOR_LOCK = Lock()
+
 
 @dataclass(frozen=True)
 class SmsResult:
@@ -33,17 +44,52 @@ class SmsResult:
     twilio_sid: str | None = None
 
 
+@lru_cache(maxsize=1)
+def _twilio_client(account_sid: str | None, auth_token: str | None):
+    # The client keeps one HTTP session, so reusing it keeps the connection to
+    # Twilio warm between messages.
+    return Client(account_sid, auth_token)
+
+
+def _sms_executor() -> ThreadPoolExecutor:
+    global _SMS_EXECUTOR, _SMS_EXECUTOR_PID
+
+    with _SMS_EXECUTOR_LOCK:
+        # Worker threads started before a fork do not exist in the child process.
+        if _SMS_EXECUTOR is None or os.getpid() != _SMS_EXECUTOR_PID:
+            _SMS_EXECUTOR = ThreadPoolExecutor(
+                max_workers=SMS_BACKGROUND_WORKERS,
+                thread_name_prefix="sms-send",
+            )
+            _SMS_EXECUTOR_PID = os.getpid()
+        return _SMS_EXECUTOR
+
+
+def run_sms_in_background(job: Callable[[], object]) -> None:
+    """Run a fire-and-forget SMS job off the request thread, inside an app context."""
+    app = current_app._get_current_object()
+
+    if app.config.get("TESTING"):
+        job()
+        return
+
+    def _run() -> None:
+        with app.app_context():
+            try:
+                job()
+            except Exception:
+                app.logger.exception("background sms job failed")
+
+    _sms_executor().submit(_run)
+
+
 def _normalize_to_e164(to_number: str) -> str | None:
     raw = (to_number or "").strip()
-    digits = "".join(ch for ch in raw if ch.isdigit())
-
     if raw.startswith("+"):
         return raw
-    if len(digits) == 10:
-        return "+1" + digits
-    if len(digits) == 11 and digits.startswith("1"):
-        return "+" + digits
-    return None
+
+    digits_10 = normalize_phone_10(raw)
+    return "+1" + digits_10 if digits_10 else None
 
 
 def _safe_alert_key_part(value: str | None) -> str:
@@ -195,7 +241,7 @@ def _rate_limited(key: str, limit: int, window_seconds: int) -> bool:
         """,
         (key, window_seconds),
     )
-    count = int(row["c"] if isinstance(row, dict) else row[0])
+    count = int(row["c"])
     return count > limit
 
 
@@ -287,8 +333,6 @@ def send_sms_result(
     except Exception:
         global_per_minute = 30
 
-    from core.sms import _normalize_us_phone_10
-
     to10 = _normalize_us_phone_10(to_e164) or to_e164
 
     if _rate_limited("sms_out_global", global_per_minute, 60):
@@ -312,7 +356,7 @@ def send_sms_result(
         )
 
     try:
-        client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+        client = _twilio_client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
 
         kwargs = {"body": message, "from_": TWILIO_FROM_NUMBER, "to": to_e164}
         if TWILIO_STATUS_ENABLED and TWILIO_STATUS_CALLBACK_URL:
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from core.ttl_cache import TTLCache
+
+# The staff list changes rarely; every staff_users write clears it straight away.
+_USER_LIST_CACHE = TTLCache(ttl_seconds=30.0, maxsize=16)
+
+
+def get_or_load_user_list(key: Hashable, loader: Callable[[], Any]) -> Any:
+    return _USER_LIST_CACHE.get_or_load(key, loader)
+
+
+def clear_user_list_cache() -> None:
+    _USER_LIST_CACHE.clear()
@@ -40,7 +40,8 @@ def utc_naive_iso(value: datetime | str | None) -> str | None:
 
 
 def utcnow_iso() -> str:
-    return datetime.now(UTC).replace(tzinfo=None).isoformat(timespec="seconds")
+    # Slicing off "+00:00" skips building a second, naive datetime.
+    return datetime.now(UTC).isoformat(timespec="seconds")[:19]
 
 
 def to_chicago(value: datetime | str | None) -> datetime | None:
@@ -5,7 +5,7 @@ from typing import Final
 
 from flask import current_app, g, has_app_context
 
-from core.db import db_execute
+from core.db import db_execute, db_executescript, db_transaction
 from routes.rent_tracking_parts import schema as rent_tracking_schema
 
 from . import (
@@ -124,6 +124,10 @@ _REQUIRED_INDEXES: Final[tuple[str, ...]] = (
     ON audit_log (action_type, created_at)
     """,
     """
+    CREATE INDEX IF NOT EXISTS audit_log_created_idx
+    ON audit_log (created_at)
+    """,
+    """
     CREATE INDEX IF NOT EXISTS security_runtime_state_type_exp_idx
     ON security_runtime_state (state_type, expires_at_epoch)
     """,
@@ -185,37 +189,28 @@ def _safe_create_index(sql: str) -> None:
         current_app.logger.exception("Failed to create schema index.")
 
 
-def _ensure_staff_shelter_assignments_table(kind: str) -> None:
-    _execute(
+def _staff_and_security_table_statements(kind: str) -> tuple[str, ...]:
+    return (
         _sql(
             kind,
             _STAFF_SHELTER_ASSIGNMENTS_POSTGRES_SQL,
             _STAFF_SHELTER_ASSIGNMENTS_SQLITE_SQL,
-        )
-    )
-
-
-def _ensure_security_runtime_tables(kind: str) -> None:
-    _execute(
+        ),
         _sql(
             kind,
             _SECURITY_RUNTIME_STATE_POSTGRES_SQL,
             _SECURITY_RUNTIME_STATE_SQLITE_SQL,
-        )
-    )
-    _execute(
+        ),
         _sql(
             kind,
             _SECURITY_LOCK_HISTORY_POSTGRES_SQL,
             _SECURITY_LOCK_HISTORY_SQLITE_SQL,
-        )
-    )
-    _execute(
+        ),
         _sql(
             kind,
             _RATE_LIMIT_EVENTS_POSTGRES_SQL,
             _RATE_LIMIT_EVENTS_SQLITE_SQL,
-        )
+        ),
     )
 
 
@@ -223,8 +218,7 @@ def _ensure_foundation_tables(kind: str) -> None:
     schema_core.ensure_tables(kind)
     schema_shelters.ensure_tables(kind)
     schema_people.ensure_tables(kind)
-    _ensure_staff_shelter_assignments_table(kind)
-    _ensure_security_runtime_tables(kind)
+    db_executescript(_staff_and_security_table_statements(kind))
 
 
 def _ensure_program_anchor_tables(kind: str) -> None:
@@ -258,6 +252,12 @@ def _ensure_integrity_pre_index_tasks() -> None:
 
 
 def _ensure_shared_indexes() -> None:
+    try:
+        db_executescript(_REQUIRED_INDEXES)
+        return
+    except Exception:
+        current_app.logger.warning("Batched index creation failed; retrying one at a time.")
+
     for index_sql in _REQUIRED_INDEXES:
         _safe_create_index(index_sql)
 
@@ -328,5 +328,13 @@ def init_db() -> None:
     if state.initialized_key == current_key:
         return
 
-    _run_schema_initialization(kind)
+    if kind == "sqlite":
+        # Autocommit would fsync after every CREATE/ALTER; commit the whole run once.
+        # Postgres stays in autocommit so a recoverable index or upgrade failure
+        # does not abort every statement after it.
+        with db_transaction():
+            _run_schema_initialization(kind)
+    else:
+        _run_schema_initialization(kind)
+
     state.initialized_key = current_key
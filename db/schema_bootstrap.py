@@ -5,9 +5,9 @@ Seed and bootstrap schema tasks.
 from __future__ import annotations
 
 from flask import current_app
-from werkzeug.security import generate_password_hash
 
 from core.db import db_execute, db_fetchall, db_fetchone
+from core.passwords import hash_password
 
 from . import schema_program
 
@@ -70,7 +70,7 @@ def ensure_admin_bootstrap(kind: str) -> None:
         else "INSERT INTO staff_users (username, password_hash, role, is_active, created_at) VALUES (?,?,?,?,?)",
         (
             admin_user,
-            generate_password_hash(admin_pass),
+            hash_password(admin_pass),
             "admin",
             True,
             current_app.config["UTCNOW_ISO_FUNC"](),
@@ -252,6 +252,8 @@ def ensure_columns_and_constraints(kind: str) -> None:
 def ensure_indexes() -> None:
     index_statements = [
         "CREATE INDEX IF NOT EXISTS residents_shelter_active_name_idx ON residents (shelter, is_active, last_name, first_name)",
+        "DROP INDEX IF EXISTS residents_shelter_key_active_name_idx",
+        "CREATE INDEX IF NOT EXISTS residents_shelter_key_active_desc_name_idx ON residents (LOWER(COALESCE(shelter, '')), is_active DESC, last_name, first_name, id)",
         "CREATE INDEX IF NOT EXISTS resident_children_resident_idx ON resident_children (resident_id)",
         "CREATE INDEX IF NOT EXISTS resident_child_income_supports_child_idx ON resident_child_income_supports (child_id)",
         "CREATE INDEX IF NOT EXISTS resident_child_income_supports_resident_idx ON resident_child_income_supports (resident_id)",
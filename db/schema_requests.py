@@ -430,6 +430,18 @@ def ensure_indexes() -> None:
             "ON transport_requests (shelter, status, needed_at)"
         )
 
+    with contextlib.suppress(Exception):
+        db_execute(
+            "CREATE INDEX IF NOT EXISTS transport_requests_shelter_key_status_needed_idx "
+            "ON transport_requests (LOWER(TRIM(COALESCE(shelter, ''))), status, needed_at)"
+        )
+
+    with contextlib.suppress(Exception):
+        db_execute(
+            "CREATE INDEX IF NOT EXISTS transport_requests_resident_submitted_idx "
+            "ON transport_requests (resident_identifier, submitted_at DESC, id DESC)"
+        )
+
     with contextlib.suppress(Exception):
         db_execute(
             "CREATE INDEX IF NOT EXISTS attendance_events_shelter_occurred_idx "
@@ -442,6 +454,22 @@ def ensure_indexes() -> None:
             "ON attendance_events (resident_id, event_time)"
         )
 
+    # Superseded by attendance_events_shelter_resident_time_idx below.
+    with contextlib.suppress(Exception):
+        db_execute("DROP INDEX IF EXISTS attendance_events_resident_shelter_time_idx")
+
+    with contextlib.suppress(Exception):
+        db_execute(
+            "CREATE INDEX IF NOT EXISTS attendance_events_resident_shelter_type_time_idx "
+            "ON attendance_events (resident_id, shelter, event_type, event_time DESC, id DESC)"
+        )
+
+    with contextlib.suppress(Exception):
+        db_execute(
+            "CREATE INDEX IF NOT EXISTS attendance_events_shelter_resident_time_idx "
+            "ON attendance_events (shelter, resident_id, event_time DESC, id DESC)"
+        )
+
     with contextlib.suppress(Exception):
         db_execute(
             "CREATE INDEX IF NOT EXISTS resident_transfers_resident_time_idx "
@@ -460,6 +488,18 @@ def ensure_indexes() -> None:
             "ON resident_passes (shelter, status)"
         )
 
+    with contextlib.suppress(Exception):
+        db_execute(
+            "CREATE INDEX IF NOT EXISTS resident_passes_status_shelter_key_created_idx "
+            "ON resident_passes (status, LOWER(TRIM(shelter)), created_at)"
+        )
+
+    with contextlib.suppress(Exception):
+        db_execute(
+            "CREATE INDEX IF NOT EXISTS resident_passes_status_shelter_key_end_idx "
+            "ON resident_passes (status, LOWER(TRIM(shelter)), end_at)"
+        )
+
     with contextlib.suppress(Exception):
         db_execute(
             "CREATE INDEX IF NOT EXISTS resident_passes_shelter_delete_after_idx "
@@ -15,6 +15,7 @@ from routes.admin_parts.dashboard import (
     admin_ban_ip_view,
     admin_dashboard_live_view,
     admin_dashboard_view,
+    admin_overdue_counts_view,
     admin_security_config_history_view,
     admin_unban_ip_view,
     admin_unlock_username_view,
@@ -93,6 +94,13 @@ def admin_dashboard_live():
     return admin_dashboard_live_view()
 
 
+@admin.route("/staff/admin/overdue_counts", methods=["GET"])
+@require_login
+@require_shelter
+def admin_overdue_counts():
+    return admin_overdue_counts_view()
+
+
 @admin.route("/staff/admin/role-permissions", methods=["GET"])
 @require_login
 @require_shelter
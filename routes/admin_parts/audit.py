@@ -3,10 +3,19 @@ from __future__ import annotations
 import csv
 import io
 
-from flask import Response, flash, g, redirect, render_template, request, url_for
+from flask import (
+    Response,
+    flash,
+    g,
+    redirect,
+    render_template,
+    request,
+    stream_with_context,
+    url_for,
+)
 
 from core.admin_rbac import require_admin_role as _require_admin
-from core.db import db_fetchall
+from core.db import db_fetchall, db_iterrows
 
 
 def _placeholder() -> str:
@@ -156,7 +165,7 @@ def _load_audit_filter_options():
     return all_shelters, staff_options, entity_options, action_options
 
 
-def _load_audit_rows(limit: int | None = 200):
+def _audit_rows_query(limit: int | None) -> tuple[str, tuple]:
     where_sql, params = _audit_where_from_request()
     ph = _placeholder()
     limit_sql = f" LIMIT {ph}" if limit else ""
@@ -176,7 +185,12 @@ def _load_audit_rows(limit: int | None = 200):
         """
     )
 
-    return db_fetchall(sql, params + limit_params)
+    return sql, params + limit_params
+
+
+def _load_audit_rows(limit: int | None = 200):
+    sql, params = _audit_rows_query(limit)
+    return db_fetchall(sql, params)
 
 
 def staff_audit_log_view():
@@ -202,45 +216,56 @@ def staff_audit_log_csv_view():
         flash("Admin only.", "error")
         return redirect(url_for("attendance.staff_attendance"))
 
-    rows = _load_audit_rows(limit=None)
-
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    writer.writerow(
-        [
-            "id",
-            "event_source",
-            "entity_type",
-            "entity_id",
-            "shelter",
-            "staff_username",
-            "event_type",
-            "detail",
-            "old_value",
-            "new_value",
-            "created_at",
-        ]
-    )
+    sql, params = _audit_rows_query(limit=None)
+
+    def _csv_lines():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+
+        def _flush() -> str:
+            chunk = buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+            return chunk
 
-    for row in rows:
         writer.writerow(
             [
-                row.get("id", ""),
-                row.get("event_source", ""),
-                row.get("entity_type", ""),
-                row.get("entity_id", ""),
-                row.get("shelter", ""),
-                row.get("staff_username", ""),
-                row.get("event_type", ""),
-                row.get("detail", ""),
-                row.get("old_value", ""),
-                row.get("new_value", ""),
-                row.get("created_at", ""),
+                "id",
+                "event_source",
+                "entity_type",
+                "entity_id",
+                "shelter",
+                "staff_username",
+                "event_type",
+                "detail",
+                "old_value",
+                "new_value",
+                "created_at",
             ]
         )
+        yield _flush()
+
+        # The export is unbounded, so stream rows instead of buffering the log.
+        for row in db_iterrows(sql, params):
+            writer.writerow(
+                [
+                    row.get("id", ""),
+                    row.get("event_source", ""),
+                    row.get("entity_type", ""),
+                    row.get("entity_id", ""),
+                    row.get("shelter", ""),
+                    row.get("staff_username", ""),
+                    row.get("event_type", ""),
+                    row.get("detail", ""),
+                    row.get("old_value", ""),
+                    row.get("new_value", ""),
+                    row.get("created_at", ""),
+                ]
+            )
+            yield _flush()
 
     return Response(
-        buf.getvalue(),
+        stream_with_context(_csv_lines()),
         mimetype="text/csv",
         headers={"Content-Disposition": "attachment; filename=audit_log.csv"},
     )
@@ -20,6 +20,7 @@ from core.admin_dashboard_payload import (
 from core.admin_rbac import current_role as _current_role
 from core.admin_rbac import require_admin_role as _require_admin
 from core.audit import log_action
+from core.auth import clear_admin_only_mode_cache
 from core.db import db_execute, db_fetchall, db_fetchone, db_transaction
 from core.helpers import fmt_dt, utcnow_iso
 from core.rate_limit import ban_ip
@@ -27,6 +28,31 @@ from core.rate_limit import ban_ip
 AUTO_RESET_HOURS = 8
 MANUAL_IP_BAN_SECONDS = 3600
 
+_OVERDUE_COUNTS_SQL = """
+    SELECT shelter, COUNT(*) AS overdue_count
+    FROM (
+        SELECT
+            ae.shelter,
+            ae.event_type,
+            ae.expected_back_time,
+            ROW_NUMBER() OVER (
+                PARTITION BY ae.resident_id, ae.shelter
+                ORDER BY ae.event_time DESC, ae.id DESC
+            ) AS latest_rank
+        FROM attendance_events ae
+        JOIN residents r
+          ON r.id = ae.resident_id
+         AND r.shelter = ae.shelter
+         AND r.is_active = TRUE
+    ) latest
+    WHERE latest_rank = 1
+      AND event_type = 'check_out'
+      AND COALESCE(expected_back_time, '') <> ''
+      AND expected_back_time < %s
+    GROUP BY shelter
+    ORDER BY shelter
+"""
+
 SECURITY_FIELD_META = {
     "sms_system_enabled": {
         "expires_field": "sms_system_expires_at",
@@ -137,6 +163,16 @@ def admin_dashboard_live_view():
     return jsonify(live_payload)
 
 
+def admin_overdue_counts_view():
+    if not _require_admin():
+        return jsonify({"ok": False, "error": "forbidden"}), 403
+
+    rows = db_fetchall(_OVERDUE_COUNTS_SQL, (utcnow_iso(),))
+    counts = {row["shelter"]: int(row["overdue_count"]) for row in rows}
+
+    return jsonify({"ok": True, "counts": counts, "total": sum(counts.values())})
+
+
 def admin_update_security_settings_view():
     if not _require_admin():
         flash("Admin only.", "error")
@@ -220,6 +256,8 @@ def admin_update_security_settings_view():
             ),
         )
 
+    clear_admin_only_mode_cache()
+
     log_action(
         "security_settings",
         None,
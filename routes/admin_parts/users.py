@@ -24,10 +24,12 @@ from core.admin_rbac import (
     require_admin_role as _require_admin,
 )
 from core.audit import log_action
-from core.db import db_execute, db_fetchall
+from core.db import db_execute, db_fetchall, db_fetchone, db_kind
 from core.helpers import fmt_dt, utcnow_iso
+from core.passwords import hash_password
 from core.phone_numbers import normalize_optional_phone_10, phone_has_value
-from core.runtime import MIN_STAFF_PASSWORD_LEN, ROLE_LABELS, init_db
+from core.runtime import MIN_STAFF_PASSWORD_LEN, ROLE_LABELS
+from core.staff_user_cache import clear_user_list_cache, get_or_load_user_list
 
 VALID_SHELTERS = {"abba", "haven", "gratitude"}
 VALID_CALENDAR_COLORS = {
@@ -43,7 +45,7 @@ VALID_CALENDAR_COLORS = {
 
 
 def _db_kind() -> str:
-    return "pg" if current_app.config.get("DATABASE_URL") else "sqlite"
+    return db_kind()
 
 
 def _ph() -> str:
@@ -129,8 +131,6 @@ def admin_users_view():
         flash("Admin or Shelter Director only.", "error")
         return redirect(url_for("attendance.staff_attendance"))
 
-    init_db()
-
     allowed_roles = _allowed_roles_to_create()
     kind = _db_kind()
 
@@ -201,14 +201,15 @@ def admin_users_view():
         else:
             order_sql = "ORDER BY last_name IS NULL, last_name ASC, first_name IS NULL, first_name ASC, created_at DESC"
 
-    users = db_fetchall(
-        f"""
+    users_sql = f"""
         SELECT id, first_name, last_name, username, role, is_active, created_at, mobile_phone, calendar_color
         FROM staff_users
         {where_sql}
         {order_sql}
-        """,
-        tuple(params),
+        """
+    users = get_or_load_user_list(
+        (current_app.config.get("DATABASE_URL"), users_sql, tuple(params)),
+        lambda: [dict(row) for row in db_fetchall(users_sql, tuple(params))],
     )
 
     return render_template(
@@ -225,14 +226,10 @@ def admin_users_view():
 
 
 def admin_add_user_view():
-    from werkzeug.security import generate_password_hash
-
     if not _require_admin_or_shelter_director():
         flash("Admin or Shelter Director only.", "error")
         return redirect(url_for("attendance.staff_attendance"))
 
-    init_db()
-
     allowed_roles = set(_allowed_roles_to_create())
 
     if request.method == "POST":
@@ -301,11 +298,36 @@ def admin_add_user_view():
                 ),
             )
 
-        existing = db_fetchall(
-            f"SELECT id FROM staff_users WHERE username = {_ph()}",
-            (username,),
+        created = db_fetchone(
+            f"""
+            INSERT INTO staff_users (
+                first_name,
+                last_name,
+                username,
+                password_hash,
+                role,
+                is_active,
+                mobile_phone,
+                calendar_color,
+                created_at
+            )
+            VALUES ({_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()})
+            ON CONFLICT (username) DO NOTHING
+            RETURNING id
+            """,
+            (
+                first_name,
+                last_name,
+                username,
+                hash_password(password),
+                role,
+                True,
+                mobile_phone,
+                calendar_color,
+                utcnow_iso(),
+            ),
         )
-        if existing:
+        if not created:
             flash("Username already exists.", "error")
             return render_template(
                 "admin_user_form.html",
@@ -316,73 +338,10 @@ def admin_add_user_view():
                 ),
             )
 
-        created_at = utcnow_iso()
-
-        if _db_kind() == "pg":
-            created = db_fetchall(
-                f"""
-                INSERT INTO staff_users (
-                    first_name,
-                    last_name,
-                    username,
-                    password_hash,
-                    role,
-                    is_active,
-                    mobile_phone,
-                    calendar_color,
-                    created_at
-                )
-                VALUES ({_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()})
-                RETURNING id
-                """,
-                (
-                    first_name,
-                    last_name,
-                    username,
-                    generate_password_hash(password),
-                    role,
-                    True,
-                    mobile_phone,
-                    calendar_color,
-                    created_at,
-                ),
-            )
-            new_user_id = created[0]["id"]
-        else:
-            db_execute(
-                f"""
-                INSERT INTO staff_users (
-                    first_name,
-                    last_name,
-                    username,
-                    password_hash,
-                    role,
-                    is_active,
-                    mobile_phone,
-                    calendar_color,
-                    created_at
-                )
-                VALUES ({_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()}, {_ph()})
-                """,
-                (
-                    first_name,
-                    last_name,
-                    username,
-                    generate_password_hash(password),
-                    role,
-                    1,
-                    mobile_phone,
-                    calendar_color,
-                    created_at,
-                ),
-            )
-            created = db_fetchall(
-                f"SELECT id FROM staff_users WHERE username = {_ph()} ORDER BY id DESC",
-                (username,),
-            )
-            new_user_id = created[0]["id"]
+        new_user_id = created["id"]
 
         _save_staff_shelter_assignments(new_user_id, selected_shelters)
+        clear_user_list_cache()
 
         log_action(
             "staff_user",
@@ -407,14 +366,10 @@ def admin_add_user_view():
 
 
 def admin_edit_user_view(user_id: int):
-    from werkzeug.security import generate_password_hash
-
     if not _require_admin_or_shelter_director():
         flash("Admin or Shelter Director only.", "error")
         return redirect(url_for("attendance.staff_attendance"))
 
-    init_db()
-
     rows = db_fetchall(
         f"""
         SELECT id, first_name, last_name, username, role, is_active, created_at, mobile_phone, calendar_color
@@ -592,7 +547,7 @@ def admin_edit_user_view(user_id: int):
                     final_role,
                     mobile_phone,
                     calendar_color,
-                    generate_password_hash(password),
+                    hash_password(password),
                     user_id,
                 ),
             )
@@ -620,6 +575,7 @@ def admin_edit_user_view(user_id: int):
             )
 
         _save_staff_shelter_assignments(user_id, selected_shelters)
+        clear_user_list_cache()
 
         log_action(
             "staff_user",
@@ -645,8 +601,6 @@ def admin_edit_user_view(user_id: int):
 
 
 def admin_set_user_active_view(user_id: int):
-    init_db()
-
     role = _current_role()
 
     if role not in {"admin", "shelter_director"}:
@@ -678,6 +632,7 @@ def admin_set_user_active_view(user_id: int):
         f"UPDATE staff_users SET is_active = {_ph()} WHERE id = {_ph()}",
         (is_active_value if _db_kind() == "pg" else (1 if is_active_value else 0), user_id),
     )
+    clear_user_list_cache()
 
     log_action(
         "staff_user",
@@ -693,8 +648,6 @@ def admin_set_user_active_view(user_id: int):
 
 
 def admin_set_user_role_view(user_id: int):
-    init_db()
-
     if not _require_admin():
         flash("Admin only.", "error")
         return redirect(url_for("attendance.staff_attendance"))
@@ -723,6 +676,7 @@ def admin_set_user_role_view(user_id: int):
         f"UPDATE staff_users SET role = {_ph()} WHERE id = {_ph()}",
         (new_role, user_id),
     )
+    clear_user_list_cache()
 
     log_action(
         "staff_user",
@@ -738,10 +692,6 @@ def admin_set_user_role_view(user_id: int):
 
 
 def admin_reset_user_password_view(user_id: int):
-    from werkzeug.security import generate_password_hash
-
-    init_db()
-
     if not _require_admin():
         flash("Admin only.", "error")
         return redirect(url_for("attendance.staff_attendance"))
@@ -761,7 +711,7 @@ def admin_reset_user_password_view(user_id: int):
 
     db_execute(
         f"UPDATE staff_users SET password_hash = {_ph()} WHERE id = {_ph()}",
-        (generate_password_hash(password), user_id),
+        (hash_password(password), user_id),
     )
 
     log_action(
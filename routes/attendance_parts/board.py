@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from flask import current_app, flash, g, redirect, render_template, request, session, url_for
+from flask import flash, g, redirect, render_template, request, session, url_for
 
 from core.audit import log_action
 from core.db import db_execute, db_fetchall, db_fetchone
@@ -14,11 +16,20 @@ from core.residents import has_active_pass
 from routes.attendance_parts.helpers import complete_active_passes
 
 CHICAGO_TZ = ZoneInfo("America/Chicago")
-ALLOWED_ATTENDANCE_MINUTES = {"00", "10", "15", "20", "30", "40", "45", "50"}
+ALLOWED_ATTENDANCE_MINUTES = frozenset({0, 10, 15, 20, 30, 40, 45, 50})
+
+_ATTENDANCE_INSERT_SQL = (
+    "INSERT INTO attendance_events (resident_id, shelter, event_type, event_time, staff_user_id, note, expected_back_time, destination, obligation_start_time, obligation_end_time) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+)
 
 
 def _active_checkout_categories_for_shelter(shelter: str) -> list[dict]:
     shelter_key = (shelter or "").strip().lower()
+    cache = g.setdefault("active_checkout_categories_by_shelter", {})
+    if shelter_key in cache:
+        return cache[shelter_key]
+
     rows = load_kiosk_activity_categories_for_shelter(shelter_key)
 
     categories: list[dict] = []
@@ -30,6 +41,7 @@ def _active_checkout_categories_for_shelter(shelter: str) -> list[dict]:
             continue
         categories.append(dict(row))
 
+    cache[shelter_key] = categories
     return categories
 
 
@@ -63,24 +75,6 @@ def _active_pass_row(resident_id: int, shelter: str):
             end_date ASC,
             id ASC
         LIMIT 1
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        SELECT id, pass_type, destination, end_at, end_date
-        FROM resident_passes
-        WHERE resident_id = ?
-          AND LOWER(TRIM(COALESCE(shelter, ''))) = ?
-          AND status = ?
-          AND (
-                (start_at IS NOT NULL AND end_at IS NOT NULL AND start_at <= ? AND end_at >= ?)
-             OR (start_date IS NOT NULL AND end_date IS NOT NULL AND start_date <= ? AND end_date >= ?)
-          )
-        ORDER BY
-            CASE WHEN end_at IS NULL THEN 1 ELSE 0 END,
-            end_at ASC,
-            end_date ASC,
-            id ASC
-        LIMIT 1
         """,
         (resident_id, normalized_shelter, "approved", now_iso, now_iso, today_iso, today_iso),
     )
@@ -90,12 +84,12 @@ def _pass_expected_back_value(pass_row) -> str | None:
     if not pass_row:
         return None
 
-    end_at = (pass_row["end_at"] if isinstance(pass_row, dict) else pass_row[3]) or ""
+    end_at = pass_row["end_at"] or ""
     end_at = str(end_at).strip()
     if end_at:
         return end_at
 
-    end_date = (pass_row["end_date"] if isinstance(pass_row, dict) else pass_row[4]) or ""
+    end_date = pass_row["end_date"] or ""
     end_date = str(end_date).strip()
     if not end_date:
         return None
@@ -103,15 +97,14 @@ def _pass_expected_back_value(pass_row) -> str | None:
     local_end = datetime.combine(
         datetime.fromisoformat(end_date).date(),
         datetime.min.time().replace(hour=23, minute=59, second=59),
-        tzinfo=ZoneInfo("America/Chicago"),
+        tzinfo=CHICAGO_TZ,
     )
 
     return local_end.astimezone(UTC).replace(tzinfo=None).isoformat(timespec="seconds")
 
 
 def _validate_allowed_attendance_minute(local_dt: datetime) -> None:
-    minute_value = f"{local_dt.minute:02d}"
-    if minute_value not in ALLOWED_ATTENDANCE_MINUTES:
+    if local_dt.minute not in ALLOWED_ATTENDANCE_MINUTES:
         raise ValueError("Minute must be one of the allowed attendance minute values.")
 
     if local_dt.second != 0 or local_dt.microsecond != 0:
@@ -125,21 +118,24 @@ def _parse_datetime_local_to_utc_naive(value: str) -> str:
 
     local_dt = datetime.fromisoformat(raw_value)
     _validate_allowed_attendance_minute(local_dt)
-    local_dt = local_dt.replace(tzinfo=ZoneInfo("America/Chicago"))
+    local_dt = local_dt.replace(tzinfo=CHICAGO_TZ)
     return local_dt.astimezone(UTC).replace(tzinfo=None).isoformat(timespec="seconds")
 
 
+# The board formats the same stored timestamps for every resident row.
+@lru_cache(maxsize=4096)
 def _local_dt_input_value(dt_iso: str | None) -> str:
     if not dt_iso:
         return ""
     try:
         dt = datetime.fromisoformat(str(dt_iso)).replace(tzinfo=UTC)
-        local_dt = dt.astimezone(ZoneInfo("America/Chicago"))
+        local_dt = dt.astimezone(CHICAGO_TZ)
         return local_dt.strftime("%Y-%m-%dT%H:%M")
     except Exception:
         return ""
 
 
+@lru_cache(maxsize=4096)
 def _parse_stored_utc_naive(value: str | None) -> datetime | None:
     text = (value or "").strip()
     if not text:
@@ -155,7 +151,11 @@ def _parse_stored_utc_naive(value: str | None) -> datetime | None:
     return parsed.astimezone(UTC)
 
 
-def _late_status(expected_back_time: str | None, is_out: bool) -> tuple[bool, int | None]:
+def _late_status(
+    expected_back_time: str | None,
+    is_out: bool,
+    now_utc: datetime | None = None,
+) -> tuple[bool, int | None]:
     if not is_out:
         return False, None
 
@@ -163,7 +163,8 @@ def _late_status(expected_back_time: str | None, is_out: bool) -> tuple[bool, in
     if not expected_back_dt:
         return False, None
 
-    now_utc = datetime.now(UTC)
+    if now_utc is None:
+        now_utc = datetime.now(UTC)
     if now_utc <= expected_back_dt:
         return False, None
 
@@ -190,24 +191,6 @@ def _latest_open_checkout_row(resident_id: int, shelter: str):
           AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
         ORDER BY event_time DESC, id DESC
         LIMIT 1
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        SELECT
-            id,
-            event_type,
-            event_time,
-            note,
-            expected_back_time,
-            destination,
-            obligation_start_time,
-            obligation_end_time,
-            actual_obligation_end_time
-        FROM attendance_events
-        WHERE resident_id = ?
-          AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-        ORDER BY event_time DESC, id DESC
-        LIMIT 1
         """,
         (resident_id, shelter),
     )
@@ -215,7 +198,7 @@ def _latest_open_checkout_row(resident_id: int, shelter: str):
     if not row:
         return None
 
-    event_type = row["event_type"] if isinstance(row, dict) else row[1]
+    event_type = row["event_type"]
     if (event_type or "").strip() != "check_out":
         return None
 
@@ -232,16 +215,6 @@ def _latest_completed_attendance_pair(resident_id: int, shelter: str):
           AND event_type = %s
         ORDER BY event_time DESC, id DESC
         LIMIT 1
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        SELECT id, event_time
-        FROM attendance_events
-        WHERE resident_id = ?
-          AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-          AND event_type = ?
-        ORDER BY event_time DESC, id DESC
-        LIMIT 1
         """,
         (resident_id, shelter, "check_in"),
     )
@@ -249,10 +222,8 @@ def _latest_completed_attendance_pair(resident_id: int, shelter: str):
     if not checkin_row:
         return None
 
-    checkin_id = int(checkin_row["id"] if isinstance(checkin_row, dict) else checkin_row[0])
-    checkin_time = (
-        checkin_row["event_time"] if isinstance(checkin_row, dict) else checkin_row[1]
-    ) or ""
+    checkin_id = int(checkin_row["id"])
+    checkin_time = checkin_row["event_time"] or ""
 
     checkout_row = db_fetchone(
         """
@@ -272,25 +243,6 @@ def _latest_completed_attendance_pair(resident_id: int, shelter: str):
           AND event_time <= %s
         ORDER BY event_time DESC, id DESC
         LIMIT 1
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        SELECT
-            id,
-            event_time,
-            note,
-            expected_back_time,
-            destination,
-            obligation_start_time,
-            obligation_end_time,
-            actual_obligation_end_time
-        FROM attendance_events
-        WHERE resident_id = ?
-          AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-          AND event_type = ?
-          AND event_time <= ?
-        ORDER BY event_time DESC, id DESC
-        LIMIT 1
         """,
         (resident_id, shelter, "check_out", checkin_time),
     )
@@ -301,42 +253,34 @@ def _latest_completed_attendance_pair(resident_id: int, shelter: str):
     return {
         "checkin_id": checkin_id,
         "checkin_time": checkin_time,
-        "checkout_id": int(
-            checkout_row["id"] if isinstance(checkout_row, dict) else checkout_row[0]
-        ),
-        "checkout_time": (
-            checkout_row["event_time"] if isinstance(checkout_row, dict) else checkout_row[1]
-        )
-        or "",
-        "note": (checkout_row["note"] if isinstance(checkout_row, dict) else checkout_row[2]) or "",
-        "expected_back_time": (
-            checkout_row["expected_back_time"]
-            if isinstance(checkout_row, dict)
-            else checkout_row[3]
-        )
-        or "",
-        "destination": (
-            checkout_row["destination"] if isinstance(checkout_row, dict) else checkout_row[4]
-        )
-        or "",
-        "obligation_start_time": (
-            checkout_row["obligation_start_time"]
-            if isinstance(checkout_row, dict)
-            else checkout_row[5]
-        )
-        or "",
-        "obligation_end_time": (
-            checkout_row["obligation_end_time"]
-            if isinstance(checkout_row, dict)
-            else checkout_row[6]
-        )
-        or "",
-        "actual_obligation_end_time": (
-            checkout_row["actual_obligation_end_time"]
-            if isinstance(checkout_row, dict)
-            else checkout_row[7]
-        )
-        or "",
+        "checkout_id": int(checkout_row["id"]),
+        "checkout_time": checkout_row["event_time"] or "",
+        "note": checkout_row["note"] or "",
+        "expected_back_time": checkout_row["expected_back_time"] or "",
+        "destination": checkout_row["destination"] or "",
+        "obligation_start_time": checkout_row["obligation_start_time"] or "",
+        "obligation_end_time": checkout_row["obligation_end_time"] or "",
+        "actual_obligation_end_time": checkout_row["actual_obligation_end_time"] or "",
+    }
+
+
+def _completed_pair_from_board_row(row) -> dict[str, Any] | None:
+    # Only called for residents who are in, so the latest check-in is newer
+    # than the latest check-out the board row already carries.
+    if row["last_checkin_id"] is None or row["checkout_id"] is None:
+        return None
+
+    return {
+        "checkin_id": int(row["last_checkin_id"]),
+        "checkin_time": row["last_checkin_time"] or "",
+        "checkout_id": int(row["checkout_id"]),
+        "checkout_time": row["event_time"] or "",
+        "note": row["note"] or "",
+        "expected_back_time": row["expected_back_time"] or "",
+        "destination": row["destination"] or "",
+        "obligation_start_time": row["obligation_start_time"] or "",
+        "obligation_end_time": row["obligation_end_time"] or "",
+        "actual_obligation_end_time": row["actual_obligation_end_time"] or "",
     }
 
 
@@ -356,31 +300,15 @@ def _checkout_requires_actual_end_time(checkout_row) -> bool:
     if not checkout_row:
         return False
 
-    destination = (
-        checkout_row["destination"] if isinstance(checkout_row, dict) else checkout_row[5]
-    ) or ""
-    obligation_start = (
-        checkout_row["obligation_start_time"] if isinstance(checkout_row, dict) else checkout_row[6]
-    ) or ""
-    obligation_end = (
-        checkout_row["obligation_end_time"] if isinstance(checkout_row, dict) else checkout_row[7]
-    ) or ""
+    destination = checkout_row["destination"] or ""
+    obligation_start = checkout_row["obligation_start_time"] or ""
+    obligation_end = checkout_row["obligation_end_time"] or ""
 
     return _checkout_requires_actual_end_time_from_values(
         destination, obligation_start, obligation_end
     )
 
 
-def _attendance_insert_sql() -> str:
-    return (
-        "INSERT INTO attendance_events (resident_id, shelter, event_type, event_time, staff_user_id, note, expected_back_time, destination, obligation_start_time, obligation_end_time) "
-        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
-        if g.get("db_kind") == "pg"
-        else "INSERT INTO attendance_events (resident_id, shelter, event_type, event_time, staff_user_id, note, expected_back_time, destination, obligation_start_time, obligation_end_time) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
-    )
-
-
 def _later_delete_after_from_values(expected_back_time: str | None, checkin_time: str) -> str:
     checkin_dt = datetime.fromisoformat(checkin_time)
     expected_dt = _parse_stored_utc_naive(expected_back_time)
@@ -421,23 +349,6 @@ def _update_related_pass_delete_after_at(
             COALESCE(approved_at, updated_at, created_at) DESC,
             id DESC
         LIMIT 1
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        SELECT id, end_at, end_date
-        FROM resident_passes
-        WHERE resident_id = ?
-          AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-          AND status IN ('approved', 'completed')
-          AND (
-                (start_at IS NOT NULL AND end_at IS NOT NULL AND start_at <= ? AND end_at >= ?)
-             OR (start_date IS NOT NULL AND end_date IS NOT NULL AND start_date <= ? AND end_date >= ?)
-          )
-        ORDER BY
-            CASE WHEN status = 'completed' THEN 0 ELSE 1 END,
-            COALESCE(approved_at, updated_at, created_at) DESC,
-            id DESC
-        LIMIT 1
         """,
         (resident_id, shelter, checkout_time, checkout_time, checkout_date_iso, checkout_date_iso),
     )
@@ -454,23 +365,121 @@ def _update_related_pass_delete_after_at(
         SET delete_after_at = %s,
             updated_at = %s
         WHERE id = %s
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        UPDATE resident_passes
-        SET delete_after_at = ?,
-            updated_at = ?
-        WHERE id = ?
         """,
         (delete_after_at, utcnow_iso(), int(pass_row["id"])),
     )
 
 
-def _attendance_base_row(r, shelter: str) -> dict[str, Any]:
-    rid = int(r["id"] if isinstance(r, dict) else r[0])
-    first = r["first_name"] if isinstance(r, dict) else r[4]
-    last = r["last_name"] if isinstance(r, dict) else r[5]
+_ATTENDANCE_BOARD_SQL = """
+    WITH ranked AS (
+        SELECT
+            id,
+            resident_id,
+            event_type,
+            event_time,
+            expected_back_time,
+            note,
+            destination,
+            obligation_start_time,
+            obligation_end_time,
+            actual_obligation_end_time,
+            ROW_NUMBER() OVER (
+                PARTITION BY resident_id
+                ORDER BY event_time DESC, id DESC
+            ) AS latest_rank,
+            ROW_NUMBER() OVER (
+                PARTITION BY resident_id, event_type
+                ORDER BY event_time DESC, id DESC
+            ) AS type_rank
+        FROM attendance_events
+        WHERE shelter = %s
+    )
+    SELECT
+        r.id,
+        r.first_name,
+        r.last_name,
+        e.event_type AS last_event_type,
+        c.resident_id AS checkout_resident_id,
+        c.event_time,
+        c.expected_back_time,
+        c.note,
+        c.destination,
+        c.obligation_start_time,
+        c.obligation_end_time,
+        c.actual_obligation_end_time,
+        CASE
+            WHEN COALESCE(c.expected_back_time, '') <> ''
+             AND c.expected_back_time < %s
+            THEN 1
+            ELSE 0
+        END AS is_past_expected_back,
+        c.id AS checkout_id,
+        i.id AS last_checkin_id,
+        i.event_time AS last_checkin_time,
+        CASE
+            WHEN EXISTS (
+                SELECT 1
+                FROM resident_passes p
+                WHERE p.resident_id = r.id
+                  AND LOWER(TRIM(COALESCE(p.shelter, ''))) = %s
+                  AND p.status = 'approved'
+                  AND (
+                        (p.start_at IS NOT NULL AND p.end_at IS NOT NULL
+                         AND p.start_at <= %s AND p.end_at >= %s)
+                     OR (p.start_date IS NOT NULL AND p.end_date IS NOT NULL
+                         AND p.start_date <= %s AND p.end_date >= %s)
+                  )
+            )
+            THEN 1
+            ELSE 0
+        END AS has_active_pass
+    FROM residents r
+    LEFT JOIN ranked e
+      ON e.resident_id = r.id
+     AND e.latest_rank = 1
+    LEFT JOIN ranked c
+      ON c.resident_id = r.id
+     AND c.event_type = 'check_out'
+     AND c.type_rank = 1
+    LEFT JOIN ranked i
+      ON i.resident_id = r.id
+     AND i.event_type = 'check_in'
+     AND i.type_rank = 1
+    WHERE r.shelter = %s
+      AND r.is_active = TRUE
+    ORDER BY LOWER(r.last_name), LOWER(r.first_name)
+"""
+
+
+def _attendance_board_rows(shelter: str) -> list[tuple[Any, tuple[Any, Any]]]:
+    cache = g.setdefault("attendance_board_rows_by_shelter", {})
+    if shelter in cache:
+        return cache[shelter]
+
+    now_iso = utcnow_iso()
+    today_iso = now_iso[:10]
+    params = (
+        shelter,
+        now_iso,
+        (shelter or "").strip().lower(),
+        now_iso,
+        now_iso,
+        today_iso,
+        today_iso,
+        shelter,
+    )
 
+    board_rows: list[tuple[Any, tuple[Any, Any]]] = []
+    for row in db_fetchall(_ATTENDANCE_BOARD_SQL, params):
+        last_event = {"event_type": row["last_event_type"]} if row["last_event_type"] else None
+        last_checkout = row if row["checkout_resident_id"] is not None else None
+        board_rows.append((row, (last_event, last_checkout)))
+
+    cache[shelter] = board_rows
+    return board_rows
+
+
+def _latest_attendance_events_for_resident(resident_id: int, shelter: str) -> tuple[Any, Any]:
     last_event = db_fetchone(
         """
         SELECT event_type, event_time, expected_back_time, note
@@ -478,24 +487,10 @@ def _attendance_base_row(r, shelter: str) -> dict[str, Any]:
         WHERE resident_id = %s AND shelter = %s
         ORDER BY event_time DESC, id DESC
         LIMIT 1
-        """
-        if current_app.config.get("DATABASE_URL")
-        else """
-        SELECT event_type, event_time, expected_back_time, note
-        FROM attendance_events
-        WHERE resident_id = ? AND shelter = ?
-        ORDER BY event_time DESC, id DESC
-        LIMIT 1
         """,
-        (rid, shelter),
+        (resident_id, shelter),
     )
 
-    last_event_type = ""
-    if last_event:
-        last_event_type = (
-            last_event["event_type"] if isinstance(last_event, dict) else last_event[0]
-        )
-
     last_checkout = db_fetchone(
         """
         SELECT event_time, expected_back_time, note, destination, obligation_start_time, obligation_end_time, actual_obligation_end_time
@@ -503,18 +498,63 @@ def _attendance_base_row(r, shelter: str) -> dict[str, Any]:
         WHERE resident_id = %s AND shelter = %s AND event_type = %s
         ORDER BY event_time DESC, id DESC
         LIMIT 1
-        """
-        if current_app.config.get("DATABASE_URL")
-        else """
-        SELECT event_time, expected_back_time, note, destination, obligation_start_time, obligation_end_time, actual_obligation_end_time
-        FROM attendance_events
-        WHERE resident_id = ? AND shelter = ? AND event_type = ?
-        ORDER BY event_time DESC, id DESC
-        LIMIT 1
         """,
-        (rid, shelter, "check_out"),
+        (resident_id, shelter, "check_out"),
     )
 
+    return last_event, last_checkout
+
+
+@dataclass(slots=True)
+class AttendanceBoardRow:
+    resident_id: int
+    first_name: str
+    last_name: str
+    name: str
+    checked_out_at: str
+    expected_back_at: str
+    is_out: bool
+    is_late: bool
+    late_minutes: int | None
+    note: str
+    destination: str
+    obligation_start_at: str
+    obligation_end_at: str
+    actual_obligation_end_at: str
+    checkout_time_input: str
+    obligation_start_input: str
+    obligation_end_input: str
+    actual_obligation_end_input: str
+    has_active_pass: bool
+    actual_end_required: bool
+    last_completed_pair: dict[str, Any] | None
+    last_completed_checkout_time_input: str
+    last_completed_checkin_time_input: str
+    last_completed_destination: str
+    last_completed_start_input: str
+    last_completed_end_input: str
+    last_completed_actual_end_input: str
+    last_completed_actual_end_required: bool
+
+
+def _attendance_base_row(
+    r,
+    shelter: str,
+    latest_events: tuple[Any, Any] | None = None,
+    now_utc: datetime | None = None,
+) -> AttendanceBoardRow:
+    rid = int(r["id"])
+    first = r["first_name"]
+    last = r["last_name"]
+
+    if latest_events is None:
+        latest_events = _latest_attendance_events_for_resident(rid, shelter)
+    last_event, last_checkout = latest_events
+
+    last_event_type = ""
+    if last_event:
+        last_event_type = last_event["event_type"]
+
     checkout_time = ""
     expected_back_time = ""
     checkout_note = ""
@@ -524,132 +564,105 @@ def _attendance_base_row(r, shelter: str) -> dict[str, Any]:
     actual_obligation_end_time = ""
 
     if last_checkout:
-        checkout_time = (
-            last_checkout["event_time"] if isinstance(last_checkout, dict) else last_checkout[0]
-        )
-        expected_back_time = (
-            last_checkout["expected_back_time"]
-            if isinstance(last_checkout, dict)
-            else (last_checkout[1] or "")
-        )
-        checkout_note = (
-            last_checkout["note"] if isinstance(last_checkout, dict) else last_checkout[2]
-        ) or ""
-        destination = (
-            last_checkout["destination"] if isinstance(last_checkout, dict) else last_checkout[3]
-        ) or ""
-        obligation_start_time = (
-            last_checkout["obligation_start_time"]
-            if isinstance(last_checkout, dict)
-            else last_checkout[4]
-        ) or ""
-        obligation_end_time = (
-            last_checkout["obligation_end_time"]
-            if isinstance(last_checkout, dict)
-            else last_checkout[5]
-        ) or ""
-        actual_obligation_end_time = (
-            last_checkout["actual_obligation_end_time"]
-            if isinstance(last_checkout, dict)
-            else last_checkout[6]
-        ) or ""
+        checkout_time = last_checkout["event_time"]
+        expected_back_time = last_checkout["expected_back_time"]
+        checkout_note = last_checkout["note"] or ""
+        destination = last_checkout["destination"] or ""
+        obligation_start_time = last_checkout["obligation_start_time"] or ""
+        obligation_end_time = last_checkout["obligation_end_time"] or ""
+        actual_obligation_end_time = last_checkout["actual_obligation_end_time"] or ""
 
     is_out = last_event_type == "check_out"
-    active_pass = has_active_pass(rid, shelter)
-    last_completed_pair = None if is_out else _latest_completed_attendance_pair(rid, shelter)
-    is_late, late_minutes = _late_status(expected_back_time, is_out)
-
-    return {
-        "resident_id": rid,
-        "first_name": first,
-        "last_name": last,
-        "name": f"{last}, {first}",
-        "checked_out_at": checkout_time,
-        "expected_back_at": expected_back_time,
-        "is_out": is_out,
-        "is_late": is_late,
-        "late_minutes": late_minutes,
-        "note": checkout_note,
-        "destination": destination,
-        "obligation_start_at": obligation_start_time,
-        "obligation_end_at": obligation_end_time,
-        "actual_obligation_end_at": actual_obligation_end_time,
-        "checkout_time_input": _local_dt_input_value(checkout_time),
-        "obligation_start_input": _local_dt_input_value(obligation_start_time),
-        "obligation_end_input": _local_dt_input_value(obligation_end_time),
-        "actual_obligation_end_input": _local_dt_input_value(actual_obligation_end_time),
-        "has_active_pass": active_pass,
-        "actual_end_required": bool(destination and obligation_start_time and obligation_end_time),
-        "last_completed_pair": last_completed_pair,
-        "last_completed_checkout_time_input": _local_dt_input_value(
+    if "has_active_pass" in r:
+        # Board rows carry the pass and completed-pair lookups from one query.
+        active_pass = bool(r["has_active_pass"])
+        last_completed_pair = None if is_out else _completed_pair_from_board_row(r)
+    else:
+        active_pass = has_active_pass(rid, shelter)
+        last_completed_pair = None if is_out else _latest_completed_attendance_pair(rid, shelter)
+    if last_checkout and last_checkout.get("is_past_expected_back") == 0:
+        # The board query already compared expected_back_time against now.
+        is_late, late_minutes = False, None
+    else:
+        is_late, late_minutes = _late_status(expected_back_time, is_out, now_utc)
+
+    return AttendanceBoardRow(
+        resident_id=rid,
+        first_name=first,
+        last_name=last,
+        name=f"{last}, {first}",
+        checked_out_at=checkout_time,
+        expected_back_at=expected_back_time,
+        is_out=is_out,
+        is_late=is_late,
+        late_minutes=late_minutes,
+        note=checkout_note,
+        destination=destination,
+        obligation_start_at=obligation_start_time,
+        obligation_end_at=obligation_end_time,
+        actual_obligation_end_at=actual_obligation_end_time,
+        checkout_time_input=_local_dt_input_value(checkout_time),
+        obligation_start_input=_local_dt_input_value(obligation_start_time),
+        obligation_end_input=_local_dt_input_value(obligation_end_time),
+        actual_obligation_end_input=_local_dt_input_value(actual_obligation_end_time),
+        has_active_pass=active_pass,
+        actual_end_required=bool(destination and obligation_start_time and obligation_end_time),
+        last_completed_pair=last_completed_pair,
+        last_completed_checkout_time_input=_local_dt_input_value(
             last_completed_pair["checkout_time"]
         )
         if last_completed_pair
         else "",
-        "last_completed_checkin_time_input": _local_dt_input_value(
-            last_completed_pair["checkin_time"]
-        )
+        last_completed_checkin_time_input=_local_dt_input_value(last_completed_pair["checkin_time"])
         if last_completed_pair
         else "",
-        "last_completed_destination": last_completed_pair["destination"]
+        last_completed_destination=last_completed_pair["destination"]
         if last_completed_pair
         else "",
-        "last_completed_start_input": _local_dt_input_value(
+        last_completed_start_input=_local_dt_input_value(
             last_completed_pair["obligation_start_time"]
         )
         if last_completed_pair
         else "",
-        "last_completed_end_input": _local_dt_input_value(
-            last_completed_pair["obligation_end_time"]
-        )
+        last_completed_end_input=_local_dt_input_value(last_completed_pair["obligation_end_time"])
         if last_completed_pair
         else "",
-        "last_completed_actual_end_input": _local_dt_input_value(
+        last_completed_actual_end_input=_local_dt_input_value(
             last_completed_pair["actual_obligation_end_time"]
         )
         if last_completed_pair
         else "",
-        "last_completed_actual_end_required": _checkout_requires_actual_end_time_from_values(
+        last_completed_actual_end_required=_checkout_requires_actual_end_time_from_values(
             last_completed_pair["destination"] if last_completed_pair else "",
             last_completed_pair["obligation_start_time"] if last_completed_pair else "",
             last_completed_pair["obligation_end_time"] if last_completed_pair else "",
         ),
-    }
+    )
 
 
 def staff_attendance_view():
     shelter = session["shelter"]
     checkout_categories = _active_checkout_categories_for_shelter(shelter)
 
-    residents = db_fetchall(
-        "SELECT * FROM residents WHERE shelter = %s AND is_active = TRUE ORDER BY last_name, first_name"
-        if current_app.config.get("DATABASE_URL")
-        else "SELECT * FROM residents WHERE shelter = ? AND is_active = 1 ORDER BY last_name, first_name",
-        (shelter,),
-    )
-
-    out_rows: list[dict[str, Any]] = []
-    in_rows: list[dict[str, Any]] = []
+    late_rows: list[AttendanceBoardRow] = []
+    out_rows: list[AttendanceBoardRow] = []
+    in_rows: list[AttendanceBoardRow] = []
 
-    for r in residents:
-        row = _attendance_base_row(r, shelter)
-        if row["is_out"]:
-            out_rows.append(row)
-        else:
+    # The board query already orders residents by lowercased name, so
+    # splitting keeps each group sorted; late residents lead the out list.
+    now_utc = datetime.now(UTC)
+    for r, latest_events in _attendance_board_rows(shelter):
+        row = _attendance_base_row(r, shelter, latest_events, now_utc)
+        if not row.is_out:
             in_rows.append(row)
-
-    out_rows.sort(
-        key=lambda x: (
-            0 if x["is_late"] else 1,
-            x["last_name"].lower(),
-            x["first_name"].lower(),
-        )
-    )
-    in_rows.sort(key=lambda x: (x["last_name"].lower(), x["first_name"].lower()))
+        elif row.is_late:
+            late_rows.append(row)
+        else:
+            out_rows.append(row)
 
     return render_template(
         "staff_attendance.html",
-        out_rows=out_rows,
+        out_rows=late_rows + out_rows,
         in_rows=in_rows,
         fmt_time=fmt_time_only,
         shelter=shelter,
@@ -662,9 +675,7 @@ def staff_attendance_check_in_view(resident_id: int):
     staff_id = session["staff_user_id"]
 
     resident = db_fetchone(
-        "SELECT id FROM residents WHERE id = %s AND shelter = %s AND is_active = TRUE"
-        if current_app.config.get("DATABASE_URL")
-        else "SELECT id FROM residents WHERE id = ? AND shelter = ? AND is_active = 1",
+        "SELECT id FROM residents WHERE id = %s AND shelter = %s AND is_active = TRUE",
         (resident_id, shelter),
     )
 
@@ -677,11 +688,7 @@ def staff_attendance_check_in_view(resident_id: int):
 
     if open_checkout:
         requires_actual_end = _checkout_requires_actual_end_time(open_checkout)
-        existing_actual_end = (
-            open_checkout["actual_obligation_end_time"]
-            if isinstance(open_checkout, dict)
-            else open_checkout[8]
-        ) or ""
+        existing_actual_end = open_checkout["actual_obligation_end_time"] or ""
         if requires_actual_end and not existing_actual_end:
             flash(
                 "This resident needs an actual obligation end time before check in. Use Edit.",
@@ -706,22 +713,6 @@ def staff_attendance_check_in_view(resident_id: int):
             obligation_end_time
         )
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        if current_app.config.get("DATABASE_URL")
-        else """
-        INSERT INTO attendance_events (
-            resident_id,
-            shelter,
-            event_type,
-            event_time,
-            staff_user_id,
-            note,
-            expected_back_time,
-            destination,
-            obligation_start_time,
-            obligation_end_time
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             resident_id,
@@ -762,9 +753,7 @@ def staff_attendance_check_out_global_view():
     resident_id = int(rid_raw)
 
     resident = db_fetchone(
-        "SELECT id FROM residents WHERE id = %s AND shelter = %s AND is_active = TRUE"
-        if g.get("db_kind") == "pg"
-        else "SELECT id FROM residents WHERE id = ? AND shelter = ? AND is_active = 1",
+        "SELECT id FROM residents WHERE id = %s AND shelter = %s AND is_active = TRUE",
         (resident_id, shelter),
     )
     if not resident:
@@ -804,13 +793,9 @@ def staff_attendance_check_out_global_view():
             flash("Approved pass is missing an end time.", "error")
             return redirect(url_for("attendance.staff_attendance"))
 
-        pass_id = active_pass["id"] if isinstance(active_pass, dict) else active_pass[0]
-        pass_type = (
-            active_pass["pass_type"] if isinstance(active_pass, dict) else active_pass[1]
-        ) or ""
-        pass_destination = (
-            active_pass["destination"] if isinstance(active_pass, dict) else active_pass[2]
-        ) or ""
+        pass_id = active_pass["id"]
+        pass_type = active_pass["pass_type"] or ""
+        pass_destination = active_pass["destination"] or ""
 
         if pass_id:
             note_parts.append(f"Pass ID: {pass_id}")
@@ -867,7 +852,7 @@ def staff_attendance_check_out_global_view():
     event_time = utcnow_iso()
 
     db_execute(
-        _attendance_insert_sql(),
+        _ATTENDANCE_INSERT_SQL,
         (
             resident_id,
             shelter,
@@ -901,9 +886,7 @@ def staff_attendance_check_out_global_view():
 
 def _resident_for_edit_or_redirect(resident_id: int, shelter: str):
     resident = db_fetchone(
-        "SELECT * FROM residents WHERE id = %s AND shelter = %s AND is_active = TRUE"
-        if current_app.config.get("DATABASE_URL")
-        else "SELECT * FROM residents WHERE id = ? AND shelter = ? AND is_active = 1",
+        "SELECT id, first_name, last_name FROM residents WHERE id = %s AND shelter = %s AND is_active = TRUE",
         (resident_id, shelter),
     )
     if not resident:
@@ -976,9 +959,7 @@ def staff_attendance_edit_open_submit_view(resident_id: int):
         return redirect(url_for("attendance.staff_attendance_edit_open", resident_id=resident_id))
 
     requires_approved_pass = bool(selected_category.get("requires_approved_pass"))
-    existing_expected_back = (
-        open_checkout["expected_back_time"] if isinstance(open_checkout, dict) else open_checkout[4]
-    ) or ""
+    existing_expected_back = open_checkout["expected_back_time"] or ""
 
     updated_expected_back = existing_expected_back
     updated_start = None
@@ -1069,7 +1050,7 @@ def staff_attendance_edit_open_submit_view(resident_id: int):
                 url_for("attendance.staff_attendance_edit_open", resident_id=resident_id)
             )
 
-    checkout_id = int(open_checkout["id"] if isinstance(open_checkout, dict) else open_checkout[0])
+    checkout_id = int(open_checkout["id"])
 
     db_execute(
         """
@@ -1083,19 +1064,6 @@ def staff_attendance_edit_open_submit_view(resident_id: int):
         WHERE id = %s
           AND resident_id = %s
           AND shelter = %s
-        """
-        if current_app.config.get("DATABASE_URL")
-        else """
-        UPDATE attendance_events
-        SET event_time = ?,
-            destination = ?,
-            expected_back_time = ?,
-            obligation_start_time = ?,
-            obligation_end_time = ?,
-            actual_obligation_end_time = ?
-        WHERE id = ?
-          AND resident_id = ?
-          AND shelter = ?
         """,
         (
             updated_checkout_time,
@@ -1136,7 +1104,7 @@ def staff_attendance_edit_last_view(resident_id: int):
         return redirect(url_for("attendance.staff_attendance"))
 
     row = _attendance_base_row(resident, shelter)
-    if not row["last_completed_pair"]:
+    if not row.last_completed_pair:
         flash("No completed attendance record found to edit.", "error")
         return redirect(url_for("attendance.staff_attendance"))
 
@@ -1306,19 +1274,6 @@ def staff_attendance_edit_last_submit_view(resident_id: int):
         WHERE id = %s
           AND resident_id = %s
           AND shelter = %s
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        UPDATE attendance_events
-        SET event_time = ?,
-            destination = ?,
-            expected_back_time = ?,
-            obligation_start_time = ?,
-            obligation_end_time = ?,
-            actual_obligation_end_time = ?
-        WHERE id = ?
-          AND resident_id = ?
-          AND shelter = ?
         """,
         (
             updated_checkout_time,
@@ -1340,14 +1295,6 @@ def staff_attendance_edit_last_submit_view(resident_id: int):
         WHERE id = %s
           AND resident_id = %s
           AND shelter = %s
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        UPDATE attendance_events
-        SET event_time = ?
-        WHERE id = ?
-          AND resident_id = ?
-          AND shelter = ?
         """,
         (
             updated_checkin_time,
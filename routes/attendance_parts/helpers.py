@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, time, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from flask import session
@@ -11,6 +12,7 @@ from core.helpers import utcnow_iso
 CHICAGO_TZ = ZoneInfo("America/Chicago")
 
 
+@lru_cache(maxsize=4096)
 def parse_dt(dt_str: str) -> datetime:
     return datetime.fromisoformat(dt_str)
 
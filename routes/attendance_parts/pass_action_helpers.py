@@ -3,13 +3,14 @@ from __future__ import annotations
 import contextlib
 from typing import Any
 
-from flask import current_app, g
+from flask import current_app
 
 from core.db import db_execute, db_fetchone, db_transaction
 from core.helpers import fmt_pretty_date, utcnow_iso
 from core.pass_retention import cleanup_deadline_from_expected_back
 from core.pass_rules import pass_type_label
-from core.sms_sender import send_sms
+from core.phone_numbers import phone_digits
+from core.sms_sender import run_sms_in_background, send_sms
 from routes.attendance_parts.helpers import complete_active_passes
 
 
@@ -17,8 +18,183 @@ class PassLifecycleTransitionError(RuntimeError):
     """Raised when a guarded pass status transition does not land."""
 
 
-def _sql(pg: str, sqlite: str) -> str:
-    return pg if g.get("db_kind") == "pg" else sqlite
+_PASS_STATUS_SQL = """
+    SELECT status
+    FROM resident_passes
+    WHERE id = %s
+      AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
+    LIMIT 1
+"""
+
+_RESIDENT_PASS_STATUS_SQL = """
+    SELECT status
+    FROM resident_passes
+    WHERE id = %s
+      AND resident_id = %s
+      AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
+    LIMIT 1
+"""
+
+_INSERT_RESIDENT_NOTIFICATION_SQL = """
+    INSERT INTO resident_notifications (
+        resident_id,
+        shelter,
+        notification_type,
+        title,
+        message,
+        related_pass_id,
+        is_read,
+        created_at,
+        read_at
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, 0, %s, %s)
+"""
+
+# Also carries the approval SMS fields so approving needs no follow-up read.
+_PASS_FOR_REVIEW_SQL = """
+    SELECT
+        rp.id,
+        rp.resident_id,
+        rp.shelter,
+        rp.status,
+        rp.pass_type,
+        rp.start_at,
+        rp.end_at,
+        rp.start_date,
+        rp.end_date,
+        r.first_name,
+        d.resident_phone,
+        (
+            SELECT other.id
+            FROM resident_passes other
+            WHERE other.resident_id = rp.resident_id
+              AND other.id <> rp.id
+              AND LOWER(TRIM(other.shelter)) = LOWER(TRIM(rp.shelter))
+              AND LOWER(TRIM(other.status)) = 'approved'
+            LIMIT 1
+        ) AS other_active_pass_id
+    FROM resident_passes rp
+    LEFT JOIN residents r ON r.id = rp.resident_id
+    LEFT JOIN resident_pass_request_details d ON d.pass_id = rp.id
+    WHERE rp.id = %s AND LOWER(TRIM(rp.shelter)) = LOWER(TRIM(%s))
+    LIMIT 1
+"""
+
+_PASS_FOR_CHECK_IN_SQL = """
+    SELECT
+        rp.id,
+        rp.resident_id,
+        rp.shelter,
+        rp.status,
+        rp.pass_type,
+        rp.start_at,
+        rp.end_at,
+        rp.start_date,
+        rp.end_date,
+        rp.destination,
+        r.first_name,
+        r.last_name
+    FROM resident_passes rp
+    JOIN residents r ON r.id = rp.resident_id
+    WHERE rp.id = %s
+      AND LOWER(TRIM(rp.shelter)) = LOWER(TRIM(%s))
+    LIMIT 1
+"""
+
+_PASS_SMS_CONTEXT_SQL = """
+    SELECT
+        rp.id,
+        rp.resident_id,
+        rp.pass_type,
+        rp.start_at,
+        rp.end_at,
+        rp.start_date,
+        rp.end_date,
+        r.first_name,
+        r.last_name,
+        d.resident_phone
+    FROM resident_passes rp
+    JOIN residents r ON r.id = rp.resident_id
+    LEFT JOIN resident_pass_request_details d ON d.pass_id = rp.id
+    WHERE rp.id = %s
+      AND LOWER(TRIM(rp.shelter)) = LOWER(TRIM(%s))
+    LIMIT 1
+"""
+
+_APPROVE_PENDING_PASS_SQL = """
+    UPDATE resident_passes
+    SET status = %s,
+        approved_by = %s,
+        approved_at = %s,
+        delete_after_at = %s,
+        updated_at = %s
+    WHERE id = %s
+      AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
+      AND LOWER(TRIM(status)) = 'pending'
+    RETURNING id
+"""
+
+_MARK_PASS_DETAILS_REVIEWED_SQL = """
+    UPDATE resident_pass_request_details
+    SET reviewed_by_user_id = %s,
+        reviewed_by_name = %s,
+        reviewed_at = %s,
+        updated_at = %s
+    WHERE pass_id = %s
+"""
+
+_DENY_PENDING_PASS_SQL = """
+    UPDATE resident_passes
+    SET status = %s,
+        approved_by = %s,
+        approved_at = %s,
+        updated_at = %s
+    WHERE id = %s
+      AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
+      AND LOWER(TRIM(status)) = 'pending'
+    RETURNING id
+"""
+
+_PASS_EXPECTED_BACK_SQL = """
+    SELECT end_at, end_date
+    FROM resident_passes
+    WHERE id = %s
+      AND resident_id = %s
+      AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
+    LIMIT 1
+"""
+
+_INSERT_PASS_CHECK_IN_EVENT_SQL = """
+    INSERT INTO attendance_events (
+        resident_id,
+        shelter,
+        event_type,
+        event_time,
+        staff_user_id,
+        note,
+        expected_back_time,
+        destination,
+        obligation_start_time,
+        obligation_end_time,
+        meeting_count,
+        meeting_1,
+        meeting_2,
+        is_recovery_meeting
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+_COMPLETE_APPROVED_PASS_SQL = """
+    UPDATE resident_passes
+    SET status = %s,
+        updated_at = %s,
+        delete_after_at = %s
+    WHERE id = %s
+      AND resident_id = %s
+      AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
+      AND LOWER(TRIM(status)) = 'approved'
+    RETURNING id
+"""
 
 
 def _clean_text(value: object) -> str:
@@ -46,50 +222,18 @@ def _safe_int(value: object) -> int | None:
 
 
 def _digits_only(value: object) -> str:
-    return "".join(ch for ch in str(value or "") if ch.isdigit())
+    return phone_digits(value)
 
 
 def _load_pass_status(pass_id: int, shelter: str, resident_id: int | None = None) -> str:
     if resident_id is None:
         row = db_fetchone(
-            _sql(
-                """
-                SELECT status
-                FROM resident_passes
-                WHERE id = %s
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
-                LIMIT 1
-                """,
-                """
-                SELECT status
-                FROM resident_passes
-                WHERE id = ?
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(?))
-                LIMIT 1
-                """,
-            ),
+            _PASS_STATUS_SQL,
             (pass_id, shelter),
         )
     else:
         row = db_fetchone(
-            _sql(
-                """
-                SELECT status
-                FROM resident_passes
-                WHERE id = %s
-                  AND resident_id = %s
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
-                LIMIT 1
-                """,
-                """
-                SELECT status
-                FROM resident_passes
-                WHERE id = ?
-                  AND resident_id = ?
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(?))
-                LIMIT 1
-                """,
-            ),
+            _RESIDENT_PASS_STATUS_SQL,
             (pass_id, resident_id, shelter),
         )
 
@@ -98,17 +242,20 @@ def _load_pass_status(pass_id: int, shelter: str, resident_id: int | None = None
 
 def _require_landed_status(
     *,
+    updated_row: dict[str, Any] | None,
     pass_id: int,
     shelter: str,
     expected_status: str,
     resident_id: int | None = None,
 ) -> None:
+    if updated_row:
+        return
+
     actual_status = _load_pass_status(pass_id, shelter, resident_id)
-    if actual_status != expected_status:
-        raise PassLifecycleTransitionError(
-            "Pass lifecycle transition failed "
-            f"pass_id={pass_id} expected_status={expected_status} actual_status={actual_status or 'missing'}"
-        )
+    raise PassLifecycleTransitionError(
+        "Pass lifecycle transition failed "
+        f"pass_id={pass_id} expected_status={expected_status} actual_status={actual_status or 'missing'}"
+    )
 
 
 def insert_resident_notification(
@@ -121,36 +268,7 @@ def insert_resident_notification(
     related_pass_id: int | None,
 ) -> None:
     db_execute(
-        _sql(
-            """
-            INSERT INTO resident_notifications (
-                resident_id,
-                shelter,
-                notification_type,
-                title,
-                message,
-                related_pass_id,
-                is_read,
-                created_at,
-                read_at
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, 0, %s, %s)
-            """,
-            """
-            INSERT INTO resident_notifications (
-                resident_id,
-                shelter,
-                notification_type,
-                title,
-                message,
-                related_pass_id,
-                is_read,
-                created_at,
-                read_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)
-            """,
-        ),
+        _INSERT_RESIDENT_NOTIFICATION_SQL,
         (
             resident_id,
             shelter,
@@ -166,20 +284,7 @@ def insert_resident_notification(
 
 def load_pass_for_review(pass_id: int, shelter: str) -> dict[str, Any] | None:
     row = db_fetchone(
-        _sql(
-            """
-            SELECT id, resident_id, shelter, status, pass_type, end_at, end_date
-            FROM resident_passes
-            WHERE id = %s AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
-            LIMIT 1
-            """,
-            """
-            SELECT id, resident_id, shelter, status, pass_type, end_at, end_date
-            FROM resident_passes
-            WHERE id = ? AND LOWER(TRIM(shelter)) = LOWER(TRIM(?))
-            LIMIT 1
-            """,
-        ),
+        _PASS_FOR_REVIEW_SQL,
         (pass_id, shelter),
     )
     return dict(row) if row else None
@@ -187,48 +292,7 @@ def load_pass_for_review(pass_id: int, shelter: str) -> dict[str, Any] | None:
 
 def load_pass_for_check_in(pass_id: int, shelter: str) -> dict[str, Any] | None:
     row = db_fetchone(
-        _sql(
-            """
-            SELECT
-                rp.id,
-                rp.resident_id,
-                rp.shelter,
-                rp.status,
-                rp.pass_type,
-                rp.start_at,
-                rp.end_at,
-                rp.start_date,
-                rp.end_date,
-                rp.destination,
-                r.first_name,
-                r.last_name
-            FROM resident_passes rp
-            JOIN residents r ON r.id = rp.resident_id
-            WHERE rp.id = %s
-              AND LOWER(TRIM(rp.shelter)) = LOWER(TRIM(%s))
-            LIMIT 1
-            """,
-            """
-            SELECT
-                rp.id,
-                rp.resident_id,
-                rp.shelter,
-                rp.status,
-                rp.pass_type,
-                rp.start_at,
-                rp.end_at,
-                rp.start_date,
-                rp.end_date,
-                rp.destination,
-                r.first_name,
-                r.last_name
-            FROM resident_passes rp
-            JOIN residents r ON r.id = rp.resident_id
-            WHERE rp.id = ?
-              AND LOWER(TRIM(rp.shelter)) = LOWER(TRIM(?))
-            LIMIT 1
-            """,
-        ),
+        _PASS_FOR_CHECK_IN_SQL,
         (pass_id, shelter),
     )
     return dict(row) if row else None
@@ -236,46 +300,7 @@ def load_pass_for_check_in(pass_id: int, shelter: str) -> dict[str, Any] | None:
 
 def load_pass_sms_context(pass_id: int, shelter: str) -> dict[str, Any] | None:
     row = db_fetchone(
-        _sql(
-            """
-            SELECT
-                rp.id,
-                rp.resident_id,
-                rp.pass_type,
-                rp.start_at,
-                rp.end_at,
-                rp.start_date,
-                rp.end_date,
-                r.first_name,
-                r.last_name,
-                d.resident_phone
-            FROM resident_passes rp
-            JOIN residents r ON r.id = rp.resident_id
-            LEFT JOIN resident_pass_request_details d ON d.pass_id = rp.id
-            WHERE rp.id = %s
-              AND LOWER(TRIM(rp.shelter)) = LOWER(TRIM(%s))
-            LIMIT 1
-            """,
-            """
-            SELECT
-                rp.id,
-                rp.resident_id,
-                rp.pass_type,
-                rp.start_at,
-                rp.end_at,
-                rp.start_date,
-                rp.end_date,
-                r.first_name,
-                r.last_name,
-                d.resident_phone
-            FROM resident_passes rp
-            JOIN residents r ON r.id = rp.resident_id
-            LEFT JOIN resident_pass_request_details d ON d.pass_id = rp.id
-            WHERE rp.id = ?
-              AND LOWER(TRIM(rp.shelter)) = LOWER(TRIM(?))
-            LIMIT 1
-            """,
-        ),
+        _PASS_SMS_CONTEXT_SQL,
         (pass_id, shelter),
     )
     return dict(row) if row else None
@@ -336,8 +361,13 @@ def build_approval_sms(pass_row: dict[str, Any]) -> str:
     return f"{pass_type_text} approved for {first_name}. Dates: {start_date} to {end_date}."
 
 
-def send_approval_sms_if_possible(pass_id: int, shelter: str) -> None:
-    sms_context = load_pass_sms_context(pass_id, shelter)
+def send_approval_sms_if_possible(
+    pass_id: int,
+    shelter: str,
+    sms_context: dict[str, Any] | None = None,
+) -> None:
+    if sms_context is None:
+        sms_context = load_pass_sms_context(pass_id, shelter)
     if not sms_context:
         return
 
@@ -345,15 +375,20 @@ def send_approval_sms_if_possible(pass_id: int, shelter: str) -> None:
     if len(_digits_only(phone)) < 10:
         return
 
-    try:
-        send_sms(phone, build_approval_sms(sms_context))
-    except Exception:
-        with contextlib.suppress(Exception):
-            current_app.logger.exception(
-                "pass approval sms failed pass_id=%s shelter=%s",
-                pass_id,
-                shelter,
-            )
+    message = build_approval_sms(sms_context)
+
+    def _send() -> None:
+        try:
+            send_sms(phone, message)
+        except Exception:
+            with contextlib.suppress(Exception):
+                current_app.logger.exception(
+                    "pass approval sms failed pass_id=%s shelter=%s",
+                    pass_id,
+                    shelter,
+                )
+
+    run_sms_in_background(_send)
 
 
 def apply_pass_approval(
@@ -373,34 +408,12 @@ def apply_pass_approval(
     )
 
     with db_transaction():
-        db_execute(
-            _sql(
-                """
-                UPDATE resident_passes
-                SET status = %s,
-                    approved_by = %s,
-                    approved_at = %s,
-                    delete_after_at = %s,
-                    updated_at = %s
-                WHERE id = %s
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
-                  AND LOWER(TRIM(status)) = 'pending'
-                """,
-                """
-                UPDATE resident_passes
-                SET status = ?,
-                    approved_by = ?,
-                    approved_at = ?,
-                    delete_after_at = ?,
-                    updated_at = ?
-                WHERE id = ?
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(?))
-                  AND LOWER(TRIM(status)) = 'pending'
-                """,
-            ),
+        updated_row = db_fetchone(
+            _APPROVE_PENDING_PASS_SQL,
             ("approved", staff_id, now_iso, delete_after_at, now_iso, pass_id, shelter),
         )
         _require_landed_status(
+            updated_row=updated_row,
             pass_id=pass_id,
             shelter=shelter,
             resident_id=resident_id,
@@ -408,24 +421,7 @@ def apply_pass_approval(
         )
 
         db_execute(
-            _sql(
-                """
-                UPDATE resident_pass_request_details
-                SET reviewed_by_user_id = %s,
-                    reviewed_by_name = %s,
-                    reviewed_at = %s,
-                    updated_at = %s
-                WHERE pass_id = %s
-                """,
-                """
-                UPDATE resident_pass_request_details
-                SET reviewed_by_user_id = ?,
-                    reviewed_by_name = ?,
-                    reviewed_at = ?,
-                    updated_at = ?
-                WHERE pass_id = ?
-                """,
-            ),
+            _MARK_PASS_DETAILS_REVIEWED_SQL,
             (staff_id, staff_name or None, now_iso, now_iso, pass_id),
         )
 
@@ -451,32 +447,12 @@ def apply_pass_denial(
     now_iso = utcnow_iso()
 
     with db_transaction():
-        db_execute(
-            _sql(
-                """
-                UPDATE resident_passes
-                SET status = %s,
-                    approved_by = %s,
-                    approved_at = %s,
-                    updated_at = %s
-                WHERE id = %s
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
-                  AND LOWER(TRIM(status)) = 'pending'
-                """,
-                """
-                UPDATE resident_passes
-                SET status = ?,
-                    approved_by = ?,
-                    approved_at = ?,
-                    updated_at = ?
-                WHERE id = ?
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(?))
-                  AND LOWER(TRIM(status)) = 'pending'
-                """,
-            ),
+        updated_row = db_fetchone(
+            _DENY_PENDING_PASS_SQL,
             ("denied", staff_id, now_iso, now_iso, pass_id, shelter),
         )
         _require_landed_status(
+            updated_row=updated_row,
             pass_id=pass_id,
             shelter=shelter,
             resident_id=resident_id,
@@ -484,24 +460,7 @@ def apply_pass_denial(
         )
 
         db_execute(
-            _sql(
-                """
-                UPDATE resident_pass_request_details
-                SET reviewed_by_user_id = %s,
-                    reviewed_by_name = %s,
-                    reviewed_at = %s,
-                    updated_at = %s
-                WHERE pass_id = %s
-                """,
-                """
-                UPDATE resident_pass_request_details
-                SET reviewed_by_user_id = ?,
-                    reviewed_by_name = ?,
-                    reviewed_at = ?,
-                    updated_at = ?
-                WHERE pass_id = ?
-                """,
-            ),
+            _MARK_PASS_DETAILS_REVIEWED_SQL,
             (staff_id, staff_name or None, now_iso, now_iso, pass_id),
         )
 
@@ -524,70 +483,14 @@ def apply_pass_check_in(
 ) -> None:
     with db_transaction():
         pass_row = db_fetchone(
-            _sql(
-                """
-                SELECT end_at, end_date
-                FROM resident_passes
-                WHERE id = %s
-                  AND resident_id = %s
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
-                LIMIT 1
-                """,
-                """
-                SELECT end_at, end_date
-                FROM resident_passes
-                WHERE id = ?
-                  AND resident_id = ?
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(?))
-                LIMIT 1
-                """,
-            ),
+            _PASS_EXPECTED_BACK_SQL,
             (pass_id, resident_id, shelter),
         )
         pass_row = dict(pass_row) if pass_row else None
         now_iso = utcnow_iso()
 
         db_execute(
-            _sql(
-                """
-                INSERT INTO attendance_events (
-                    resident_id,
-                    shelter,
-                    event_type,
-                    event_time,
-                    staff_user_id,
-                    note,
-                    expected_back_time,
-                    destination,
-                    obligation_start_time,
-                    obligation_end_time,
-                    meeting_count,
-                    meeting_1,
-                    meeting_2,
-                    is_recovery_meeting
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                """
-                INSERT INTO attendance_events (
-                    resident_id,
-                    shelter,
-                    event_type,
-                    event_time,
-                    staff_user_id,
-                    note,
-                    expected_back_time,
-                    destination,
-                    obligation_start_time,
-                    obligation_end_time,
-                    meeting_count,
-                    meeting_1,
-                    meeting_2,
-                    is_recovery_meeting
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-            ),
+            _INSERT_PASS_CHECK_IN_EVENT_SQL,
             (
                 resident_id,
                 shelter,
@@ -611,32 +514,12 @@ def apply_pass_check_in(
             pass_row.get("end_date") if pass_row else None,
         )
 
-        db_execute(
-            _sql(
-                """
-                UPDATE resident_passes
-                SET status = %s,
-                    updated_at = %s,
-                    delete_after_at = %s
-                WHERE id = %s
-                  AND resident_id = %s
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
-                  AND LOWER(TRIM(status)) = 'approved'
-                """,
-                """
-                UPDATE resident_passes
-                SET status = ?,
-                    updated_at = ?,
-                    delete_after_at = ?
-                WHERE id = ?
-                  AND resident_id = ?
-                  AND LOWER(TRIM(shelter)) = LOWER(TRIM(?))
-                  AND LOWER(TRIM(status)) = 'approved'
-                """,
-            ),
+        updated_row = db_fetchone(
+            _COMPLETE_APPROVED_PASS_SQL,
             ("completed", now_iso, delete_after_at, pass_id, resident_id, shelter),
         )
         _require_landed_status(
+            updated_row=updated_row,
             pass_id=pass_id,
             shelter=shelter,
             resident_id=resident_id,
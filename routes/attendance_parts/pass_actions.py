@@ -2,13 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
-from flask import abort, redirect, url_for
-
 from core.audit import log_action
-from core.db import db_fetchone
 from core.sh_events import safe_log_sh_event
 from core.sms_sender import send_sms as _send_sms
-from routes.attendance_parts.helpers import can_manage_passes
 from routes.attendance_parts.pass_action_helpers import (
     apply_pass_approval,
     apply_pass_check_in,
@@ -26,17 +22,6 @@ send_sms = _send_sms
 PassActionResponse = tuple[bool, str, str, str]
 
 
-def _require_pass_access() -> None:
-    if not can_manage_passes():
-        abort(403)
-
-
-def _redirect(target: str, pass_id: int | None = None):
-    if pass_id is not None:
-        return redirect(url_for(target, pass_id=pass_id), code=302)
-    return redirect(url_for(target), code=302)
-
-
 def _resident_id_or_none(value: Any) -> int | None:
     try:
         resident_id = int(value)
@@ -77,27 +62,6 @@ def _check_in_result(pass_row: Any) -> tuple[bool, int | None, str]:
     return True, resident_id, ""
 
 
-def _load_other_active_approved_pass(
-    *,
-    resident_id: int,
-    shelter: str,
-    current_pass_id: int,
-) -> dict[str, Any] | None:
-    return db_fetchone(
-        """
-        SELECT id, pass_type, start_at, end_at, start_date, end_date
-        FROM resident_passes
-        WHERE resident_id = %s
-          AND id <> %s
-          AND LOWER(TRIM(shelter)) = LOWER(TRIM(%s))
-          AND LOWER(TRIM(status)) = 'approved'
-        ORDER BY approved_at DESC, id DESC
-        LIMIT 1
-        """,
-        (resident_id, current_pass_id, shelter),
-    )
-
-
 # APPROVE
 
 
@@ -114,12 +78,8 @@ def approve_pass_request(
     if blocked:
         return False, "attendance.staff_pass_detail", "Resident has restriction.", "error"
 
-    active_pass = _load_other_active_approved_pass(
-        resident_id=resident_id,
-        shelter=shelter,
-        current_pass_id=pass_id,
-    )
-    if active_pass:
+    # The review row already carries the other-active-pass lookup.
+    if pass_row.get("other_active_pass_id"):
         return (
             False,
             "attendance.staff_passes_pending",
@@ -138,7 +98,7 @@ def approve_pass_request(
     )
 
     try:
-        send_approval_sms_if_possible(pass_id, shelter)
+        send_approval_sms_if_possible(pass_id, shelter, sms_context=pass_row)
     except Exception:
         from flask import current_app
 
@@ -12,7 +12,6 @@ from routes.attendance_parts.helpers import to_local
 from routes.attendance_parts.pass_policy import (
     build_policy_check,
     load_resident_pass_profile,
-    resident_value,
 )
 
 
@@ -176,8 +175,8 @@ def _resident_profile_summary(
     program_start_date = None
 
     if resident_profile:
-        resident_level = _clean_text(resident_value(resident_profile, "program_level", 2, ""))
-        program_start_date = resident_value(resident_profile, "date_entered", 8, None)
+        resident_level = _clean_text(resident_profile.get("program_level"))
+        program_start_date = resident_profile.get("date_entered")
 
     if pass_detail and pass_detail.get("resident_level"):
         resident_level = _clean_text(pass_detail.get("resident_level")) or resident_level
@@ -19,15 +19,6 @@ from core.pass_rules import (
 CHICAGO_TZ = ZoneInfo("America/Chicago")
 
 
-def resident_value(row, key: str, index: int, default=""):
-    if isinstance(row, dict):
-        return row.get(key, default)
-    try:
-        return row[index]
-    except Exception:
-        return default
-
-
 def load_resident_pass_profile(resident_id: int):
     return db_fetchone(
         """
@@ -203,7 +194,7 @@ def build_policy_check(
     if pass_detail and pass_detail.get("resident_level"):
         resident_level = str(pass_detail.get("resident_level") or "").strip()
     elif resident_profile:
-        resident_level = str(resident_value(resident_profile, "program_level", 2, "") or "").strip()
+        resident_level = str(resident_profile.get("program_level") or "").strip()
 
     shelter = str(pass_row.get("shelter") or "").strip()
     settings = load_pass_settings_for_shelter(shelter)
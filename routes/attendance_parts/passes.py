@@ -18,6 +18,7 @@ from routes.attendance_parts.pass_queries import (
     fetch_approved_pass_rows,
     fetch_current_pass_rows,
     fetch_expired_pass_rows,
+    fetch_open_approved_pass_rows,
     fetch_pending_pass_rows,
 )
 from routes.attendance_parts.pass_view_helpers import (
@@ -42,7 +43,6 @@ def staff_passes_pending_view():
         "staff_passes_pending.html",
         rows=processed,
         shelter=context.shelter,
-        fmt_dt=fmt_dt,
     )
 
 
@@ -55,7 +55,6 @@ def staff_passes_approved_view():
         "staff_passes_approved.html",
         rows=rows,
         shelter=context.shelter,
-        fmt_dt=fmt_dt,
     )
 
 
@@ -68,7 +67,6 @@ def staff_passes_away_now_view():
         "staff_passes_away_now.html",
         rows=rows,
         shelter=context.shelter,
-        fmt_dt=fmt_dt,
     )
 
 
@@ -76,8 +74,8 @@ def staff_passes_overdue_view():
     context = require_manage_passes_role()
 
     now_local = datetime.now(CHICAGO_TZ)
-    current_rows = fetch_current_pass_rows(context.shelter)
-    overdue_rows = filter_overdue_pass_rows(current_rows, now_local)
+    open_rows = fetch_open_approved_pass_rows(context.shelter)
+    overdue_rows = filter_overdue_pass_rows(open_rows, now_local)
     expired_rows = fetch_expired_pass_rows(context.shelter)
 
     return render_template(
@@ -85,7 +83,6 @@ def staff_passes_overdue_view():
         rows=overdue_rows,
         expired_rows=expired_rows,
         shelter=context.shelter,
-        fmt_dt=fmt_dt,
     )
 
 
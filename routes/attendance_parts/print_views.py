@@ -3,14 +3,49 @@ from __future__ import annotations
 import contextlib
 from datetime import UTC
 from typing import Any
-from zoneinfo import ZoneInfo
 
-from flask import abort, g, render_template, request, session
+from flask import abort, render_template, request, session
 
-from core.db import db_fetchall, db_fetchone
+from core.db import db_fetchall, db_fetchone, db_iterrows
 from core.helpers import fmt_dt, fmt_time_only, utcnow_iso
 from core.residents import has_active_pass
-from routes.attendance_parts.helpers import parse_dt
+from routes.attendance_parts.helpers import CHICAGO_TZ, parse_dt
+
+_RESIDENT_NAME_SQL = "SELECT first_name, last_name FROM residents WHERE id = %s AND shelter = %s"
+
+_TODAY_PRINT_ROWS_SQL = """
+    SELECT
+        r.id,
+        r.first_name,
+        r.last_name,
+        ae.event_type,
+        ae.event_time,
+        ae.expected_back_time,
+        ae.note,
+        su.username
+    FROM residents r
+    LEFT JOIN attendance_events ae
+        ON ae.id = (
+            SELECT ae2.id
+            FROM attendance_events ae2
+            WHERE ae2.resident_id = r.id
+              AND ae2.shelter = r.shelter
+            ORDER BY ae2.event_time DESC, ae2.id DESC
+            LIMIT 1
+        )
+    LEFT JOIN staff_users su
+        ON su.id = ae.staff_user_id
+    WHERE r.shelter = %s
+    ORDER BY r.last_name, r.first_name, r.id
+"""
+
+
+def _local_day(dt_iso: str) -> str:
+    # date().isoformat() skips strftime; the offset still follows DST per event.
+    try:
+        return parse_dt(dt_iso).replace(tzinfo=UTC).astimezone(CHICAGO_TZ).date().isoformat()
+    except Exception:
+        return dt_iso[:10]
 
 
 def staff_attendance_resident_print_view(resident_id: int):
@@ -19,18 +54,13 @@ def staff_attendance_resident_print_view(resident_id: int):
     start = (request.args.get("start") or "").strip()
     end = (request.args.get("end") or "").strip()
 
-    resident = db_fetchone(
-        "SELECT first_name, last_name FROM residents WHERE id = %s AND shelter = %s"
-        if g.get("db_kind") == "pg"
-        else "SELECT first_name, last_name FROM residents WHERE id = ? AND shelter = ?",
-        (resident_id, shelter),
-    )
+    resident = db_fetchone(_RESIDENT_NAME_SQL, (resident_id, shelter))
 
     if not resident:
         abort(404)
 
-    first = resident["first_name"] if isinstance(resident, dict) else resident[0]
-    last = resident["last_name"] if isinstance(resident, dict) else resident[1]
+    first = resident["first_name"]
+    last = resident["last_name"]
 
     resident_name = f"{last}, {first}"
 
@@ -38,18 +68,15 @@ def staff_attendance_resident_print_view(resident_id: int):
     date_filter = ""
 
     if start:
-        date_filter += (
-            " AND ae.event_time >= %s" if g.get("db_kind") == "pg" else " AND ae.event_time >= ?"
-        )
+        date_filter += " AND ae.event_time >= %s"
         params.append(start + "T00:00:00")
 
     if end:
-        date_filter += (
-            " AND ae.event_time <= %s" if g.get("db_kind") == "pg" else " AND ae.event_time <= ?"
-        )
+        date_filter += " AND ae.event_time <= %s"
         params.append(end + "T23:59:59")
 
-    events_raw = db_fetchall(
+    # Events collapse into trips as they arrive, so stream instead of buffering them all.
+    events_raw = db_iterrows(
         f"""
         SELECT
             ae.event_type,
@@ -59,30 +86,23 @@ def staff_attendance_resident_print_view(resident_id: int):
             su.username
         FROM attendance_events ae
         LEFT JOIN staff_users su ON su.id = ae.staff_user_id
-        WHERE ae.resident_id = {"%s" if g.get("db_kind") == "pg" else "?"}
-        AND ae.shelter = {"%s" if g.get("db_kind") == "pg" else "?"}
+        WHERE ae.resident_id = %s
+        AND ae.shelter = %s
         {date_filter}
         ORDER BY ae.event_time ASC, ae.id ASC
         """,
         tuple(params),
     )
 
-    def local_day(dt_iso):
-        try:
-            dt = parse_dt(dt_iso).replace(tzinfo=UTC)
-            return dt.astimezone(ZoneInfo("America/Chicago")).strftime("%Y-%m-%d")
-        except Exception:
-            return dt_iso[:10]
-
     events = []
     last_checkout = None
 
     for e in events_raw:
-        event_type = e["event_type"] if isinstance(e, dict) else e[0]
-        event_time = e["event_time"] if isinstance(e, dict) else e[1]
-        note = e["note"] if isinstance(e, dict) else e[2]
-        expected_back = e["expected_back_time"] if isinstance(e, dict) else e[3]
-        staff = e["username"] if isinstance(e, dict) else e[4]
+        event_type = e["event_type"]
+        event_time = e["event_time"]
+        note = e["note"]
+        expected_back = e["expected_back_time"]
+        staff = e["username"]
 
         if event_type == "check_out":
             last_checkout = {
@@ -101,7 +121,7 @@ def staff_attendance_resident_print_view(resident_id: int):
 
             events.append(
                 {
-                    "date": local_day(event_time),
+                    "date": _local_day(event_time),
                     "checked_out_at": last_checkout["checked_out_at"],
                     "expected_back_at": last_checkout["expected_back_at"],
                     "checked_in_at": event_time,
@@ -130,72 +150,19 @@ def staff_attendance_resident_print_view(resident_id: int):
 def staff_attendance_print_today_view():
     shelter = session["shelter"]
 
-    rows = db_fetchall(
-        """
-        SELECT
-            r.id,
-            r.first_name,
-            r.last_name,
-            ae.event_type,
-            ae.event_time,
-            ae.expected_back_time,
-            ae.note,
-            su.username
-        FROM residents r
-        LEFT JOIN attendance_events ae
-            ON ae.id = (
-                SELECT ae2.id
-                FROM attendance_events ae2
-                WHERE ae2.resident_id = r.id
-                  AND ae2.shelter = r.shelter
-                ORDER BY ae2.event_time DESC, ae2.id DESC
-                LIMIT 1
-            )
-        LEFT JOIN staff_users su
-            ON su.id = ae.staff_user_id
-        WHERE r.shelter = %s
-        ORDER BY r.last_name, r.first_name, r.id
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        SELECT
-            r.id,
-            r.first_name,
-            r.last_name,
-            ae.event_type,
-            ae.event_time,
-            ae.expected_back_time,
-            ae.note,
-            su.username
-        FROM residents r
-        LEFT JOIN attendance_events ae
-            ON ae.id = (
-                SELECT ae2.id
-                FROM attendance_events ae2
-                WHERE ae2.resident_id = r.id
-                  AND ae2.shelter = r.shelter
-                ORDER BY ae2.event_time DESC, ae2.id DESC
-                LIMIT 1
-            )
-        LEFT JOIN staff_users su
-            ON su.id = ae.staff_user_id
-        WHERE r.shelter = ?
-        ORDER BY r.last_name, r.first_name, r.id
-        """,
-        (shelter,),
-    )
+    rows = db_fetchall(_TODAY_PRINT_ROWS_SQL, (shelter,))
 
     residents: list[dict[str, Any]] = []
 
     for r in rows:
-        rid = r["id"] if isinstance(r, dict) else r[0]
-        first = r["first_name"] if isinstance(r, dict) else r[1]
-        last = r["last_name"] if isinstance(r, dict) else r[2]
-        event_type = r["event_type"] if isinstance(r, dict) else r[3]
-        event_time = r["event_time"] if isinstance(r, dict) else r[4]
-        expected = r["expected_back_time"] if isinstance(r, dict) else r[5]
-        note = r["note"] if isinstance(r, dict) else r[6]
-        staff = r["username"] if isinstance(r, dict) else r[7]
+        rid = r["id"]
+        first = r["first_name"]
+        last = r["last_name"]
+        event_type = r["event_type"]
+        event_time = r["event_time"]
+        expected = r["expected_back_time"]
+        note = r["note"]
+        staff = r["username"]
 
         residents.append(
             {
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
-from flask import Blueprint, flash, g, redirect, render_template, request, session, url_for
-from werkzeug.security import check_password_hash, generate_password_hash
+import secrets
+from functools import lru_cache
+
+from flask import (
+    Blueprint,
+    current_app,
+    flash,
+    g,
+    redirect,
+    render_template,
+    request,
+    session,
+    url_for,
+)
+from werkzeug.security import check_password_hash
 
 from core.audit import log_action
 from core.auth import require_login, require_shelter
 from core.db import db_execute, db_fetchall, db_fetchone
+from core.passwords import hash_password, password_needs_rehash
 from core.rate_limit import (
     ban_ip,
     get_key_lock_seconds_remaining,
@@ -16,9 +30,15 @@ from core.rate_limit import (
     lock_key,
 )
 from core.runtime import get_all_shelters, get_client_ip
+from core.staff_user_cache import clear_user_list_cache
 
 auth = Blueprint("auth", __name__)
 
+_STAFF_USER_BY_USERNAME_SQL = "SELECT * FROM staff_users WHERE LOWER(username) = %s LIMIT 1"
+_STAFF_SHELTER_ASSIGNMENTS_SQL = (
+    "SELECT shelter FROM staff_shelter_assignments WHERE staff_user_id = %s ORDER BY shelter"
+)
+
 
 def _safe_log_value(value: str | None, max_length: int = 80) -> str:
     text = (value or "").strip()
@@ -28,6 +48,11 @@ def _safe_log_value(value: str | None, max_length: int = 80) -> str:
     return text[:max_length]
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    return hash_password(secrets.token_urlsafe(32))
+
+
 def _db_sql(pg_sql: str, sqlite_sql: str) -> str:
     return pg_sql if g.get("db_kind") == "pg" else sqlite_sql
 
@@ -116,14 +141,24 @@ def _record_failed_login_attempt(
 
 def _load_staff_user_by_username(normalized_username: str):
     return db_fetchone(
-        _db_sql(
-            "SELECT * FROM staff_users WHERE LOWER(username) = %s",
-            "SELECT * FROM staff_users WHERE LOWER(username) = ?",
-        ),
+        _STAFF_USER_BY_USERNAME_SQL,
         (normalized_username,),
     )
 
 
+def _upgrade_password_hash(staff_user_id: int, pw_hash: str, password: str) -> None:
+    if not password_needs_rehash(pw_hash):
+        return
+
+    try:
+        db_execute(
+            "UPDATE staff_users SET password_hash = %s WHERE id = %s AND password_hash = %s",
+            (hash_password(password), staff_user_id, pw_hash),
+        )
+    except Exception:
+        current_app.logger.exception("password hash upgrade failed staff_user_id=%s", staff_user_id)
+
+
 def _load_allowed_shelters_for_user(
     *,
     staff_user_id: int,
@@ -135,10 +170,7 @@ def _load_allowed_shelters_for_user(
         return list(all_shelters_lower)
 
     shelter_rows = db_fetchall(
-        _db_sql(
-            "SELECT shelter FROM staff_shelter_assignments WHERE staff_user_id = %s ORDER BY shelter",
-            "SELECT shelter FROM staff_shelter_assignments WHERE staff_user_id = ? ORDER BY shelter",
-        ),
+        _STAFF_SHELTER_ASSIGNMENTS_SQL,
         (staff_user_id,),
     )
 
@@ -146,7 +178,7 @@ def _load_allowed_shelters_for_user(
     seen: set[str] = set()
 
     for shelter_row in shelter_rows:
-        shelter_name = shelter_row["shelter"] if isinstance(shelter_row, dict) else shelter_row[0]
+        shelter_name = shelter_row["shelter"]
         shelter_name = (shelter_name or "").strip().lower()
 
         if shelter_name and shelter_name in all_shelters_lower_set and shelter_name not in seen:
@@ -242,6 +274,8 @@ def staff_login():
     row = _load_staff_user_by_username(normalized_username)
 
     if not row:
+        # Hash anyway so unknown usernames take as long as wrong passwords.
+        check_password_hash(_dummy_password_hash(), password)
         _record_failed_login_attempt(
             ip=ip,
             normalized_username=normalized_username,
@@ -263,13 +297,15 @@ def staff_login():
         flash("Invalid login.", "error")
         return _render_staff_login(all_shelters, 401)
 
-    staff_user_id = row["id"] if isinstance(row, dict) else row[0]
-    staff_username = row["username"] if isinstance(row, dict) else row[1]
-    pw_hash = row["password_hash"] if isinstance(row, dict) else row[2]
-    staff_role = row["role"] if isinstance(row, dict) else row[3]
-    is_active = bool(row["is_active"] if isinstance(row, dict) else row[4])
+    staff_user_id = row["id"]
+    staff_username = row["username"]
+    pw_hash = row["password_hash"]
+    staff_role = row["role"]
+    is_active = bool(row["is_active"])
 
-    if not is_active or not check_password_hash(pw_hash, password):
+    password_ok = check_password_hash(pw_hash, password)
+
+    if not is_active or not password_ok:
         _record_failed_login_attempt(
             ip=ip,
             normalized_username=normalized_username,
@@ -291,6 +327,8 @@ def staff_login():
         flash("Invalid login.", "error")
         return _render_staff_login(all_shelters, 401)
 
+    _upgrade_password_hash(staff_user_id, pw_hash, password)
+
     allowed_shelters = _load_allowed_shelters_for_user(
         staff_user_id=staff_user_id,
         staff_role=staff_role,
@@ -462,6 +500,7 @@ def staff_profile():
             ),
             (first_name, last_name, email, mobile_phone, staff_id),
         )
+        clear_user_list_cache()
 
         if password:
             db_execute(
@@ -469,7 +508,7 @@ def staff_profile():
                     "UPDATE staff_users SET password_hash=%s WHERE id=%s",
                     "UPDATE staff_users SET password_hash=? WHERE id=?",
                 ),
-                (generate_password_hash(password), staff_id),
+                (hash_password(password), staff_id),
             )
 
         log_action(
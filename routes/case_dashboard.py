@@ -261,7 +261,7 @@ def dashboard():
         SELECT COUNT(*) AS count
         FROM transport_requests
         WHERE status = {placeholder}
-          AND LOWER(TRIM(shelter)) = LOWER(TRIM({placeholder}))
+          AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM({placeholder}))
         """,
         ("pending", shelter),
     )
@@ -16,7 +16,14 @@ from core.kiosk_activity_categories import (
     load_kiosk_activity_categories_for_shelter,
 )
 from core.kiosk_service import handle_checkin, handle_checkout
-from core.runtime import get_all_shelters, get_client_ip, init_db
+from core.rate_limit import (
+    get_key_lock_seconds_remaining,
+    is_key_locked,
+    is_rate_limited,
+    lock_key,
+)
+from core.runtime import get_all_shelters, get_client_ip
+from core.ttl_cache import TTLCache
 
 kiosk = Blueprint("kiosk", __name__)
 
@@ -28,6 +35,9 @@ LEGACY_ACTIVITY_LABEL_TO_PARENT_ACTIVITY_KEY = {
     "legal obligation": "legal",
 }
 
+# Every kiosk tap resolves its shelter slug; the shelter list rarely changes.
+_SHELTER_LOOKUP_CACHE = TTLCache(ttl_seconds=60.0, maxsize=8)
+
 
 def _kiosk_enabled() -> bool:
     row = db_fetchone("SELECT kiosk_intake_enabled FROM security_settings ORDER BY id ASC LIMIT 1")
@@ -36,12 +46,20 @@ def _kiosk_enabled() -> bool:
     return bool(row.get("kiosk_intake_enabled"))
 
 
+def _load_shelter_lookup() -> dict[str, str]:
+    lookup: dict[str, str] = {}
+    for name in get_all_shelters():
+        lookup.setdefault(str(name or "").strip().lower(), name)
+    return lookup
+
+
 def _resolve_shelter_or_404(shelter: str) -> str | None:
     normalized = (shelter or "").strip().lower()
-    return next(
-        (name for name in get_all_shelters() if str(name or "").strip().lower() == normalized),
-        None,
+    lookup = _SHELTER_LOOKUP_CACHE.get_or_load(
+        current_app.config.get("DATABASE_URL"),
+        _load_shelter_lookup,
     )
+    return lookup.get(normalized)
 
 
 def _normalized_checkout_category_row(row: dict[str, Any]) -> dict[str, Any] | None:
@@ -374,8 +392,6 @@ def _log_kiosk_failure(
 
 @kiosk.route("/kiosk/<shelter>")
 def kiosk_home(shelter: str):
-    init_db()
-
     matched_shelter = _resolve_shelter_or_404(shelter)
     if not matched_shelter:
         return _invalid_shelter_response()
@@ -400,15 +416,6 @@ def kiosk_home(shelter: str):
 
 @kiosk.route("/kiosk/<shelter>/checkin", methods=["GET", "POST"])
 def kiosk_checkin(shelter: str):
-    from core.rate_limit import (
-        get_key_lock_seconds_remaining,
-        is_key_locked,
-        is_rate_limited,
-        lock_key,
-    )
-
-    init_db()
-
     matched_shelter = _resolve_shelter_or_404(shelter)
     if not matched_shelter:
         return _invalid_shelter_response()
@@ -565,15 +572,6 @@ def kiosk_checkin(shelter: str):
 
 @kiosk.route("/kiosk/<shelter>/checkout", methods=["GET", "POST"])
 def kiosk_checkout(shelter: str):
-    from core.rate_limit import (
-        get_key_lock_seconds_remaining,
-        is_key_locked,
-        is_rate_limited,
-        lock_key,
-    )
-
-    init_db()
-
     matched_shelter = _resolve_shelter_or_404(shelter)
     if not matched_shelter:
         return _invalid_shelter_response()
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from flask import flash, g, redirect, render_template, request, session, url_for
+from flask import flash, redirect, render_template, request, session, url_for
 
 from core.audit import log_action
-from core.db import db_execute
+from core.db import db_execute, db_kind
 from core.helpers import utcnow_iso
 from core.rate_limit import is_rate_limited
-from core.runtime import init_db
 
 # Resident SMS consent flows
 #
@@ -79,8 +78,6 @@ def sms_consent_view():
 
 
 def resident_consent_view():
-    init_db()
-
     next_url = _safe_next_url(request.args.get("next") or request.form.get("next") or "")
 
     resident_id = session.get("resident_id")
@@ -106,7 +103,7 @@ def resident_consent_view():
         return render_template("resident_consent.html", next=next_url), 400
 
     now = utcnow_iso()
-    kind = g.get("db_kind")
+    kind = db_kind()
 
     if choice == "accept":
         session["sms_consent_done"] = True
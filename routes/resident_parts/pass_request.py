@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from flask import flash, redirect, render_template, url_for
+from flask import flash, redirect, render_template, request, url_for
 
 from core.access import require_resident
 from core.audit import log_action
@@ -11,7 +11,6 @@ from core.pass_rules import (
     use_gh_pass_form,
 )
 from core.rate_limit import is_rate_limited
-from core.runtime import init_db
 from routes.resident_parts.pass_request_helpers import (
     extract_pass_form_data,
     flash_pass_request_restriction_if_blocked,
@@ -24,8 +23,6 @@ from routes.resident_parts.pass_request_helpers import (
 
 
 def _client_ip() -> str:
-    from flask import request
-
     return (request.remote_addr or "").strip() or "unknown"
 
 
@@ -94,8 +91,6 @@ def _render_rate_limited_form(*, context, form):
 def resident_pass_request_view():
     @require_resident
     def _inner():
-        init_db()
-
         context = load_pass_request_context()
         if not context:
             return _redirect_resident_signin("Resident session is invalid. Please sign in again.")
@@ -103,8 +98,6 @@ def resident_pass_request_view():
         if flash_pass_request_restriction_if_blocked(context.resident_id):
             return redirect(url_for("resident_portal.home"))
 
-        from flask import request
-
         if request.method == "GET":
             return _render_pass_form(
                 shelter=context.shelter,
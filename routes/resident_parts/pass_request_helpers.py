@@ -7,7 +7,7 @@ from datetime import UTC, date, datetime
 from flask import current_app, flash, g, request, session
 
 from core.attendance_hours import calculate_prior_week_attendance_hours
-from core.db import db_fetchall, db_fetchone, db_transaction, get_db
+from core.db import db_execute, db_fetchall, db_fetchone, db_transaction
 from core.helpers import utcnow_iso
 from core.pass_rules import CHICAGO_TZ, is_late_standard_pass_request
 from core.phone_numbers import normalize_optional_phone_10, phone_has_value
@@ -130,15 +130,6 @@ def load_resident_profile(resident_id: int):
     )
 
 
-def resident_value(row, key: str, index: int, default=""):
-    if isinstance(row, dict):
-        return row.get(key, default)
-    try:
-        return row[index]
-    except Exception:
-        return default
-
-
 def load_active_writeup_restrictions(resident_id: int) -> list[dict]:
     rows = db_fetchall(
         """
@@ -232,8 +223,8 @@ def load_pass_request_context() -> PassRequestContext | None:
     if not resident_row:
         return None
 
-    resident_level = (resident_value(resident_row, "program_level", 2, "") or "").strip()
-    resident_phone_from_db = (resident_value(resident_row, "phone", 3, "") or "").strip()
+    resident_level = (resident_row.get("program_level") or "").strip()
+    resident_phone_from_db = (resident_row.get("phone") or "").strip()
 
     hour_summary = None
     if shelter:
@@ -468,103 +459,56 @@ def validate_pass_request_form(
     )
 
 
-def pass_insert_sql(kind: str) -> str:
-    if kind == "pg":
-        return """
-            INSERT INTO resident_passes (
-                resident_id,
-                shelter,
-                pass_type,
-                status,
-                start_at,
-                end_at,
-                start_date,
-                end_date,
-                destination,
-                reason,
-                resident_notes,
-                staff_notes,
-                approved_by,
-                approved_at,
-                created_at,
-                updated_at
-            )
-            VALUES (%s, %s, %s, 'pending', %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """
-    return """
-        INSERT INTO resident_passes (
-            resident_id,
-            shelter,
-            pass_type,
-            status,
-            start_at,
-            end_at,
-            start_date,
-            end_date,
-            destination,
-            reason,
-            resident_notes,
-            staff_notes,
-            approved_by,
-            approved_at,
-            created_at,
-            updated_at
-        )
-        VALUES (?, ?, ?, 'pending', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """
-
-
-def pass_detail_insert_sql(kind: str) -> str:
-    if kind == "pg":
-        return """
-            INSERT INTO resident_pass_request_details (
-                pass_id,
-                resident_phone,
-                request_date,
-                resident_level,
-                requirements_acknowledged,
-                requirements_not_met_explanation,
-                reason_for_request,
-                who_with,
-                destination_address,
-                destination_phone,
-                companion_names,
-                companion_phone_numbers,
-                budgeted_amount,
-                approved_amount,
-                reviewed_by_user_id,
-                reviewed_by_name,
-                reviewed_at,
-                created_at,
-                updated_at
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-    return """
-        INSERT INTO resident_pass_request_details (
-            pass_id,
-            resident_phone,
-            request_date,
-            resident_level,
-            requirements_acknowledged,
-            requirements_not_met_explanation,
-            reason_for_request,
-            who_with,
-            destination_address,
-            destination_phone,
-            companion_names,
-            companion_phone_numbers,
-            budgeted_amount,
-            approved_amount,
-            reviewed_by_user_id,
-            reviewed_by_name,
-            reviewed_at,
-            created_at,
-            updated_at
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """
+PASS_INSERT_SQL = """
+    INSERT INTO resident_passes (
+        resident_id,
+        shelter,
+        pass_type,
+        status,
+        start_at,
+        end_at,
+        start_date,
+        end_date,
+        destination,
+        reason,
+        resident_notes,
+        staff_notes,
+        approved_by,
+        approved_at,
+        created_at,
+        updated_at
+    )
+    VALUES (
+        %s, %s, %s, 'pending', %s, %s, %s, %s, %s,
+        NULLIF(%s, ''), NULLIF(%s, ''), %s, %s, %s, %s, %s
+    )
+    RETURNING id
+"""
+
+PASS_DETAIL_INSERT_SQL = """
+    INSERT INTO resident_pass_request_details (
+        pass_id,
+        resident_phone,
+        request_date,
+        resident_level,
+        requirements_acknowledged,
+        requirements_not_met_explanation,
+        reason_for_request,
+        who_with,
+        destination_address,
+        destination_phone,
+        companion_names,
+        companion_phone_numbers,
+        budgeted_amount,
+        approved_amount,
+        reviewed_by_user_id,
+        reviewed_by_name,
+        reviewed_at,
+        created_at,
+        updated_at
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
 
 
 def insert_pass_request(
@@ -573,7 +517,6 @@ def insert_pass_request(
     form: PassRequestFormData,
     validation: PassRequestValidationResult,
 ) -> int:
-    kind = g.get("db_kind")
     now_iso = utcnow_iso()
 
     final_reason = form.special_reason if form.pass_type == "special" else form.reason
@@ -590,8 +533,8 @@ def insert_pass_request(
         validation.start_date_iso,
         validation.end_date_iso,
         form.destination,
-        final_reason or None,
-        form.resident_notes or None,
+        final_reason,
+        form.resident_notes,
         staff_notes,
         None,
         None,
@@ -600,38 +543,33 @@ def insert_pass_request(
     )
 
     with db_transaction():
-        conn = get_db()
-        cur = conn.cursor()
-        try:
-            cur.execute(pass_insert_sql(kind), pass_params)
-            req_id = cur.fetchone()[0] if kind == "pg" else cur.lastrowid
-
-            detail_params = (
-                req_id,
-                form.resident_phone or None,
-                form.request_date or None,
-                context.resident_level or None,
-                form.requirements_acknowledged or None,
-                form.requirements_not_met_explanation or None,
-                final_reason or None,
-                form.who_with or None,
-                form.destination_address or None,
-                form.destination_phone or None,
-                form.companion_names or None,
-                form.companion_phone_numbers or None,
-                form.budgeted_amount or None,
-                None,
-                None,
-                None,
-                None,
-                now_iso,
-                now_iso,
-            )
-            cur.execute(pass_detail_insert_sql(kind), detail_params)
-        finally:
-            cur.close()
+        row = db_fetchone(PASS_INSERT_SQL, pass_params)
+        req_id = int(row["id"])
+
+        detail_params = (
+            req_id,
+            form.resident_phone or None,
+            form.request_date or None,
+            context.resident_level or None,
+            form.requirements_acknowledged or None,
+            form.requirements_not_met_explanation or None,
+            final_reason or None,
+            form.who_with or None,
+            form.destination_address or None,
+            form.destination_phone or None,
+            form.companion_names or None,
+            form.companion_phone_numbers or None,
+            form.budgeted_amount or None,
+            None,
+            None,
+            None,
+            None,
+            now_iso,
+            now_iso,
+        )
+        db_execute(PASS_DETAIL_INSERT_SQL, detail_params)
 
-    return int(req_id)
+    return req_id
 
 
 def log_pass_insert_failure(
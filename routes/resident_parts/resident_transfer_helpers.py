@@ -355,7 +355,7 @@ def load_resident_transfer_context(
 
     resident = db_fetchone(
         """
-        SELECT *
+        SELECT id, resident_identifier, first_name, last_name, shelter, program_level
         FROM residents
         WHERE id = %s
           AND LOWER(COALESCE(shelter, '')) = %s
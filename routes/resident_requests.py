@@ -19,11 +19,9 @@ from flask import (
 from core.access import require_resident
 from core.audit import log_action
 from core.db import db_fetchone
-from core.helpers import utcnow_iso
 from core.phone_numbers import normalize_optional_phone_10, phone_has_value
 from core.rate_limit import is_rate_limited
 from core.residents import resident_session_start
-from core.runtime import init_db
 from routes.resident_parts.consent import (
     resident_consent_view,
     sms_consent_view,
@@ -69,21 +67,27 @@ def _signin_next_url() -> str:
 def _load_resident_by_code(resident_code: str):
     return db_fetchone(
         _db_sql(
-            "SELECT * FROM residents WHERE resident_code = %s",
-            "SELECT * FROM residents WHERE resident_code = ?",
+            "SELECT * FROM residents WHERE resident_code = %s LIMIT 1",
+            "SELECT * FROM residents WHERE resident_code = ? LIMIT 1",
         ),
         (resident_code,),
     )
 
 
-def _parse_transport_needed_at(needed_raw: str) -> tuple[datetime | None, str | None]:
+def _parse_transport_needed_at(
+    needed_raw: str,
+    now_utc: datetime | None = None,
+) -> tuple[datetime | None, str | None]:
     try:
         needed_local = _parse_dt(needed_raw)
         needed_dt = needed_local.replace(tzinfo=CHICAGO_TZ).astimezone(UTC).replace(tzinfo=None)
     except Exception:
         return None, "Invalid needed date or time."
 
-    if needed_dt < datetime.now(UTC).replace(tzinfo=None) - timedelta(minutes=1):
+    if now_utc is None:
+        now_utc = datetime.now(UTC).replace(tzinfo=None)
+
+    if needed_dt < now_utc - timedelta(minutes=1):
         return None, "Needed time cannot be in the past."
 
     return needed_dt, None
@@ -98,8 +102,8 @@ def _insert_transport_request(
     needed_iso: str,
     pickup_location: str,
     destination: str,
-    reason: str | None,
-    resident_notes: str | None,
+    reason: str,
+    resident_notes: str,
     callback_phone: str | None,
     submitted_at: str,
 ) -> int:
@@ -119,7 +123,7 @@ def _insert_transport_request(
             status,
             submitted_at
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        VALUES (?, ?, ?, ?, ?, ?, ?, NULLIF(?, ''), NULLIF(?, ''), ?, ?, ?)
         RETURNING id
         """,
         (
@@ -151,8 +155,6 @@ def _resident_transport_session_context() -> dict[str, str]:
 
 @resident_requests.route("/resident", methods=["GET", "POST"])
 def resident_signin():
-    init_db()
-
     next_url = _signin_next_url()
 
     if request.method == "GET":
@@ -188,7 +190,7 @@ def resident_signin():
         flash("Invalid Resident Code.", "error")
         return render_template("resident_signin.html", next=next_url), 401
 
-    shelter = ((row.get("shelter") if isinstance(row, dict) else row[1]) or "").strip()
+    shelter = (row.get("shelter") or "").strip()
 
     session.clear()
     resident_session_start(row, shelter, resident_code)
@@ -227,8 +229,6 @@ def resident_pass_request():
 @resident_requests.route("/transport", methods=["GET", "POST"])
 @require_resident
 def resident_transport():
-    init_db()
-
     resident_context = _resident_transport_session_context()
     shelter = resident_context["shelter"]
 
@@ -264,9 +264,12 @@ def resident_transport():
     if phone_has_value(callback_phone_raw) and not callback_phone:
         errors.append("Call back phone must be exactly 10 digits.")
 
+    # One clock read serves both the past-time check and submitted_at.
+    now_utc = datetime.now(UTC).replace(tzinfo=None, microsecond=0)
+
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", DeprecationWarning)
-        needed_dt, needed_error = _parse_transport_needed_at(needed_raw)
+        needed_dt, needed_error = _parse_transport_needed_at(needed_raw, now_utc)
 
     if needed_error:
         errors.append(needed_error)
@@ -277,7 +280,7 @@ def resident_transport():
         return render_template("resident_transport.html", shelter=shelter), 400
 
     needed_iso = needed_dt.replace(microsecond=0).isoformat()
-    submitted_at = utcnow_iso()
+    submitted_at = now_utc.isoformat()
 
     req_id = _insert_transport_request(
         shelter=shelter,
@@ -287,8 +290,8 @@ def resident_transport():
         needed_iso=needed_iso,
         pickup_location=pickup_location,
         destination=destination,
-        reason=reason or None,
-        resident_notes=resident_notes or None,
+        reason=reason,
+        resident_notes=resident_notes,
         callback_phone=callback_phone,
         submitted_at=submitted_at,
     )
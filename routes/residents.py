@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from flask import (
@@ -17,7 +18,7 @@ from core.audit import log_action
 from core.auth import require_login, require_shelter
 from core.db import DbRow, db_execute, db_fetchall, db_fetchone
 from core.helpers import utcnow_iso
-from core.runtime import get_all_shelters, init_db
+from core.runtime import get_all_shelters
 from routes.resident_parts.resident_profile import edit_resident_profile_view
 from routes.resident_parts.resident_transfer_helpers import (
     apply_cross_shelter_transfer,
@@ -34,6 +35,11 @@ from routes.resident_parts.resident_transfer_helpers import (
 
 residents = Blueprint("residents", __name__)
 
+RESIDENTS_PAGE_SIZE = 50
+RESIDENTS_PAGE_SIZE_MAX = 200
+SHELTER_VALUES_NORMALIZED_KEY = "residents_shelter_values_normalized_url"
+ACTIVE_FLAG_VALUES = frozenset({"0", "1"})
+
 
 def _require_staff_or_admin() -> bool:
     return session.get("role") in {"admin", "shelter_director", "staff", "case_manager", "ra"}
@@ -84,25 +90,39 @@ def _staff_user_id() -> int | None:
         return None
 
 
-def _resident_scope_sql(include_inactive: bool) -> str:
-    if include_inactive:
-        return """
-            SELECT *
-            FROM residents
-            WHERE LOWER(COALESCE(shelter, '')) = %s
-            ORDER BY is_active DESC, last_name ASC, first_name ASC
-        """
+# Only four shapes exist; build each once so every request reuses the same SQL string.
+@lru_cache(maxsize=4)
+def _resident_scope_sql(include_inactive: bool, *, keyset: bool = False) -> str:
+    filters = ["LOWER(COALESCE(shelter, '')) = %s"]
 
-    return """
-        SELECT *
+    if include_inactive:
+        order_by = "is_active DESC, last_name ASC, first_name ASC, id ASC"
+        if keyset:
+            filters.append(
+                "(is_active < %s"
+                " OR (is_active = %s AND (last_name, first_name, id) > (%s, %s, %s)))"
+            )
+    else:
+        filters.append("is_active = TRUE")
+        order_by = "last_name ASC, first_name ASC, id ASC"
+        if keyset:
+            filters.append("(last_name, first_name, id) > (%s, %s, %s)")
+
+    return f"""
+        SELECT id, first_name, last_name, resident_code, is_active
         FROM residents
-        WHERE LOWER(COALESCE(shelter, '')) = %s
-          AND is_active = TRUE
-        ORDER BY last_name ASC, first_name ASC
+        WHERE {" AND ".join(filters)}
+        ORDER BY {order_by}
+        LIMIT %s
     """
 
 
 def _normalize_all_shelter_values() -> None:
+    # Legacy rows only need rewriting once per database, not on every request.
+    database_url = current_app.config.get("DATABASE_URL")
+    if current_app.extensions.get(SHELTER_VALUES_NORMALIZED_KEY) == database_url:
+        return
+
     updates = [
         ("residents", "shelter"),
         ("program_enrollments", "shelter"),
@@ -114,6 +134,7 @@ def _normalize_all_shelter_values() -> None:
         ("audit_log", "shelter"),
     ]
 
+    all_normalized = True
     for table_name, column_name in updates:
         try:
             db_execute(
@@ -130,6 +151,10 @@ def _normalize_all_shelter_values() -> None:
                 table_name,
                 column_name,
             )
+            all_normalized = False
+
+    if all_normalized:
+        current_app.extensions[SHELTER_VALUES_NORMALIZED_KEY] = database_url
 
 
 def _ensure_rent_sheet_for_shelter(shelter: str) -> None:
@@ -159,22 +184,66 @@ def _build_transfer_render_context(context) -> dict[str, Any]:
     }
 
 
-def _load_resident_rows(*, shelter: str, show: str) -> list[DbRow]:
+def _resident_page_size(raw_value: str | None) -> int:
+    try:
+        page_size = int(raw_value or RESIDENTS_PAGE_SIZE)
+    except (TypeError, ValueError):
+        return RESIDENTS_PAGE_SIZE
+    return min(max(page_size, 1), RESIDENTS_PAGE_SIZE_MAX)
+
+
+def _resident_page_cursor(args) -> dict[str, Any] | None:
+    try:
+        after_id = int(args.get("after_id") or "")
+    except ValueError:
+        return None
+
+    return {
+        "after_active": (args.get("after_active") or "1") == "1",
+        "after_last": args.get("after_last") or "",
+        "after_first": args.get("after_first") or "",
+        "after_id": after_id,
+    }
+
+
+def _load_resident_rows(
+    *,
+    shelter: str,
+    show: str,
+    cursor: dict[str, Any] | None = None,
+    page_size: int = RESIDENTS_PAGE_SIZE,
+) -> tuple[list[DbRow], dict[str, Any] | None]:
+    # Keyset paging: each page seeks past the last row of the previous one,
+    # so later pages cost the same as the first.
     include_inactive = show == "all"
-    return db_fetchall(_resident_scope_sql(include_inactive), (shelter,))
+    params: list[Any] = [shelter]
 
+    if cursor is not None:
+        if include_inactive:
+            params.extend([cursor["after_active"], cursor["after_active"]])
+        params.extend([cursor["after_last"], cursor["after_first"], cursor["after_id"]])
 
-def _resident_exists_in_shelter(*, resident_id: int, shelter: str) -> bool:
-    row = db_fetchone(
-        """
-        SELECT id
-        FROM residents
-        WHERE id = %s
-          AND LOWER(COALESCE(shelter, '')) = %s
-        """,
-        (resident_id, shelter),
+    params.append(page_size + 1)
+    rows = db_fetchall(
+        _resident_scope_sql(include_inactive, keyset=cursor is not None),
+        tuple(params),
     )
-    return row is not None
+
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    last_row = rows[-1]
+    next_page = {
+        "after_last": last_row["last_name"],
+        "after_first": last_row["first_name"],
+        "after_id": last_row["id"],
+        "limit": page_size,
+    }
+    if include_inactive:
+        next_page["after_active"] = "1" if last_row["is_active"] else "0"
+
+    return rows, next_page
 
 
 def _create_resident() -> None:
@@ -332,16 +401,19 @@ def _handle_cross_shelter_transfer(*, resident_id: int, context, form):
     return _return_redirect()
 
 
-def _set_resident_active_status(*, resident_id: int, shelter: str, active: bool) -> None:
-    db_execute(
+def _set_resident_active_status(*, resident_id: int, shelter: str, active: bool) -> bool:
+    # RETURNING doubles as the shelter-scoped existence check.
+    row = db_fetchone(
         """
         UPDATE residents
         SET is_active = %s
         WHERE id = %s
           AND LOWER(COALESCE(shelter, '')) = %s
+        RETURNING id
         """,
         (active, resident_id, shelter),
     )
+    return row is not None
 
 
 @residents.get("/staff/residents")
@@ -352,18 +424,25 @@ def staff_residents():
         flash("Staff only.", "error")
         return redirect(url_for("attendance.staff_attendance"))
 
-    init_db()
     _normalize_all_shelter_values()
 
     shelter = _current_shelter()
     show = (request.args.get("show") or "active").strip().lower()
-    rows = _load_resident_rows(shelter=shelter, show=show)
+    cursor = _resident_page_cursor(request.args)
+    rows, next_page = _load_resident_rows(
+        shelter=shelter,
+        show=show,
+        cursor=cursor,
+        page_size=_resident_page_size(request.args.get("limit")),
+    )
 
     return render_template(
         "staff_residents.html",
         residents=rows,
         shelter=shelter,
         show=show,
+        is_paged=cursor is not None,
+        next_page=next_page,
     )
 
 
@@ -375,7 +454,6 @@ def staff_residents_post():
         flash("Admin, shelter director, or case manager only.", "error")
         return redirect(url_for("residents.staff_residents"))
 
-    init_db()
     _normalize_all_shelter_values()
 
     try:
@@ -400,7 +478,6 @@ def edit_resident_profile(resident_id: int):
         flash("Admin, shelter director, or case manager only.", "error")
         return redirect(url_for("residents.staff_residents"))
 
-    init_db()
     return edit_resident_profile_view(resident_id)
 
 
@@ -412,7 +489,6 @@ def staff_resident_transfer(resident_id: int):
         flash("Admin, shelter director, or case manager only.", "error")
         return redirect(url_for("attendance.staff_attendance"))
 
-    init_db()
     _normalize_all_shelter_values()
 
     all_shelters = [normalize_shelter_name(s) for s in get_all_shelters()]
@@ -496,22 +572,17 @@ def staff_resident_set_active(resident_id: int):
         flash("Staff only.", "error")
         return redirect(url_for("attendance.staff_attendance"))
 
-    init_db()
     _normalize_all_shelter_values()
 
     shelter = _current_shelter()
     active_raw = (request.form.get("active") or "").strip()
 
-    if active_raw not in {"0", "1"}:
+    if active_raw not in ACTIVE_FLAG_VALUES:
         flash("Invalid action.", "error")
         return _return_redirect()
 
-    if not _resident_exists_in_shelter(resident_id=resident_id, shelter=shelter):
-        flash("Resident not found.", "error")
-        return _return_redirect()
-
     try:
-        _set_resident_active_status(
+        updated = _set_resident_active_status(
             resident_id=resident_id,
             shelter=shelter,
             active=(active_raw == "1"),
@@ -528,6 +599,10 @@ def staff_resident_set_active(resident_id: int):
         )
         return _return_redirect()
 
+    if not updated:
+        flash("Resident not found.", "error")
+        return _return_redirect()
+
     log_action(
         "resident",
         resident_id,
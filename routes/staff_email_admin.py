@@ -9,16 +9,14 @@ from core.admin_rbac import (
     require_admin_or_shelter_director_role as _require_admin_or_shelter_director,
 )
 from core.audit import log_action
-from core.db import db_execute, db_fetchall
+from core.db import db_execute, db_fetchall, db_kind
 from core.runtime import init_db
 
 staff_email_admin = Blueprint("staff_email_admin", __name__)
 
 
 def _ph() -> str:
-    from flask import current_app
-
-    return "%s" if current_app.config.get("DATABASE_URL") else "?"
+    return "%s" if db_kind() == "pg" else "?"
 
 
 def _normalize_email(value: str | None) -> str | None:
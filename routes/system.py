@@ -3,6 +3,7 @@ from __future__ import annotations
 from flask import Blueprint, abort, current_app, g, redirect, session, url_for
 
 from core.auth import require_login
+from core.db import get_db
 
 system = Blueprint("system", __name__)
 
@@ -22,22 +23,6 @@ def _is_admin() -> bool:
     return session_role() == "admin"
 
 
-def _init_db() -> None:
-    """
-    Run the configured database initializer without importing app directly.
-
-    The app stores the callable in:
-        app.config["INIT_DB_FUNC"]
-
-    This avoids circular imports during blueprint loading.
-    """
-    init_func = current_app.config.get("INIT_DB_FUNC")
-    if callable(init_func):
-        init_func()
-        return
-    raise RuntimeError("INIT_DB_FUNC is not configured")
-
-
 @system.post("/debug/csrf-post")
 @require_login
 def debug_csrf_post():
@@ -58,7 +43,7 @@ def debug_db():
     Minimal database health/debug endpoint.
 
     Restricted to admins and only available when debug routes are enabled.
-    Attempts to initialize the database layer and returns the detected db kind.
+    Opens the request database connection and returns the detected db kind.
     """
     if not current_app.config.get("ENABLE_DEBUG_ROUTES", False):
         abort(404)
@@ -67,9 +52,9 @@ def debug_db():
         return redirect(url_for("auth.staff_home"))
 
     try:
-        _init_db()
+        get_db()
     except Exception:
-        return {"ok": False, "error": "db init failed", "db_kind": g.get("db_kind")}, 500
+        return {"ok": False, "error": "db connection failed", "db_kind": g.get("db_kind")}, 500
 
     return {"ok": True, "db_kind": g.get("db_kind")}, 200
 
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from typing import Any
 from zoneinfo import ZoneInfo
 
 from flask import (
     Blueprint,
-    current_app,
     flash,
-    g,
     redirect,
     render_template,
     request,
@@ -25,44 +22,92 @@ transport = Blueprint("transport", __name__)
 
 CHICAGO_TZ = ZoneInfo("America/Chicago")
 
-
-def parse_dt(dt_str: str) -> datetime:
-    return datetime.fromisoformat(dt_str)
+_PENDING_TRANSPORT_ROWS_SQL = """
+    SELECT
+        id,
+        first_name,
+        last_name,
+        needed_at,
+        pickup_location,
+        destination,
+        status
+    FROM transport_requests
+    WHERE status = %s
+      AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
+    ORDER BY needed_at ASC, id ASC
+"""
+
+_OPEN_TRANSPORT_ROWS_SQL = """
+    SELECT
+        id,
+        first_name,
+        last_name,
+        needed_at,
+        pickup_location,
+        destination,
+        status
+    FROM transport_requests
+    WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
+      AND status IN (%s, %s)
+    ORDER BY needed_at ASC, id ASC
+"""
+
+_OPEN_TRANSPORT_ROWS_FOR_DAY_SQL = """
+    SELECT
+        id,
+        first_name,
+        last_name,
+        needed_at,
+        pickup_location,
+        destination,
+        status
+    FROM transport_requests
+    WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
+      AND status IN (%s, %s)
+      AND needed_at >= %s
+      AND needed_at < %s
+    ORDER BY needed_at ASC, id ASC
+"""
+
+_SCHEDULE_TRANSPORT_REQUEST_SQL = """
+    UPDATE transport_requests
+    SET status = %s, scheduled_at = %s, scheduled_by = %s, staff_notes = %s
+    WHERE id = %s
+      AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
+      AND status = %s
+"""
 
 
 def _can_manage_transport() -> bool:
     return can_manage_requests()
 
 
-def _row_value(row: Any, key: str, index: int, default=None):
-    if isinstance(row, dict):
-        return row.get(key, default)
+def _utc_bounds_for_local_day(day: str) -> tuple[str, str] | None:
+    # needed_at is stored as naive UTC ISO text, so a local day is a plain string range.
     try:
-        return row[index]
-    except Exception:
-        return default
-
-
-def _to_chicago(dt_str: str | None):
-    if not dt_str:
+        local_start = datetime.strptime(day, "%Y-%m-%d").replace(tzinfo=CHICAGO_TZ)
+    except ValueError:
         return None
 
-    try:
-        dt = datetime.fromisoformat(dt_str)
-    except Exception:
-        return None
+    local_end = local_start + timedelta(days=1)
+    return (
+        local_start.astimezone(UTC).replace(tzinfo=None).isoformat(timespec="seconds"),
+        local_end.astimezone(UTC).replace(tzinfo=None).isoformat(timespec="seconds"),
+    )
 
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=UTC)
 
-    return dt.astimezone(CHICAGO_TZ)
+def _open_transport_rows(shelter: str, day: str | None = None) -> list[dict]:
+    if not day:
+        return db_fetchall(_OPEN_TRANSPORT_ROWS_SQL, (shelter, "pending", "scheduled"))
 
+    bounds = _utc_bounds_for_local_day(day)
+    if bounds is None:
+        return []
 
-def _local_day(dt_str: str | None) -> str | None:
-    local_dt = _to_chicago(dt_str)
-    if not local_dt:
-        return None
-    return local_dt.strftime("%Y-%m-%d")
+    return db_fetchall(
+        _OPEN_TRANSPORT_ROWS_FOR_DAY_SQL,
+        (shelter, "pending", "scheduled", *bounds),
+    )
 
 
 def _cleanup_transport_requests(shelter: str) -> None:
@@ -72,34 +117,10 @@ def _cleanup_transport_requests(shelter: str) -> None:
         """
         DELETE FROM transport_requests
         WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
-          AND status = %s
-          AND needed_at < %s
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        DELETE FROM transport_requests
-        WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-          AND status = ?
-          AND needed_at < ?
-        """,
-        (shelter, "pending", cutoff_iso),
-    )
-
-    db_execute(
-        """
-        DELETE FROM transport_requests
-        WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
-          AND status = %s
+          AND status IN (%s, %s)
           AND needed_at < %s
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        DELETE FROM transport_requests
-        WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-          AND status = ?
-          AND needed_at < ?
         """,
-        (shelter, "scheduled", cutoff_iso),
+        (shelter, "pending", "scheduled", cutoff_iso),
     )
 
 
@@ -114,24 +135,7 @@ def staff_transport_pending():
     shelter = session["shelter"]
     _cleanup_transport_requests(shelter)
 
-    rows = db_fetchall(
-        """
-        SELECT *
-        FROM transport_requests
-        WHERE status = %s
-          AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
-        ORDER BY needed_at ASC, id ASC
-        """
-        if current_app.config.get("DATABASE_URL")
-        else """
-        SELECT *
-        FROM transport_requests
-        WHERE status = ?
-          AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-        ORDER BY needed_at ASC, id ASC
-        """,
-        ("pending", shelter),
-    )
+    rows = db_fetchall(_PENDING_TRANSPORT_ROWS_SQL, ("pending", shelter))
 
     return render_template(
         "staff_transport_pending.html",
@@ -147,33 +151,8 @@ def staff_transport_board():
     shelter = session["shelter"]
     _cleanup_transport_requests(shelter)
 
-    rows = db_fetchall(
-        """
-        SELECT *
-        FROM transport_requests
-        WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
-          AND status IN (%s, %s)
-        ORDER BY needed_at ASC, id ASC
-        """
-        if current_app.config.get("DATABASE_URL")
-        else """
-        SELECT *
-        FROM transport_requests
-        WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-          AND status IN (?, ?)
-        ORDER BY needed_at ASC, id ASC
-        """,
-        (shelter, "pending", "scheduled"),
-    )
-
     day = (request.args.get("date") or "").strip()
-    if day:
-        filtered = []
-        for r in rows:
-            needed_at_val = _row_value(r, "needed_at", 5, "")
-            if _local_day(needed_at_val) == day:
-                filtered.append(r)
-        rows = filtered
+    rows = _open_transport_rows(shelter, day)
 
     return render_template(
         "staff_transport_board.html",
@@ -187,116 +166,22 @@ def staff_transport_board():
 @require_login
 @require_shelter
 def staff_transport_print():
-    import html as _html
-
     shelter = session["shelter"]
     _cleanup_transport_requests(shelter)
 
-    rows = db_fetchall(
-        """
-        SELECT *
-        FROM transport_requests
-        WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
-          AND status IN (%s, %s)
-        ORDER BY needed_at ASC, id ASC
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        SELECT *
-        FROM transport_requests
-        WHERE LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-          AND status IN (?, ?)
-        ORDER BY needed_at ASC, id ASC
-        """,
-        (shelter, "pending", "scheduled"),
-    )
-
     day = (request.args.get("date") or "").strip()
     if not day:
         day = datetime.now(CHICAGO_TZ).strftime("%Y-%m-%d")
 
-    filtered = []
-    for r in rows:
-        needed_at_val = _row_value(r, "needed_at", 5, "")
-        if _local_day(needed_at_val) == day:
-            filtered.append(r)
-
-    rows = filtered
-
-    def _cell(v):
-        return _html.escape("" if v is None else str(v))
-
-    trs = []
-    for r in rows:
-        needed_at_val = _row_value(r, "needed_at", 5)
-        needed_at = fmt_dt(needed_at_val)
-        first = _row_value(r, "first_name", 3, "")
-        last = _row_value(r, "last_name", 4, "")
-        pickup = _row_value(r, "pickup_location", 6, "")
-        dest = _row_value(r, "destination", 7, "")
-        status = _row_value(r, "status", 11, "")
-
-        name = f"{last}, {first}"
-
-        trs.append(
-            "<tr>"
-            f"<td>{_cell(needed_at)}</td>"
-            f"<td>{_cell(name)}</td>"
-            f"<td>{_cell(pickup)}</td>"
-            f"<td>{_cell(dest)}</td>"
-            f"<td>{_cell(status)}</td>"
-            "</tr>"
-        )
-
-    table_rows = "\n".join(trs) if trs else '<tr><td colspan="5">No rides found.</td></tr>'
-
-    html_doc = f"""
-<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8">
-  <title>Transportation Sheet</title>
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <style>
-    body {{ font-family: Arial, sans-serif; margin: 16px; }}
-    h1 {{ margin: 0 0 10px 0; font-size: 20px; }}
-    table {{ width: 100%; border-collapse: collapse; }}
-    th, td {{ border: 1px solid #999; padding: 8px; font-size: 12px; vertical-align: top; }}
-    th {{ text-align: left; }}
-    .toolbar {{ margin-bottom: 12px; display:flex; gap:10px; }}
-    @media print {{
-      .toolbar {{ display:none; }}
-      body {{ margin: 0.5in; }}
-    }}
-  </style>
-</head>
-<body>
-  <div class="toolbar">
-    <button onclick="window.print()">Print</button>
-    <button onclick="window.close()">Close</button>
-  </div>
-
-  <h1>Transportation Sheet, {_cell(shelter)} | {_cell(day)}</h1>
-
-  <table>
-    <thead>
-      <tr>
-        <th>Time</th>
-        <th>Name</th>
-        <th>Pickup</th>
-        <th>Destination</th>
-        <th>Status</th>
-      </tr>
-    </thead>
-    <tbody>
-      {table_rows}
-    </tbody>
-  </table>
-</body>
-</html>
-""".strip()
-
-    return html_doc
+    rows = _open_transport_rows(shelter, day)
+
+    return render_template(
+        "staff_transport_print.html",
+        rows=rows,
+        shelter=shelter,
+        day=day,
+        fmt_dt=fmt_dt,
+    )
 
 
 @transport.route("/staff/transport/<int:req_id>/schedule", methods=["POST"])
@@ -315,21 +200,7 @@ def staff_transport_schedule(req_id: int):
     staff_notes = (request.form.get("staff_notes") or "").strip()
 
     db_execute(
-        """
-        UPDATE transport_requests
-        SET status = %s, scheduled_at = %s, scheduled_by = %s, staff_notes = %s
-        WHERE id = %s
-          AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(%s))
-          AND status = %s
-        """
-        if g.get("db_kind") == "pg"
-        else """
-        UPDATE transport_requests
-        SET status = ?, scheduled_at = ?, scheduled_by = ?, staff_notes = ?
-        WHERE id = ?
-          AND LOWER(TRIM(COALESCE(shelter, ''))) = LOWER(TRIM(?))
-          AND status = ?
-        """,
+        _SCHEDULE_TRANSPORT_REQUEST_SQL,
         (
             "scheduled",
             utcnow_iso(),
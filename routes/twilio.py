@@ -3,10 +3,11 @@ from __future__ import annotations
 import os
 from contextlib import suppress
 
-from flask import Blueprint, abort, current_app, g, request
+from flask import Blueprint, abort, current_app, request
 
-from core.db import db_execute, db_fetchall
+from core.db import db_execute, db_fetchall, db_kind
 from core.helpers import utcnow_iso
+from core.phone_numbers import phone_digits
 
 try:
     from twilio.request_validator import RequestValidator
@@ -52,7 +53,7 @@ def _rate_limited_memory(key: str, limit: int, window_seconds: int) -> bool:
 def _rate_limited(key: str, limit: int, window_seconds: int) -> bool:
     import time
 
-    if g.get("db_kind") != "pg":
+    if db_kind() != "pg":
         return _rate_limited_memory(key, limit, window_seconds)
 
     if limit <= 0 or window_seconds <= 0:
@@ -72,7 +73,7 @@ def _rate_limited(key: str, limit: int, window_seconds: int) -> bool:
         """,
         (key, window_seconds),
     )
-    c = int(rows[0]["c"] if isinstance(rows[0], dict) else rows[0][0]) if rows else 0
+    c = int(rows[0]["c"]) if rows else 0
 
     last_prune = current_app.config.get("_LAST_RL_PRUNE_TS", 0.0)
     now = time.time()
@@ -84,12 +85,6 @@ def _rate_limited(key: str, limit: int, window_seconds: int) -> bool:
     return c > limit
 
 
-def init_db() -> None:
-    schema_init = current_app.config.get("INIT_DB_FUNC")
-    if callable(schema_init):
-        schema_init()
-
-
 def _twilio_auth_token() -> str:
     return (os.environ.get("TWILIO_AUTH_TOKEN") or "").strip()
 
@@ -127,7 +122,7 @@ def _validate_twilio_request() -> None:
 
 
 def _normalize_last10(s: str) -> str:
-    d = "".join(ch for ch in (s or "") if ch.isdigit())
+    d = phone_digits(s)
     if len(d) == 11 and d.startswith("1"):
         d = d[1:]
     if len(d) > 10:
@@ -157,7 +152,7 @@ def _matching_resident_rows_by_phone(sender10: str) -> list:
 
     matches = []
     for row in rows or []:
-        resident_phone = row["phone"] if isinstance(row, dict) else row[2]
+        resident_phone = row["phone"]
         if _normalize_last10(str(resident_phone or "")) == sender10:
             matches.append(row)
 
@@ -184,8 +179,6 @@ def twilio_inbound():
 
     _validate_twilio_request()
 
-    init_db()
-
     from_number = (request.form.get("From") or "").strip()
     body = (request.form.get("Body") or "").strip().lower()
 
@@ -196,7 +189,7 @@ def twilio_inbound():
     if body not in stop_words and body not in start_words and body not in help_words:
         return current_app.response_class("", mimetype="text/xml")
 
-    kind = g.get("db_kind")
+    kind = db_kind()
     sender10 = _normalize_last10(from_number)
 
     if sender10 and _rate_limited(f"twilio_inbound_from:{sender10}", 10, 60):
@@ -206,8 +199,8 @@ def twilio_inbound():
 
     if body in stop_words:
         for row in matching_rows:
-            resident_id = row["id"] if isinstance(row, dict) else row[0]
-            resident_shelter = row["shelter"] if isinstance(row, dict) else row[1]
+            resident_id = row["id"]
+            resident_shelter = row["shelter"]
 
             db_execute(
                 """
@@ -234,8 +227,8 @@ def twilio_inbound():
 
     if body in start_words:
         for row in matching_rows:
-            resident_id = row["id"] if isinstance(row, dict) else row[0]
-            resident_shelter = row["shelter"] if isinstance(row, dict) else row[1]
+            resident_id = row["id"]
+            resident_shelter = row["shelter"]
 
             db_execute(
                 """
@@ -289,8 +282,7 @@ def twilio_status():
     ):
         return "OK", 200
 
-    init_db()
-    kind = g.get("db_kind")
+    kind = db_kind()
 
     error_code = (request.form.get("ErrorCode") or "").strip()
     to_number = (request.form.get("To") or "").strip()
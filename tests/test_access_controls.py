@@ -165,3 +165,121 @@ def test_admin_only_mode_allows_admin_staff_session(client, monkeypatch):
     response = client.get("/staff/case-management/", follow_redirects=False)
 
     assert response.status_code == 200
+
+
+def test_admin_staff_session_skips_admin_only_mode_lookup(client, monkeypatch):
+    import core.auth as auth_module
+
+    lookups: list[str] = []
+
+    def _record_lookup(sql, *args, **kwargs):
+        lookups.append(sql)
+        return {"admin_login_only_mode": True}
+
+    monkeypatch.setattr(auth_module, "db_fetchone", _record_lookup)
+
+    with client.session_transaction() as session:
+        session["staff_user_id"] = 99
+        session["username"] = "admin"
+        session["role"] = "admin"
+        session["shelter"] = "abba"
+        session["allowed_shelters"] = ["abba"]
+
+    response = client.get("/staff/select-shelter", follow_redirects=False)
+
+    assert response.status_code == 200
+    assert lookups == []
+
+
+def test_admin_staff_session_sets_db_kind_without_settings_lookup(client, monkeypatch):
+    from flask import g
+
+    import core.auth as auth_module
+    import routes.auth as auth_routes
+
+    seen_db_kinds: list[str | None] = []
+
+    def _load_all_shelters():
+        seen_db_kinds.append(g.get("db_kind"))
+        return ["Abba"], ["abba"], {"abba"}
+
+    monkeypatch.setattr(
+        auth_module,
+        "db_fetchone",
+        lambda *args, **kwargs: {"admin_login_only_mode": True},
+    )
+    monkeypatch.setattr(auth_routes, "_load_all_shelters", _load_all_shelters)
+
+    with client.session_transaction() as session:
+        session["staff_user_id"] = 99
+        session["username"] = "admin"
+        session["role"] = "admin"
+        session["shelter"] = "abba"
+        session["allowed_shelters"] = ["abba"]
+
+    response = client.get("/staff/select-shelter", follow_redirects=False)
+
+    assert response.status_code == 200
+    assert seen_db_kinds == ["sqlite"]
+
+
+def test_admin_only_mode_lookup_is_cached_until_cleared(client, monkeypatch):
+    import core.auth as auth_module
+
+    lookups: list[str] = []
+
+    def _record_lookup(sql, *args, **kwargs):
+        lookups.append(sql)
+        return {"admin_login_only_mode": False}
+
+    monkeypatch.setattr(auth_module, "db_fetchone", _record_lookup)
+    auth_module.clear_admin_only_mode_cache()
+
+    with client.session_transaction() as session:
+        session["staff_user_id"] = 1
+        session["username"] = "case_manager"
+        session["role"] = "case_manager"
+        session["shelter"] = "abba"
+        session["allowed_shelters"] = ["abba"]
+
+    client.get("/staff/select-shelter", follow_redirects=False)
+    client.get("/staff/select-shelter", follow_redirects=False)
+    assert len(lookups) == 1
+
+    auth_module.clear_admin_only_mode_cache()
+    client.get("/staff/select-shelter", follow_redirects=False)
+    assert len(lookups) == 2
+
+
+def test_cached_admin_only_mode_still_sets_db_kind_for_staff_session(client, monkeypatch):
+    from flask import g
+
+    import core.auth as auth_module
+    import routes.auth as auth_routes
+
+    seen_db_kinds: list[str | None] = []
+
+    def _load_all_shelters():
+        seen_db_kinds.append(g.get("db_kind"))
+        return ["Abba"], ["abba"], {"abba"}
+
+    monkeypatch.setattr(
+        auth_module,
+        "db_fetchone",
+        lambda *args, **kwargs: {"admin_login_only_mode": False},
+    )
+    monkeypatch.setattr(auth_routes, "_load_all_shelters", _load_all_shelters)
+    auth_module.clear_admin_only_mode_cache()
+
+    with client.session_transaction() as session:
+        session["staff_user_id"] = 1
+        session["username"] = "case_manager"
+        session["role"] = "case_manager"
+        session["shelter"] = "abba"
+        session["allowed_shelters"] = ["abba"]
+
+    client.get("/staff/select-shelter", follow_redirects=False)
+    response = client.get("/staff/select-shelter", follow_redirects=False)
+
+    assert response.status_code == 200
+    assert seen_db_kinds == ["sqlite", "sqlite"]
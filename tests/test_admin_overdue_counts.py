@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+
+def _login_staff(client, *, role: str) -> None:
+    with client.session_transaction() as session:
+        session["staff_user_id"] = 1
+        session["username"] = "staff"
+        session["role"] = role
+        session["shelter"] = "abba"
+        session["allowed_shelters"] = ["abba", "haven"]
+
+
+def _insert_resident_with_events(resident_id: int, shelter: str, events) -> None:
+    from core.db import db_execute
+
+    db_execute(
+        """
+        INSERT INTO residents (
+            id, resident_identifier, first_name, last_name, shelter, is_active, created_at
+        )
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """,
+        (
+            resident_id,
+            f"overdue-{resident_id}",
+            "Test",
+            "Resident",
+            shelter,
+            True,
+            "2026-01-01T00:00:00",
+        ),
+    )
+
+    for event_type, event_time, expected_back_time in events:
+        db_execute(
+            """
+            INSERT INTO attendance_events (
+                resident_id, shelter, event_type, event_time, expected_back_time
+            )
+            VALUES (%s, %s, %s, %s, %s)
+            """,
+            (resident_id, shelter, event_type, event_time, expected_back_time),
+        )
+
+
+def test_overdue_counts_groups_latest_checkouts_by_shelter(app, client):
+    with app.app_context():
+        _insert_resident_with_events(
+            1, "abba", [("check_out", "2000-01-01T00:00:00", "2000-01-01T01:00:00")]
+        )
+        _insert_resident_with_events(
+            2,
+            "abba",
+            [
+                ("check_out", "2000-01-01T00:00:00", "2000-01-01T01:00:00"),
+                ("check_in", "2000-01-01T02:00:00", None),
+            ],
+        )
+        _insert_resident_with_events(
+            3, "haven", [("check_out", "2000-01-01T00:00:00", "2000-01-01T01:00:00")]
+        )
+        _insert_resident_with_events(
+            4, "haven", [("check_out", "2000-01-01T00:00:00", "2999-01-01T00:00:00")]
+        )
+
+    _login_staff(client, role="admin")
+    response = client.get("/staff/admin/overdue_counts")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"ok": True, "counts": {"abba": 1, "haven": 1}, "total": 2}
+
+
+def test_overdue_counts_is_admin_only(client):
+    _login_staff(client, role="case_manager")
+
+    response = client.get("/staff/admin/overdue_counts")
+
+    assert response.status_code == 403
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+
+def _insert_event(resident_id: int, event_type: str, event_time: str, note: str = "") -> None:
+    from core.db import db_execute
+
+    db_execute(
+        """
+        INSERT INTO attendance_events (resident_id, shelter, event_type, event_time, note)
+        VALUES (%s, %s, %s, %s, %s)
+        """,
+        (resident_id, "abba", event_type, event_time, note),
+    )
+
+
+def _insert_resident(resident_id: int, first_name: str, last_name: str) -> None:
+    from core.db import db_execute
+
+    db_execute(
+        """
+        INSERT INTO residents (
+            id, resident_identifier, first_name, last_name, shelter, is_active, created_at
+        )
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """,
+        (
+            resident_id,
+            f"res-{resident_id}",
+            first_name,
+            last_name,
+            "abba",
+            True,
+            "2026-01-01T00:00:00",
+        ),
+    )
+
+
+def test_attendance_board_rows_match_per_resident_lookup(app):
+    from routes.attendance_parts.board import (
+        _attendance_board_rows,
+        _latest_attendance_events_for_resident,
+    )
+
+    with app.test_request_context("/"):
+        _insert_resident(1, "Ada", "Lovelace")
+        _insert_resident(2, "Grace", "Hopper")
+        _insert_resident(3, "Alan", "Turing")
+        _insert_event(1, "check_out", "2026-03-01T10:00:00", "first")
+        _insert_event(1, "check_in", "2026-03-01T12:00:00")
+        _insert_event(1, "check_out", "2026-03-02T09:00:00", "second")
+        _insert_event(2, "check_in", "2026-03-02T08:00:00")
+
+        board_rows = _attendance_board_rows("abba")
+        latest = {int(resident["id"]): events for resident, events in board_rows}
+
+        assert [resident["last_name"] for resident, _ in board_rows] == [
+            "Hopper",
+            "Lovelace",
+            "Turing",
+        ]
+
+        last_event, last_checkout = latest[1]
+        assert last_event["event_type"] == "check_out"
+        assert last_checkout["note"] == "second"
+
+        last_event, last_checkout = latest[2]
+        assert last_event["event_type"] == "check_in"
+        assert last_checkout is None
+
+        assert latest[3] == (None, None)
+
+        _, single_checkout = _latest_attendance_events_for_resident(1, "abba")
+        assert single_checkout["event_time"] == latest[1][1]["event_time"]
+
+
+def test_attendance_board_rows_are_memoized_per_request(app, monkeypatch):
+    import routes.attendance_parts.board as board
+
+    calls: list[tuple[object, ...]] = []
+
+    def _fake_fetchall(sql, params):
+        calls.append(params)
+        return [
+            {
+                "id": 1,
+                "first_name": "Ada",
+                "last_name": "Lovelace",
+                "last_event_type": None,
+                "checkout_resident_id": None,
+            }
+        ]
+
+    monkeypatch.setattr(board, "db_fetchall", _fake_fetchall)
+
+    with app.test_request_context("/"):
+        first = board._attendance_board_rows("abba")
+        second = board._attendance_board_rows("abba")
+
+    with app.test_request_context("/"):
+        board._attendance_board_rows("abba")
+
+    assert first is second
+    assert len(calls) == 2
+
+
+def test_attendance_board_rows_flag_past_expected_back(app):
+    from core.db import db_execute
+    from routes.attendance_parts.board import _attendance_board_rows
+
+    with app.test_request_context("/"):
+        for resident_id, expected_back in ((1, "2000-01-01T00:00:00"), (2, "2999-01-01T00:00:00")):
+            _insert_resident(resident_id, "Test", f"Resident{resident_id}")
+            db_execute(
+                """
+                INSERT INTO attendance_events (
+                    resident_id, shelter, event_type, event_time, expected_back_time
+                )
+                VALUES (%s, %s, %s, %s, %s)
+                """,
+                (resident_id, "abba", "check_out", "2000-01-01T00:00:00", expected_back),
+            )
+
+        board_rows = _attendance_board_rows("abba")
+        latest = {int(resident["id"]): events for resident, events in board_rows}
+
+    assert latest[1][1]["is_past_expected_back"] == 1
+    assert latest[2][1]["is_past_expected_back"] == 0
+
+
+def test_attendance_base_row_is_slotted_board_row(app):
+    from routes.attendance_parts.board import AttendanceBoardRow, _attendance_base_row
+
+    with app.app_context():
+        _insert_event(1, "check_in", "2026-03-01T12:00:00")
+        row = _attendance_base_row({"id": 1, "first_name": "Ada", "last_name": "Lovelace"}, "abba")
+
+    assert isinstance(row, AttendanceBoardRow)
+    assert not hasattr(row, "__dict__")
+    assert row.name == "Lovelace, Ada"
+    assert row.is_out is False
+
+
+def test_local_dt_input_value_converts_and_caches():
+    from routes.attendance_parts.board import _local_dt_input_value
+
+    _local_dt_input_value.cache_clear()
+
+    assert _local_dt_input_value("2026-07-01T17:30:00") == "2026-07-01T12:30"
+    assert _local_dt_input_value("2026-07-01T17:30:00") == "2026-07-01T12:30"
+    assert _local_dt_input_value("") == ""
+    assert _local_dt_input_value.cache_info().hits == 1
+
+
+def test_board_rows_match_per_resident_pass_and_pair_lookups(app):
+    from core.db import db_execute
+    from routes.attendance_parts.board import _attendance_base_row, _attendance_board_rows
+
+    with app.test_request_context("/"):
+        _insert_resident(1, "Ada", "Lovelace")
+        _insert_resident(2, "Grace", "Hopper")
+        _insert_event(1, "check_out", "2026-03-01T10:00:00", "errand")
+        _insert_event(1, "check_in", "2026-03-01T12:00:00")
+        db_execute(
+            """
+            INSERT INTO resident_passes (
+                resident_id, shelter, status, pass_type, start_date, end_date,
+                created_at, updated_at
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """,
+            (2, "abba", "approved", "pass", "2000-01-01", "2999-01-01", "2026-01-01", "2026-01-01"),
+        )
+
+        board = {
+            int(resident["id"]): _attendance_base_row(resident, "abba", latest_events)
+            for resident, latest_events in _attendance_board_rows("abba")
+        }
+        single = {
+            resident_id: _attendance_base_row(
+                {"id": resident_id, "first_name": row.first_name, "last_name": row.last_name},
+                "abba",
+            )
+            for resident_id, row in board.items()
+        }
+
+    assert board[1].last_completed_pair is not None
+    assert board[1].last_completed_pair == single[1].last_completed_pair
+    assert board[2].last_completed_pair is None
+    assert board[2].has_active_pass is True
+    assert board[1].has_active_pass == single[1].has_active_pass is False
+
+
+def test_print_local_day_follows_chicago_offset():
+    from routes.attendance_parts.print_views import _local_day
+
+    assert _local_day("2026-01-15T03:00:00") == "2026-01-14"
+    assert _local_day("2026-07-15T04:30:00") == "2026-07-14"
+    assert _local_day("2026-07-15T05:30:00") == "2026-07-15"
+    assert _local_day("bad-date") == "bad-date"
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+
+
+def _audit_actions(app) -> list[str]:
+    from core.db import db_fetchall
+
+    with app.app_context():
+        rows = db_fetchall("SELECT action_type FROM audit_log ORDER BY id")
+    return [row["action_type"] for row in rows]
+
+
+def test_log_action_writes_inline_without_writer(app):
+    from core.audit import log_action
+
+    with app.app_context():
+        log_action("test", 1, "abba", 1, "inline_write")
+
+    assert "inline_write" in _audit_actions(app)
+
+
+def test_log_action_queues_when_writer_running_and_flush_writes(app, monkeypatch):
+    import core.audit_writer as audit_writer_module
+    from core.audit import log_action
+
+    monkeypatch.setattr(audit_writer_module, "_AUDIT_QUEUE", audit_writer_module.queue.Queue())
+    app.extensions["audit_writer_pid"] = os.getpid()
+
+    with app.app_context():
+        log_action("test", 1, "abba", 1, "queued_write")
+
+    assert "queued_write" not in _audit_actions(app)
+
+    assert audit_writer_module.flush_audit_queue(app) == 1
+    assert "queued_write" in _audit_actions(app)
+
+
+def test_log_action_inside_transaction_stays_inline(app, monkeypatch):
+    import core.audit_writer as audit_writer_module
+    from core.audit import log_action
+    from core.db import db_transaction
+
+    monkeypatch.setattr(audit_writer_module, "_AUDIT_QUEUE", audit_writer_module.queue.Queue())
+    app.extensions["audit_writer_pid"] = os.getpid()
+
+    with app.app_context(), db_transaction():
+        log_action("test", 1, "abba", 1, "transactional_write")
+
+    assert "transactional_write" in _audit_actions(app)
+    assert audit_writer_module._AUDIT_QUEUE.empty()
+
+
+def test_audit_writer_skips_in_testing(app):
+    from core.audit_writer import audit_writer_running, start_audit_writer
+
+    app.config["TESTING"] = True
+
+    start_audit_writer(app)
+
+    assert app.extensions.get("audit_writer_status") == "testing_skipped"
+    assert audit_writer_running(app) is False
+
+
+def test_log_action_in_request_is_written_at_teardown(app):
+    from core.audit import log_action
+
+    with app.test_request_context("/"):
+        log_action("test", 1, "abba", 1, "deferred_one")
+        log_action("test", 1, "abba", 1, "deferred_two")
+
+        assert "deferred_one" not in _audit_actions(app)
+
+    assert _audit_actions(app)[-2:] == ["deferred_one", "deferred_two"]
+
+
+def test_stop_audit_writer_drains_queue_after_thread_exits(app, monkeypatch):
+    import threading
+
+    import core.audit_writer as audit_writer_module
+
+    monkeypatch.setattr(audit_writer_module, "_AUDIT_QUEUE", audit_writer_module.queue.Queue())
+    monkeypatch.setattr(audit_writer_module, "AUDIT_POLL_SECONDS", 0.01)
+
+    stop_event = threading.Event()
+    stop_event.set()
+    thread = threading.Thread(target=audit_writer_module._writer_loop, args=(app, stop_event))
+    thread.start()
+
+    audit_writer_module.enqueue_audit_row(
+        ("test", 1, "abba", 1, "shutdown_write", "", "2026-01-01T00:00:00")
+    )
+    audit_writer_module._stop_audit_writer(app, thread, stop_event)
+
+    assert not thread.is_alive()
+    assert "shutdown_write" in _audit_actions(app)
+
+
+def test_take_batch_lingers_to_collect_a_burst(monkeypatch):
+    import threading
+
+    import core.audit_writer as audit_writer_module
+
+    monkeypatch.setattr(audit_writer_module, "_AUDIT_QUEUE", audit_writer_module.queue.Queue())
+
+    audit_writer_module.enqueue_audit_row(("first",))
+    late_put = threading.Timer(0.05, audit_writer_module.enqueue_audit_row, args=(("second",),))
+    late_put.start()
+
+    try:
+        batch = audit_writer_module._take_batch(timeout=0.1, linger=0.3)
+    finally:
+        late_put.join()
+
+    assert batch == [("first",), ("second",)]
@@ -327,3 +327,84 @@ def test_staff_select_shelter_rejects_non_staff_next_path(client, monkeypatch):
 
     assert response.status_code in (301, 302)
     assert response.headers["Location"].endswith("/staff/attendance")
+
+
+def test_hash_password_uses_pinned_method_and_old_hashes_still_verify():
+    from werkzeug.security import check_password_hash
+
+    from core.passwords import PASSWORD_HASH_METHOD, hash_password
+
+    new_hash = hash_password("correct horse")
+    legacy_hash = generate_password_hash("correct horse", method="pbkdf2:sha256")
+
+    assert new_hash.startswith(f"{PASSWORD_HASH_METHOD}$")
+    assert check_password_hash(new_hash, "correct horse")
+    assert check_password_hash(legacy_hash, "correct horse")
+
+
+def test_password_hash_method_defaults_to_scrypt_n_32768(monkeypatch):
+    import importlib
+
+    import core.passwords as passwords_module
+
+    monkeypatch.delenv("PASSWORD_HASH_METHOD", raising=False)
+    passwords_module = importlib.reload(passwords_module)
+
+    assert passwords_module.PASSWORD_HASH_METHOD == "scrypt:32768:8:1"
+    assert passwords_module.hash_password("pw").startswith("scrypt:32768:8:1$")
+
+
+def test_password_needs_rehash_only_for_legacy_or_cheaper_methods():
+    from core.passwords import hash_password, password_needs_rehash
+
+    assert password_needs_rehash(hash_password("pw")) is False
+    assert password_needs_rehash(generate_password_hash("pw", method="pbkdf2:sha256")) is True
+    assert password_needs_rehash(generate_password_hash("pw", method="scrypt:16384:8:1")) is True
+    assert password_needs_rehash("") is False
+
+
+def test_password_needs_rehash_never_lowers_scrypt_cost():
+    from core.passwords import password_needs_rehash
+
+    assert password_needs_rehash(generate_password_hash("pw", method="scrypt:65536:8:1")) is False
+    assert password_needs_rehash(generate_password_hash("pw", method="scrypt:32768:8:2")) is False
+
+
+def test_staff_login_upgrades_legacy_password_hash(app, client, monkeypatch):
+    from werkzeug.security import check_password_hash
+
+    import routes.auth as auth_module
+    from core.db import db_execute, db_fetchone
+    from core.passwords import password_needs_rehash
+
+    monkeypatch.setattr(auth_module, "get_client_ip", lambda: "127.0.0.1")
+    monkeypatch.setattr(auth_module, "is_ip_banned", lambda ip: False)
+    monkeypatch.setattr(auth_module, "is_key_locked", lambda key: False)
+    monkeypatch.setattr(auth_module, "is_rate_limited", lambda *args, **kwargs: False)
+    monkeypatch.setattr(auth_module, "log_action", lambda *args, **kwargs: None)
+
+    _insert_staff_user(app, username="legacy-admin", password="correct horse")
+    with app.app_context():
+        db_execute(
+            "UPDATE staff_users SET password_hash = %s WHERE username = %s",
+            (generate_password_hash("correct horse", method="pbkdf2:sha256"), "legacy-admin"),
+        )
+
+    client.post(
+        "/staff/login",
+        data={
+            "_csrf_token": _set_csrf_token(client),
+            "username": "legacy-admin",
+            "password": "correct horse",
+        },
+        follow_redirects=False,
+    )
+
+    with app.app_context():
+        row = db_fetchone(
+            "SELECT password_hash FROM staff_users WHERE username = %s",
+            ("legacy-admin",),
+        )
+
+    assert password_needs_rehash(row["password_hash"]) is False
+    assert check_password_hash(row["password_hash"], "correct horse")
@@ -280,6 +280,47 @@ def test_staff_login_inactive_user_returns_401(app, client, monkeypatch):
     assert response.status_code == 401
 
 
+def test_staff_login_unknown_username_still_checks_password_hash(app, client, monkeypatch):
+    import routes.auth as auth_module
+
+    monkeypatch.setattr(
+        auth_module,
+        "get_all_shelters",
+        lambda: ["Abba House", "Haven House", "Gratitude House"],
+    )
+    monkeypatch.setattr(auth_module, "get_client_ip", lambda: "127.0.0.1")
+    monkeypatch.setattr(auth_module, "is_ip_banned", lambda ip: False)
+    monkeypatch.setattr(auth_module, "is_key_locked", lambda key: False)
+    monkeypatch.setattr(auth_module, "get_key_lock_seconds_remaining", lambda key: 0)
+    monkeypatch.setattr(auth_module, "is_rate_limited", lambda key, limit, window_seconds: False)
+    monkeypatch.setattr(auth_module, "log_action", lambda *args, **kwargs: None)
+    monkeypatch.setattr(auth_module, "_record_failed_login_attempt", lambda **kwargs: None)
+
+    checked: list[str] = []
+
+    def fake_check_password_hash(pw_hash: str, password: str) -> bool:
+        checked.append(password)
+        return False
+
+    monkeypatch.setattr(auth_module, "check_password_hash", fake_check_password_hash)
+
+    csrf_token = _set_csrf_token(client)
+
+    response = client.post(
+        "/staff/login",
+        data={
+            "_csrf_token": csrf_token,
+            "username": "no-such-user",
+            "password": "secret123",
+            "shelter": "abba",
+        },
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 401
+    assert checked == ["secret123"]
+
+
 def test_staff_login_banned_ip_returns_403(client, monkeypatch):
     import routes.auth as auth_module
 
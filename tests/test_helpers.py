@@ -11,3 +11,14 @@ def test_fmt_dt_basic():
 
 def test_fmt_time_only_basic():
     assert fmt_time_only("2026-01-01T12:00:00") is not None
+
+
+def test_fmt_dt_converts_utc_to_chicago():
+    assert fmt_dt("2026-01-01T18:30:00") == "01/01/2026 12:30 PM"
+    assert fmt_dt("2026-01-01T18:30:00") == "01/01/2026 12:30 PM"
+
+
+def test_fmt_dt_blank_values():
+    assert fmt_dt(None) == "—"
+    assert fmt_dt("") == "—"
+    assert fmt_dt("not a date") == "—"
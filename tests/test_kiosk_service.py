@@ -790,3 +790,24 @@ def test_handle_checkout_success_with_pass_and_aa_meetings(monkeypatch):
     assert "Pass ID: 99" in note_value
     assert "Pass Type: Overnight Pass" in note_value
     assert "Pass Destination: Family Visit" in note_value
+
+
+def test_kiosk_shelter_lookup_is_cached_and_case_insensitive(app, monkeypatch):
+    import routes.kiosk as kiosk_module
+
+    calls: list[int] = []
+
+    def _fake_shelters():
+        calls.append(1)
+        return ["Abba", "Haven"]
+
+    kiosk_module._SHELTER_LOOKUP_CACHE.clear()
+    monkeypatch.setattr(kiosk_module, "get_all_shelters", _fake_shelters)
+
+    with app.app_context():
+        assert kiosk_module._resolve_shelter_or_404(" ABBA ") == "Abba"
+        assert kiosk_module._resolve_shelter_or_404("haven") == "Haven"
+        assert kiosk_module._resolve_shelter_or_404("nowhere") is None
+
+    kiosk_module._SHELTER_LOOKUP_CACHE.clear()
+    assert len(calls) == 1
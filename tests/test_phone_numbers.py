@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from core.phone_numbers import normalize_phone_10, phone_digits
+
+
+def test_phone_digits_keeps_only_ascii_digits():
+    assert phone_digits("+1 (806) 555–1212 ext.") == "18065551212"
+    assert phone_digits(None) == ""
+    assert phone_digits(8065551212) == "8065551212"
+
+
+def test_normalize_phone_10_drops_leading_country_code():
+    assert normalize_phone_10("1-806-555-1212") == "8065551212"
+    assert normalize_phone_10("555-1212") is None
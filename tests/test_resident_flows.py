@@ -22,7 +22,6 @@ def _set_resident_session(client):
 def test_resident_signin_invalid_code(client, monkeypatch):
     import routes.resident_requests as rr
 
-    monkeypatch.setattr(rr, "init_db", lambda: None)
     monkeypatch.setattr(rr, "_load_resident_by_code", lambda code: None)
     monkeypatch.setattr(rr, "is_rate_limited", lambda *args, **kwargs: False)
     monkeypatch.setattr(rr, "log_action", lambda *args, **kwargs: None)
@@ -40,7 +39,6 @@ def test_resident_signin_invalid_code(client, monkeypatch):
 def test_resident_signin_success_sets_session(client, monkeypatch):
     import routes.resident_requests as rr
 
-    monkeypatch.setattr(rr, "init_db", lambda: None)
     monkeypatch.setattr(rr, "is_rate_limited", lambda *args, **kwargs: False)
     monkeypatch.setattr(rr, "log_action", lambda *args, **kwargs: None)
 
@@ -86,7 +84,6 @@ def test_resident_signin_success_sets_session(client, monkeypatch):
 def test_resident_signin_clears_old_session_state_before_starting_new_one(client, monkeypatch):
     import routes.resident_requests as rr
 
-    monkeypatch.setattr(rr, "init_db", lambda: None)
     monkeypatch.setattr(rr, "is_rate_limited", lambda *args, **kwargs: False)
     monkeypatch.setattr(rr, "log_action", lambda *args, **kwargs: None)
     monkeypatch.setattr(
@@ -150,7 +147,6 @@ def test_resident_signin_clears_old_session_state_before_starting_new_one(client
 def test_resident_signin_rejects_unapproved_next_url(client, monkeypatch):
     import routes.resident_requests as rr
 
-    monkeypatch.setattr(rr, "init_db", lambda: None)
     monkeypatch.setattr(rr, "is_rate_limited", lambda *args, **kwargs: False)
     monkeypatch.setattr(rr, "log_action", lambda *args, **kwargs: None)
     monkeypatch.setattr(
@@ -191,7 +187,6 @@ def test_resident_signin_rejects_unapproved_next_url(client, monkeypatch):
 def test_resident_signin_allows_approved_next_url(client, monkeypatch):
     import routes.resident_requests as rr
 
-    monkeypatch.setattr(rr, "init_db", lambda: None)
     monkeypatch.setattr(rr, "is_rate_limited", lambda *args, **kwargs: False)
     monkeypatch.setattr(rr, "log_action", lambda *args, **kwargs: None)
     monkeypatch.setattr(
@@ -232,7 +227,6 @@ def test_resident_signin_allows_approved_next_url(client, monkeypatch):
 def test_resident_signin_without_consent_redirects_to_consent_with_safe_next(client, monkeypatch):
     import routes.resident_requests as rr
 
-    monkeypatch.setattr(rr, "init_db", lambda: None)
     monkeypatch.setattr(rr, "is_rate_limited", lambda *args, **kwargs: False)
     monkeypatch.setattr(rr, "log_action", lambda *args, **kwargs: None)
     monkeypatch.setattr(
@@ -327,13 +321,9 @@ def test_resident_logout_clears_session(client):
         assert dict(session_state) == {}
 
 
-def test_transport_requires_required_fields(client, monkeypatch):
-    import routes.resident_requests as rr
-
+def test_transport_requires_required_fields(client):
     _set_resident_session(client)
 
-    monkeypatch.setattr(rr, "init_db", lambda: None)
-
     response = client.post(
         "/transport",
         data={"_csrf_token": _set_csrf_token(client)},
@@ -349,12 +339,10 @@ def test_transport_rejects_past_time(client, monkeypatch):
 
     _set_resident_session(client)
 
-    monkeypatch.setattr(rr, "init_db", lambda: None)
-
     monkeypatch.setattr(
         rr,
         "_parse_transport_needed_at",
-        lambda raw: (None, "Needed time cannot be in the past."),
+        lambda raw, now_utc=None: (None, "Needed time cannot be in the past."),
     )
 
     response = client.post(
@@ -377,14 +365,13 @@ def test_transport_success_flow(client, monkeypatch):
 
     _set_resident_session(client)
 
-    monkeypatch.setattr(rr, "init_db", lambda: None)
     monkeypatch.setattr(rr, "is_rate_limited", lambda *args, **kwargs: False)
     monkeypatch.setattr(rr, "log_action", lambda *args, **kwargs: None)
 
     monkeypatch.setattr(
         rr,
         "_parse_transport_needed_at",
-        lambda raw: (__import__("datetime").datetime.utcnow(), None),
+        lambda raw, now_utc=None: (__import__("datetime").datetime.utcnow(), None),
     )
 
     monkeypatch.setattr(
@@ -139,11 +139,8 @@ def test_resident_transport_requires_login(client):
     assert "/resident" in response.headers["Location"]
 
 
-def test_resident_transport_page_loads_when_logged_in(client, monkeypatch):
-    import routes.resident_requests as module
-
+def test_resident_transport_page_loads_when_logged_in(client):
     _login_resident(client)
-    monkeypatch.setattr(module, "init_db", lambda: None)
 
     response = client.get("/transport", follow_redirects=True)
 
@@ -30,7 +30,6 @@ def test_resident_signin_page_loads(client):
 def test_resident_signin_invalid_code_returns_401(client, monkeypatch):
     csrf_token = _set_csrf_token(client)
 
-    monkeypatch.setattr(resident_requests_module, "init_db", lambda: None)
     monkeypatch.setattr(resident_requests_module, "_client_ip", lambda: "127.0.0.1")
     monkeypatch.setattr(resident_requests_module, "is_rate_limited", lambda *args, **kwargs: False)
     monkeypatch.setattr(
@@ -71,7 +70,6 @@ def test_resident_transport_post_missing_required_fields_returns_400(app, client
     with app.app_context():
         init_db()
 
-    monkeypatch.setattr(resident_requests_module, "init_db", lambda: None)
     monkeypatch.setattr(resident_requests_module, "_client_ip", lambda: "127.0.0.1")
     monkeypatch.setattr(resident_requests_module, "is_rate_limited", lambda *args, **kwargs: False)
 
@@ -104,7 +102,6 @@ def test_resident_transport_post_success_redirects(app, client, monkeypatch):
             ("test_resident",),
         )
 
-    monkeypatch.setattr(resident_requests_module, "init_db", lambda: None)
     monkeypatch.setattr(resident_requests_module, "_client_ip", lambda: "127.0.0.1")
     monkeypatch.setattr(resident_requests_module, "is_rate_limited", lambda *args, **kwargs: False)
     monkeypatch.setattr(resident_requests_module, "log_action", lambda *args, **kwargs: None)
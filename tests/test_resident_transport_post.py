@@ -59,7 +59,6 @@ def test_transport_post_missing_required_fields(client, monkeypatch):
     _login_resident(client)
     csrf = _set_csrf_token(client)
 
-    monkeypatch.setattr(module, "init_db", lambda: None)
     monkeypatch.setattr(module, "is_rate_limited", lambda *args, **kwargs: False)
 
     response = client.post(
@@ -83,7 +82,6 @@ def test_transport_post_invalid_datetime(client, monkeypatch):
     _login_resident(client)
     csrf = _set_csrf_token(client)
 
-    monkeypatch.setattr(module, "init_db", lambda: None)
     monkeypatch.setattr(module, "is_rate_limited", lambda *args, **kwargs: False)
 
     response = client.post(
@@ -109,7 +107,6 @@ def test_transport_post_past_datetime_rejected(client, monkeypatch):
 
     past_time = (datetime.now(CHICAGO_TZ) - timedelta(hours=2)).strftime("%Y-%m-%d %I:%M %p")
 
-    monkeypatch.setattr(module, "init_db", lambda: None)
     monkeypatch.setattr(module, "is_rate_limited", lambda *args, **kwargs: False)
 
     response = client.post(
@@ -133,7 +130,6 @@ def test_transport_post_rate_limited(client, monkeypatch):
     _login_resident(client)
     csrf = _set_csrf_token(client)
 
-    monkeypatch.setattr(module, "init_db", lambda: None)
     monkeypatch.setattr(module, "is_rate_limited", lambda *args, **kwargs: True)
 
     response = client.post(
@@ -71,6 +71,76 @@ def test_staff_residents_page_loads_for_staff(app, client):
     assert b"Resident" in response.data
 
 
+def test_load_resident_rows_pages_with_keyset_cursor(app):
+    from core.db import db_execute
+    from routes.residents import _load_resident_rows
+
+    with app.app_context():
+        init_db()
+
+        for index, (last_name, is_active) in enumerate(
+            (("Adams", True), ("Baker", True), ("Baker", True), ("Clark", False), ("Davis", True))
+        ):
+            db_execute(
+                """
+                INSERT INTO residents (
+                    resident_identifier,
+                    resident_code,
+                    first_name,
+                    last_name,
+                    shelter,
+                    is_active,
+                    created_at
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, NOW())
+                """,
+                (f"keyset_page_{index}", f"9000000{index}", "Pat", last_name, "abba", is_active),
+            )
+
+        first_page, next_page = _load_resident_rows(shelter="abba", show="active", page_size=2)
+        cursor = {"after_active": True, **next_page}
+        second_page, last_cursor = _load_resident_rows(
+            shelter="abba",
+            show="active",
+            cursor=cursor,
+            page_size=2,
+        )
+
+        all_first, all_next = _load_resident_rows(shelter="abba", show="all", page_size=4)
+        all_second, _ = _load_resident_rows(
+            shelter="abba",
+            show="all",
+            cursor={**all_next, "after_active": all_next["after_active"] == "1"},
+            page_size=4,
+        )
+
+    assert [row["last_name"] for row in first_page] == ["Adams", "Baker"]
+    assert [row["last_name"] for row in second_page] == ["Baker", "Davis"]
+    assert last_cursor is None
+    assert [row["last_name"] for row in all_first + all_second] == [
+        "Adams",
+        "Baker",
+        "Baker",
+        "Davis",
+        "Clark",
+    ]
+
+
+def test_normalize_all_shelter_values_runs_once_per_database(app, monkeypatch):
+    import routes.residents as residents_module
+
+    statements: list[str] = []
+    monkeypatch.setattr(residents_module, "db_execute", lambda sql, *a: statements.append(sql))
+
+    with app.app_context():
+        residents_module._normalize_all_shelter_values()
+        first_run = len(statements)
+        residents_module._normalize_all_shelter_values()
+
+    assert first_run == 8
+    assert len(statements) == first_run
+
+
 # ----------------------------
 # Transfer validation
 # ----------------------------
@@ -247,3 +317,69 @@ def test_transfer_updates_resident_shelter(app, client):
         )
 
         assert updated["shelter"] == "haven"
+
+
+def _post_set_active(client, resident_id: int, csrf: str):
+    response = client.post(
+        f"/staff/residents/{resident_id}/set-active",
+        data={"_csrf_token": csrf, "active": "0"},
+        follow_redirects=False,
+    )
+    with client.session_transaction() as session:
+        flashes = session.pop("_flashes", [])
+    return response, flashes
+
+
+def test_set_active_updates_only_residents_in_current_shelter(app, client):
+    from core.db import db_execute, db_fetchone
+
+    _login_staff(client, shelter="abba")
+    csrf = _set_csrf_token(client)
+
+    with app.app_context():
+        init_db()
+
+        for identifier, code, shelter in (
+            ("test_set_active_abba", "44444444", "abba"),
+            ("test_set_active_haven", "55555555", "haven"),
+        ):
+            db_execute(
+                """
+                INSERT INTO residents (
+                    resident_identifier,
+                    resident_code,
+                    first_name,
+                    last_name,
+                    shelter,
+                    is_active,
+                    created_at
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, NOW())
+                """,
+                (identifier, code, "Active", "Resident", shelter, True),
+            )
+
+        abba_id = db_fetchone(
+            "SELECT id FROM residents WHERE resident_identifier = %s",
+            ("test_set_active_abba",),
+        )["id"]
+        haven_id = db_fetchone(
+            "SELECT id FROM residents WHERE resident_identifier = %s",
+            ("test_set_active_haven",),
+        )["id"]
+
+    abba_response, abba_flashes = _post_set_active(client, abba_id, csrf)
+    haven_response, haven_flashes = _post_set_active(client, haven_id, csrf)
+
+    assert abba_response.status_code in (301, 302)
+    assert abba_flashes == [("ok", "Updated.")]
+    assert haven_response.status_code in (301, 302)
+    assert haven_response.headers["Location"].endswith("/staff/residents")
+    assert haven_flashes == [("error", "Resident not found.")]
+
+    with app.app_context():
+        abba_row = db_fetchone("SELECT is_active FROM residents WHERE id = %s", (abba_id,))
+        haven_row = db_fetchone("SELECT is_active FROM residents WHERE id = %s", (haven_id,))
+
+    assert not abba_row["is_active"]
+    assert haven_row["is_active"]
@@ -13,3 +13,25 @@ def test_duplicate_column_error_detection_for_already_exists() -> None:
 
 def test_duplicate_column_error_detection_for_real_failure() -> None:
     assert _is_duplicate_column_error(Exception("syntax error at or near ADD")) is False
+
+
+def test_schema_init_db_runs_sqlite_initialization_in_one_transaction(app, monkeypatch) -> None:
+    from flask import g
+
+    import db.schema as schema
+    from core.db import get_db
+
+    seen: list[bool] = []
+    monkeypatch.setattr(
+        schema,
+        "_run_schema_initialization",
+        lambda kind: seen.append(bool(g.get("db_in_transaction"))),
+    )
+
+    with app.app_context():
+        get_db()
+        schema._schema_state().initialized_key = None
+        schema.init_db()
+
+        assert seen == [True]
+        assert get_db().in_transaction is False
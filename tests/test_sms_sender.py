@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+
+def test_twilio_client_is_reused_for_same_credentials(monkeypatch):
+    import core.sms_sender as sms_sender
+
+    created: list[tuple[str, str]] = []
+
+    class _FakeClient:
+        def __init__(self, account_sid, auth_token):
+            created.append((account_sid, auth_token))
+
+    monkeypatch.setattr(sms_sender, "Client", _FakeClient)
+    sms_sender._twilio_client.cache_clear()
+
+    try:
+        first = sms_sender._twilio_client("AC123", "token")
+        second = sms_sender._twilio_client("AC123", "token")
+    finally:
+        sms_sender._twilio_client.cache_clear()
+
+    assert first is second
+    assert created == [("AC123", "token")]
+
+
+def test_run_sms_in_background_runs_inline_when_testing(app):
+    from core.sms_sender import run_sms_in_background
+
+    calls: list[str] = []
+
+    with app.app_context():
+        run_sms_in_background(lambda: calls.append("sent"))
+
+    assert calls == ["sent"]
+
+
+def test_normalize_to_e164_accepts_us_numbers_and_passes_through_plus():
+    from core.sms_sender import _normalize_to_e164
+
+    assert _normalize_to_e164("(806) 555-1212") == "+18065551212"
+    assert _normalize_to_e164("1-806-555-1212") == "+18065551212"
+    assert _normalize_to_e164(" +447700900123 ") == "+447700900123"
+    assert _normalize_to_e164("555-1212") is None
+    assert _normalize_to_e164("2-806-555-1212") is None
@@ -58,3 +58,143 @@ def test_pass_denial_flow(client):
 
     assert response.status_code in (301, 302)
     assert "/staff/passes/pending" in response.headers["Location"]
+
+
+def test_current_pass_rows_only_include_passes_inside_their_window(app):
+    from datetime import UTC, datetime, timedelta
+
+    from core.db import db_execute, db_fetchone
+    from core.runtime import init_db
+    from routes.attendance_parts.pass_queries import (
+        fetch_current_pass_rows,
+        fetch_open_approved_pass_rows,
+    )
+
+    now = datetime.now(UTC).replace(tzinfo=None, microsecond=0)
+    windows = {
+        "current": (now - timedelta(hours=1), now + timedelta(hours=1)),
+        "future": (now + timedelta(days=1), now + timedelta(days=1, hours=2)),
+    }
+
+    with app.app_context():
+        init_db()
+
+        for index, (label, (start_at, end_at)) in enumerate(windows.items()):
+            db_execute(
+                """
+                INSERT INTO residents (
+                    resident_identifier, resident_code, first_name, last_name,
+                    shelter, is_active, created_at
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, NOW())
+                """,
+                (f"current_window_{label}", f"7700000{index}", label, "Pass", "abba", True),
+            )
+            resident_id = db_fetchone(
+                "SELECT id FROM residents WHERE resident_identifier = %s",
+                (f"current_window_{label}",),
+            )["id"]
+            db_execute(
+                """
+                INSERT INTO resident_passes (
+                    resident_id, shelter, pass_type, status, start_at, end_at,
+                    created_at, updated_at
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    resident_id,
+                    "abba",
+                    "pass",
+                    "approved",
+                    start_at.isoformat(),
+                    end_at.isoformat(),
+                    now.isoformat(),
+                    now.isoformat(),
+                ),
+            )
+
+        current_rows = fetch_current_pass_rows("abba")
+        open_rows = fetch_open_approved_pass_rows("abba")
+
+    assert [row["first_name"] for row in current_rows] == ["current"]
+    assert sorted(row["first_name"] for row in open_rows) == ["current", "future"]
+
+
+def test_overdue_page_lists_approved_pass_after_its_window(app, client):
+    from datetime import UTC, datetime, timedelta
+
+    from core.db import db_execute, db_fetchone
+    from core.runtime import init_db
+
+    now = datetime.now(UTC).replace(tzinfo=None, microsecond=0)
+    start_at = now - timedelta(days=2, hours=4)
+    end_at = now - timedelta(days=2)
+
+    with app.app_context():
+        init_db()
+
+        db_execute(
+            """
+            INSERT INTO residents (
+                resident_identifier, resident_code, first_name, last_name,
+                shelter, is_active, created_at
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, NOW())
+            """,
+            ("overdue_window_ended", "77000010", "Late", "Returner", "abba", True),
+        )
+        resident_id = db_fetchone(
+            "SELECT id FROM residents WHERE resident_identifier = %s",
+            ("overdue_window_ended",),
+        )["id"]
+        db_execute(
+            """
+            INSERT INTO resident_passes (
+                resident_id, shelter, pass_type, status, start_at, end_at,
+                created_at, updated_at
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """,
+            (
+                resident_id,
+                "abba",
+                "pass",
+                "approved",
+                start_at.isoformat(),
+                end_at.isoformat(),
+                start_at.isoformat(),
+                start_at.isoformat(),
+            ),
+        )
+        pass_id = db_fetchone(
+            "SELECT id FROM resident_passes WHERE resident_id = %s",
+            (resident_id,),
+        )["id"]
+
+    _login_staff(client)
+
+    response = client.get("/staff/passes/overdue", follow_redirects=False)
+    body = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert "No overdue pass returns." not in body
+    assert "Returner, Late" in body
+    assert f"/staff/passes/{pass_id}/check-in" in body
+
+
+def test_hydrated_pass_rows_carry_preformatted_times():
+    from routes.attendance_parts.pass_queries import _hydrate_pass_row
+
+    row = _hydrate_pass_row(
+        {
+            "pass_type": "pass",
+            "start_at": "2026-07-01T17:30:00",
+            "end_at": "2026-07-01T23:00:00",
+            "created_at": None,
+        }
+    )
+
+    assert row["start_at_fmt"] == "07/01/2026 12:30 PM"
+    assert row["expected_back_fmt"] == "07/01/2026 06:00 PM"
+    assert row["created_at_fmt"] == "—"
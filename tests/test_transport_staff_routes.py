@@ -24,36 +24,27 @@ def _login_staff(
     return csrf_token
 
 
-def test_to_chicago_handles_blank_and_invalid():
+def test_utc_bounds_for_local_day_cover_the_chicago_day():
     import routes.transport as module
 
-    assert module._to_chicago(None) is None
-    assert module._to_chicago("") is None
-    assert module._to_chicago("not-a-date") is None
-
-
-def test_to_chicago_and_local_day_handle_naive_and_aware_datetimes():
-    import routes.transport as module
-
-    naive_local = module._to_chicago("2026-04-15T12:00:00")
-    aware_local = module._to_chicago("2026-04-15T12:00:00+00:00")
-
-    assert naive_local is not None
-    assert aware_local is not None
-    assert naive_local.tzinfo is not None
-    assert aware_local.tzinfo is not None
-
-    assert module._local_day("2026-04-15T12:00:00+00:00") == "2026-04-15"
-    assert module._local_day(None) is None
-    assert module._local_day("bad-date") is None
+    assert module._utc_bounds_for_local_day("2026-04-15") == (
+        "2026-04-15T05:00:00",
+        "2026-04-16T05:00:00",
+    )
+    assert module._utc_bounds_for_local_day("2026-03-08") == (
+        "2026-03-08T06:00:00",
+        "2026-03-09T05:00:00",
+    )
+    assert module._utc_bounds_for_local_day("bad-date") is None
 
 
-def test_row_value_prefers_dict_and_falls_back_by_index():
-    import routes.transport as module
+def _fake_day_fetchall(rows):
+    def _fetchall(sql, params):
+        assert "needed_at >=" in sql
+        start, end = params[-2:]
+        return [row for row in rows if start <= row["needed_at"] < end]
 
-    assert module._row_value({"needed_at": "x"}, "needed_at", 5, "") == "x"
-    assert module._row_value(("a", "b", "c"), "ignored", 1, "") == "b"
-    assert module._row_value(("a",), "ignored", 5, "fallback") == "fallback"
+    return _fetchall
 
 
 def test_pending_requires_case_manager_or_above(client, monkeypatch):
@@ -151,7 +142,7 @@ def test_board_filters_rows_by_local_day(client, monkeypatch):
         },
     ]
 
-    monkeypatch.setattr(module, "db_fetchall", lambda sql, params: fake_rows)
+    monkeypatch.setattr(module, "db_fetchall", _fake_day_fetchall(fake_rows))
 
     response = client.get("/staff/transport/board?date=2026-04-15", follow_redirects=True)
 
@@ -217,7 +208,7 @@ def test_print_renders_filtered_rows_and_escapes_html(client, monkeypatch):
         },
     ]
 
-    monkeypatch.setattr(module, "db_fetchall", lambda sql, params: fake_rows)
+    monkeypatch.setattr(module, "db_fetchall", _fake_day_fetchall(fake_rows))
 
     response = client.get("/staff/transport/print?date=2026-04-15", follow_redirects=True)
 
@@ -302,7 +293,7 @@ def test_schedule_updates_request_logs_and_redirects(client, monkeypatch):
     assert log_calls == [("transport", 5, "abba", 42, "approve", "Transport request approved")]
 
 
-def test_cleanup_transport_requests_uses_pg_placeholder(monkeypatch):
+def test_cleanup_transport_requests_deletes_stale_rows_in_one_statement(monkeypatch):
     import routes.transport as module
 
     executed: list[tuple[str, tuple[object, ...]]] = []
@@ -313,60 +304,12 @@ def test_cleanup_transport_requests_uses_pg_placeholder(monkeypatch):
         lambda sql, params: executed.append((sql, params)),
     )
 
-    class _FakeG:
-        def get(self, key, default=None):
-            if key == "db_kind":
-                return "pg"
-            return default
-
-    monkeypatch.setattr(module, "g", _FakeG())
-
     module._cleanup_transport_requests("abba")
 
-    assert len(executed) == 2
-    first_sql, first_params = executed[0]
-    second_sql, second_params = executed[1]
-
-    assert "%s" in first_sql
-    assert "%s" in second_sql
-    assert first_params[0] == "abba"
-    assert first_params[1] == "pending"
-    assert first_params[2]
-    assert second_params[0] == "abba"
-    assert second_params[1] == "scheduled"
-    assert second_params[2]
-
-
-def test_cleanup_transport_requests_uses_sqlite_placeholder(monkeypatch):
-    import routes.transport as module
-
-    executed: list[tuple[str, tuple[object, ...]]] = []
-
-    monkeypatch.setattr(
-        module,
-        "db_execute",
-        lambda sql, params: executed.append((sql, params)),
-    )
-
-    class _FakeG:
-        def get(self, key, default=None):
-            if key == "db_kind":
-                return "sqlite"
-            return default
-
-    monkeypatch.setattr(module, "g", _FakeG())
-
-    module._cleanup_transport_requests("abba")
+    assert len(executed) == 1
+    sql, params = executed[0]
 
-    assert len(executed) == 2
-    first_sql, first_params = executed[0]
-    second_sql, second_params = executed[1]
-
-    assert "?" in first_sql
-    assert "?" in second_sql
-    assert first_params[0] == "abba"
-    assert first_params[1] == "pending"
-    assert first_params[2]
-    assert second_params[0] == "abba"
-    assert second_params[1] == "scheduled"
-    assert second_params[2]
+    assert "DELETE FROM transport_requests" in sql
+    assert "%s" in sql
+    assert params[:3] == ("abba", "pending", "scheduled")
+    assert params[3]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+
+def test_ttl_cache_loads_once_until_expired(monkeypatch):
+    import core.ttl_cache as ttl_cache_module
+    from core.ttl_cache import TTLCache
+
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache_module.time, "monotonic", lambda: now[0])
+
+    cache = TTLCache(ttl_seconds=30.0)
+    loads: list[int] = []
+
+    def _loader():
+        loads.append(1)
+        return ["row"]
+
+    assert cache.get_or_load("users", _loader) == ["row"]
+    assert cache.get_or_load("users", _loader) == ["row"]
+    assert len(loads) == 1
+
+    now[0] += 31.0
+
+    cache.get_or_load("users", _loader)
+    assert len(loads) == 2
+
+
+def test_ttl_cache_evicts_oldest_entry_and_clears():
+    from core.ttl_cache import TTLCache
+
+    cache = TTLCache(ttl_seconds=30.0, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == 3
+
+    cache.clear()
+    assert cache.get("b") is None